@@ -1,4 +1,6 @@
 from .image import replace_image
+from .cache import ImageFileCache, image_cache
+from .dedup import ImagePartStore, get_image_store, get_or_add_image_part
 from .images import replace_images
 from .style import (
     set_image_style,
@@ -8,6 +10,11 @@ from .style import (
 
 __all__ = [
     "replace_image",
+    "ImageFileCache",
+    "image_cache",
+    "ImagePartStore",
+    "get_image_store",
+    "get_or_add_image_part",
     "replace_images",
     "set_image_style",
     "extract_image_style",
@@ -0,0 +1,148 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from pptx.parts.image import Image
+
+logger = logging.getLogger(__name__)
+
+# Default byte budget of the process-wide cache (64 MiB)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ImageFileCache:
+    """
+    In-process cache of image files with a byte-size LRU budget.
+
+    Entries are keyed by (absolute path, mtime, size), so a file that changes
+    on disk is read again, and hold both the raw bytes and the parsed
+    `pptx.parts.image.Image`. Because the same Image object is handed out on
+    every hit, its lazily computed SHA-1, format and pixel size are also
+    computed only once per file.
+
+    A lookup costs a single `os.stat` on a hit. When the cached bytes exceed
+    `max_bytes`, the least recently used images are evicted; a single file
+    larger than the budget is returned but not cached.
+
+    Parameters:
+        max_bytes (int): Byte budget for the cached image data.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        """Total size in bytes of the cached image data."""
+        return self._bytes
+
+    def get(self, image_path):
+        """
+        Return the parsed image at `image_path`, reading it only on a miss.
+
+        Parameters:
+            image_path (str): Absolute or relative path to the image file.
+
+        Returns:
+            pptx.parts.image.Image: The image.
+
+        Raises:
+            FileNotFoundError: If the image file does not exist.
+        """
+        path = os.path.abspath(image_path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image file not found: {path}") from None
+        key = (path, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image
+            self.misses += 1
+
+        with open(path, "rb") as f:
+            blob = f.read()
+        image = Image.from_blob(blob, os.path.basename(path))
+
+        with self._lock:
+            if len(blob) <= self.max_bytes and key not in self._entries:
+                # Forget older versions of the same file
+                for old_key in [k for k in self._entries if k[0] == path]:
+                    self._remove(old_key)
+                self._entries[key] = image
+                self._bytes += len(blob)
+                self._evict()
+        return image
+
+    def _remove(self, key):
+        image = self._entries.pop(key)
+        self._bytes -= len(image.blob)
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+            logger.debug("Evicted image from cache: %s", key[0])
+
+    def resize(self, max_bytes):
+        """
+        Change the byte budget, evicting images if the cache is now too large.
+
+        Parameters:
+            max_bytes (int): The new byte budget.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Remove all cached images and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        Return cache counters, e.g. for scraping into a metrics system.
+
+        Returns:
+            dict: entries, bytes, max_bytes, hits, misses, evictions and
+                hit_rate (hits / lookups, 0.0 before the first lookup).
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Process-wide cache shared by replace_image / replace_images
+image_cache = ImageFileCache()
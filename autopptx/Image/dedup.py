@@ -0,0 +1,217 @@
+import os
+import re
+import logging
+import weakref
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.package import Package
+from pptx.parts.image import Image, ImagePart
+from pptx.util import lazyproperty
+
+from autopptx.Image.cache import image_cache
+
+logger = logging.getLogger(__name__)
+
+_IMAGE_PARTNAME_RE = re.compile(r"^/ppt/media/image(\d+)\.")
+
+# One store per package, dropped together with the package
+_stores = weakref.WeakKeyDictionary()
+
+# python-pptx names the image parts it adds itself through this collection,
+# created on first use. If that ever changes, every name is checked.
+_PPTX_IMAGE_PARTS = "_image_parts"
+_CAN_TELL_PPTX_IMAGES = isinstance(vars(Package).get(_PPTX_IMAGE_PARTS), lazyproperty)
+
+
+class ImagePartStore:
+    """
+    Content-addressed index of the image parts of one package.
+
+    Image parts are keyed by the SHA-1 digest of their bytes (the same digest
+    python-pptx uses), so every distinct image is stored exactly once in the
+    package no matter how many pictures show it. Unlike python-pptx's own
+    lookup, which re-walks every relationship of the package and hashes every
+    image part on each insert, the store is built once and answers lookups
+    from a dictionary.
+
+    Existing parts are only hashed when an image of the same size is looked
+    up, so images of a template that stay in its archive until saved (see
+    `open_presentation`) are not read just to index them.
+
+    New parts are numbered after the highest image partname of the package
+    when the store was created. As long as python-pptx has not added images
+    by itself (e.g. with `shapes.add_picture`), naming a part costs nothing;
+    once it has, every new name is checked against the parts of the package.
+
+    Parameters:
+        package (pptx.package.Package): The package whose images are indexed.
+    """
+
+    def __init__(self, package):
+        self._package = package
+        self._parts = {}
+        self._unhashed = {}
+        self._max_idx = 0
+
+        for part in package.iter_parts():
+            self._track_partname(part.partname)
+            # Skip non-slide images such as the docProps thumbnail
+            if not isinstance(part, ImagePart) or not part.partname.startswith("/ppt/media/"):
+                continue
+            self._unhashed.setdefault(_blob_size(part), []).append(part)
+
+    def __len__(self):
+        self._hash_all()
+        return len(self._parts)
+
+    def __contains__(self, sha1):
+        self._hash_all()
+        return sha1 in self._parts
+
+    def _hash(self, size):
+        """Index the existing parts of one blob size by their digest."""
+        for part in self._unhashed.pop(size, ()):
+            self._parts.setdefault(part.sha1, part)
+
+    def _hash_all(self):
+        for size in list(self._unhashed):
+            self._hash(size)
+
+    def _track_partname(self, partname):
+        match = _IMAGE_PARTNAME_RE.match(partname)
+        if match:
+            self._max_idx = max(self._max_idx, int(match.group(1)))
+
+    def _next_partname(self, ext):
+        """
+        Return an image partname that no part of the package uses.
+
+        Names of parts that became unreachable are never reused, since the
+        store may still hand those parts out again. Names python-pptx gave
+        to images it added itself are read from the package.
+        """
+        if not _CAN_TELL_PPTX_IMAGES or _PPTX_IMAGE_PARTS in vars(self._package):
+            for part in self._package.iter_parts():
+                self._track_partname(part.partname)
+        self._max_idx += 1
+        return PackURI(f"/ppt/media/image{self._max_idx}.{ext}")
+
+    def get_or_add(self, image):
+        """
+        Return the image part holding `image`, creating it if needed.
+
+        Parameters:
+            image (pptx.parts.image.Image): The image to store.
+
+        Returns:
+            ImagePart: The single part holding these image bytes.
+        """
+        self._hash(len(image.blob))
+        part = self._parts.get(image.sha1)
+        if part is not None:
+            logger.debug("Reusing image part %s", part.partname)
+            return part
+
+        part = ImagePart(
+            self._next_partname(image.ext),
+            image.content_type,
+            self._package,
+            image.blob,
+            image.filename,
+        )
+        self._parts[image.sha1] = part
+        logger.debug("Added image part %s", part.partname)
+        return part
+
+
+def _blob_size(part):
+    """Return the size of a part's blob without reading a blob that is still in its archive."""
+    size = getattr(part, "blob_size", None)
+    return size if size is not None else len(part.blob)
+
+
+def get_image_store(package):
+    """
+    Return the ImagePartStore of a package, creating it on first use.
+
+    Parameters:
+        package (pptx.package.Package): The package.
+
+    Returns:
+        ImagePartStore: The package's image store.
+    """
+    store = _stores.get(package)
+    if store is None:
+        store = _stores[package] = ImagePartStore(package)
+    return store
+
+
+def load_image(image_file):
+    """
+    Return a python-pptx Image for a path, in-memory image data or an Image.
+
+    Paths are read through the process-wide image cache; bytes and binary
+    streams are used directly, without touching the filesystem.
+
+    Parameters:
+        image_file (str or bytes or file-like or pptx.parts.image.Image):
+            Image path, image content, readable binary stream or image object.
+
+    Returns:
+        pptx.parts.image.Image: The image.
+    """
+    if isinstance(image_file, Image):
+        return image_file
+    if isinstance(image_file, (bytes, bytearray, memoryview)):
+        return Image.from_blob(bytes(image_file))
+    if hasattr(image_file, "read"):
+        return Image.from_blob(image_file.read())
+    return image_cache.get(image_file)
+
+
+def describe_image(image_file):
+    """Return a short label of an image source for log messages."""
+    if isinstance(image_file, (str, os.PathLike)):
+        return os.fspath(image_file)
+    return f"<{type(image_file).__name__}>"
+
+
+def get_or_add_image_part(part, image_file):
+    """
+    Relate a part (usually a slide) to the deduplicated part of an image.
+
+    Parameters:
+        part (pptx.opc.package.XmlPart): The part that shows the image.
+        image_file (str or bytes or file-like or pptx.parts.image.Image):
+            Image source, see `load_image`.
+
+    Returns:
+        tuple: (ImagePart, rId) where rId relates `part` to the image part.
+            An existing relationship to the same image part is reused.
+    """
+    image = load_image(image_file)
+    image_part = get_image_store(part.package).get_or_add(image)
+    rId = part.relate_to(image_part, RT.IMAGE)
+    return image_part, rId
+
+
+def drop_rel_if_unused(part, rId):
+    """
+    Remove the relationship `rId` from `part` if its XML no longer refers to it.
+
+    python-pptx's own `drop_rel` only counts `r:id` attributes, whereas
+    pictures refer to their image through `r:embed`; all three relationship
+    attributes are checked here.
+
+    Parameters:
+        part (pptx.opc.package.XmlPart): The part owning the relationship.
+        rId (str): The relationship id.
+
+    Returns:
+        bool: True if the relationship was removed.
+    """
+    refs = part._element.xpath("//@r:id | //@r:embed | //@r:link")
+    if rId in refs:
+        return False
+    part.rels.pop(rId)
+    return True
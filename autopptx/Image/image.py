@@ -1,13 +1,16 @@
-import os
 import logging
 from pptx.enum.shapes import PP_PLACEHOLDER
-from pptx.parts.image import Image
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
+from pptx.oxml.shapes.picture import CT_Picture
+from pptx.shapes.placeholder import PlaceholderPicture
+
+from autopptx.Image.dedup import (
+    load_image,
+    describe_image,
+    get_or_add_image_part,
+    drop_rel_if_unused,
 )
+from autopptx.Type.modified import mark_modified
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,16 +21,27 @@ def replace_image(shape, image_path):
 
     This function handles two scenarios:
     1. If the placeholder is empty (no image yet), it inserts the new image.
-    2. If the placeholder already contains an image, it replaces the underlying
-       image data (blob override) to update the picture efficiently.
+    2. If the placeholder already contains an image, it points the picture at
+       the new image data and drops the old image if nothing else uses it.
+
+    Both paths go through the package's content-addressed image store, so an
+    image shown on many slides is stored only once in the package, and an
+    image part shared by several pictures is never overwritten in place.
 
     Parameters:
         shape (pptx.shapes.placeholder.PicturePlaceholder or None):
             The picture placeholder shape to update. If None, the function returns early.
-        image_path (str): Absolute or relative path to the new image file.
+        image_path (str or bytes or file-like): Absolute or relative path to the
+            new image file, or the image content as bytes or a binary stream.
+
+    Returns:
+        Shape: The shape now holding the picture. This is a new
+            PlaceholderPicture when an empty placeholder was filled, otherwise
+            the given shape.
 
     Raises:
         ValueError: If the provided shape is not a picture placeholder.
+        FileNotFoundError: If the image file does not exist.
 
     Logs:
         Info and error messages on success or failure of insertion or replacement.
@@ -42,17 +56,21 @@ def replace_image(shape, image_path):
     ):
         raise ValueError("The provided shape is not a picture placeholder.")
 
-    img_path = os.path.abspath(image_path)
-
-    # Check if image file exists
-    if not os.path.exists(img_path):
-        raise FileNotFoundError(f"Image file not found: {img_path}")
+    # Paths are read through the process-wide cache (one stat per call on a hit)
+    image = load_image(image_path)
+    mark_modified(shape)
 
     # Case 1: Placeholder without an image (no blip_rId yet)
     if not hasattr(shape._element, "blip_rId"):
         try:
-            shape.insert_picture(img_path)
-            logger.info("✅ Inserted image into empty placeholder: %s", img_path)
+            image_part, rId = get_or_add_image_part(shape.part, image)
+            pic = CT_Picture.new_ph_pic(shape.shape_id, shape.name, image_part.desc, rId)
+            pic.crop_to_fit(image_part._px_size, (shape.width, shape.height))
+            shape._replace_placeholder_with(pic)
+            logger.debug(
+                "✅ Inserted image into empty placeholder: %s", describe_image(image_path)
+            )
+            return PlaceholderPicture(pic, shape._parent)
         except Exception as e:
             logger.error(
                 "❌ Failed to insert image into placeholder %d: %s",
@@ -60,21 +78,24 @@ def replace_image(shape, image_path):
                 e,
             )
             raise
-    # Case 2: Placeholder with existing image (replace blob content)
+    # Case 2: Placeholder with existing image (relink to deduplicated part)
     else:
         try:
             slide_part = shape.part
-            blip_rId = shape._element.blip_rId
-            img_part = slide_part.related_part(blip_rId)
-
-            new_img = Image.from_file(img_path)
-            img_part.blob = new_img._blob
-
-            logger.info(
-                "✅ Replaced image: %s -> placeholder %d",
-                img_path,
-                shape.placeholder_format.idx,
-            )
+            old_rId = shape._element.blip_rId
+            _, rId = get_or_add_image_part(slide_part, image)
+
+            if rId != old_rId:
+                shape._element.blipFill.blip.rEmbed = rId
+                drop_rel_if_unused(slide_part, old_rId)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "✅ Replaced image: %s -> placeholder %d",
+                    describe_image(image_path),
+                    shape.placeholder_format.idx,
+                )
+            return shape
         except Exception as e:
             logger.error(
                 "❌ Failed to replace image in placeholder %d: %s",
@@ -85,6 +106,11 @@ def replace_image(shape, image_path):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     from pptx import Presentation
 
     prs = Presentation("./data/template.pptx")
@@ -1,31 +1,29 @@
-import os
 import logging
 
 from autopptx.Type.find import find_placeholders
 from autopptx.Image.image import replace_image
+from autopptx.Image.dedup import describe_image
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
-def replace_images(slide, image_path):
+def replace_images(slide, image_path, index=None):
     """
     Replace the image content of picture placeholders on the slide,
     including placeholders that don't yet contain images.
 
     Parameters:
         slide (pptx.slide.Slide): The slide object containing picture placeholders.
-        image_path (str or list[str]): Path(s) to new image(s). If a list,
+        image_path (str or bytes or list): Path(s) to new image(s), or image
+            content as bytes or binary streams. If a list,
             each image will replace one placeholder in order.
+        index (PlaceholderIndex, optional): Prebuilt placeholder index of the slide.
+            It is kept up to date when an empty placeholder is filled.
     """
     if not isinstance(image_path, list):
-        image_path = [str(image_path)]
+        image_path = [image_path]
 
-    shapes = find_placeholders(slide, "image")
+    shapes = find_placeholders(slide, "image", index=index)
     if not shapes:
         logger.warning("⚠️ Picture placeholder not found.")
         return
@@ -52,21 +50,30 @@ def replace_images(slide, image_path):
         if i >= num_images:
             break  # Prevent index out of range
 
-        img_path = os.path.abspath(image_path[i])
+        img_path = image_path[i]
         try:
-            replace_image(shape, img_path)
-            logger.info("Replaced image in placeholder %d with %s", i, img_path)
+            new_shape = replace_image(shape, img_path)
+            if index is not None:
+                index.replace(shape, new_shape)
+            logger.debug(
+                "Replaced image in placeholder %d with %s", i, describe_image(img_path)
+            )
         except Exception as e:
             logger.error(
                 "Failed to replace image in placeholder %d with %s: %s",
                 i,
-                img_path,
+                describe_image(img_path),
                 e,
             )
             raise
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     from pptx import Presentation
 
     prs = Presentation("./data/template.pptx")
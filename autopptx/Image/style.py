@@ -1,11 +1,8 @@
 import logging
 from pptx.util import Inches
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
+from autopptx.Type.modified import mark_modified
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +31,7 @@ def set_image_style(
     if not hasattr(shape, "image") or not hasattr(shape, "width"):
         raise ValueError("Shape must be a valid image or image placeholder with content.")
 
+    mark_modified(shape)
     try:
         shape.left = Inches(left)
         shape.top = Inches(top)
@@ -41,7 +39,7 @@ def set_image_style(
         shape.height = Inches(height)
         shape.rotation = rotation
 
-        logger.info("✅ Applied image style successfully.")
+        logger.debug("✅ Applied image style successfully.")
     except Exception as e:
         logger.error("❌ Failed to apply image style: %s", e)
         raise
@@ -111,6 +109,11 @@ def transfer_image_style(source_shape, target_shape):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     from pptx import Presentation
     from autopptx.Type.find import find_placeholders
 
@@ -4,6 +4,8 @@ from .table import (
     replace_table_cell,
     validate_single_table,
 )
+from .builder import build_table, fill_table
+from .frame import FormattedTable, format_table
 from .tables import replace_tables, validate_table_data
 from .style import (
     set_table_cell,
@@ -18,6 +20,10 @@ __all__ = [
     "replace_table",
     "replace_table_cell",
     "replace_tables",
+    "build_table",
+    "fill_table",
+    "FormattedTable",
+    "format_table",
     "validate_single_table",
     "validate_table_data",
     "set_table_cell",
@@ -0,0 +1,115 @@
+import re
+from copy import deepcopy
+from lxml import etree
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.text.text import TextFrame
+from pptx.util import Inches
+
+# Text that needs python-pptx's own handling: line breaks become paragraphs or
+# <a:br/>, other control characters are not valid XML and must be escaped.
+_SPECIAL_TEXT_RE = re.compile(r"[\x00-\x08\x0a-\x1f]")
+
+_A_P = qn("a:p")
+_A_R = qn("a:r")
+_A_T = qn("a:t")
+_A_TC = qn("a:tc")
+_A_TXBODY = qn("a:txBody")
+
+_TBL_XML = (
+    f'<a:tbl {nsdecls("a")}>'
+    '<a:tblPr firstRow="1" bandRow="1"/>'
+    "<a:tblGrid/>"
+    "</a:tbl>"
+)
+_TC_XML = (
+    f'<a:tc {nsdecls("a")}>'
+    "<a:txBody><a:bodyPr/><a:lstStyle/><a:p/></a:txBody>"
+    "<a:tcPr/>"
+    "</a:tc>"
+)
+
+
+def write_cell_text(tc, text):
+    """
+    Write text into a freshly created, empty table cell element.
+
+    Plain text is written as a single run directly through lxml, which escapes
+    `<`, `&` and friends. Text containing line breaks or control characters
+    falls back to python-pptx's text frame, with the same result as `cell.text`.
+
+    Parameters:
+        tc (pptx.oxml.table.CT_TableCell): The `a:tc` element to fill.
+        text: The cell value; converted with `str()`.
+    """
+    text = str(text)
+    if not text:
+        return
+
+    txBody = tc.find(_A_TXBODY)
+    if _SPECIAL_TEXT_RE.search(text):
+        TextFrame(txBody, None).text = text
+        return
+
+    r = etree.SubElement(txBody.find(_A_P), _A_R)
+    etree.SubElement(r, _A_T).text = text
+
+
+def fill_table(tbl, table_data, row_height=None):
+    """
+    Replace the rows of a table element with the given data.
+
+    The first row of `tbl` must be empty and have one cell per grid column;
+    it serves as the prototype that is deep-copied for every data row, so
+    building the table takes linear time in the number of cells. Rows shorter
+    than the grid are padded with empty cells.
+
+    Parameters:
+        tbl (pptx.oxml.table.CT_Table): The `a:tbl` element to fill.
+        table_data (iterable): Rows of cell values, e.g. a 2D list or a
+            FormattedTable.
+        row_height (int, optional): Row height in EMU. Defaults to the height
+            of the prototype row.
+    """
+    rows = tbl.tr_lst
+    prototype = rows[0]
+    for tr in rows:
+        tbl.remove(tr)
+
+    for row in table_data:
+        tr = deepcopy(prototype)
+        if row_height is not None:
+            tr.h = row_height
+        for tc, value in zip(tr.iterchildren(_A_TC), row):
+            write_cell_text(tc, value)
+        tbl.append(tr)
+
+
+def build_table(table_data, col_width=Inches(1.5), row_height=Inches(0.5), cols=None):
+    """
+    Build a complete `a:tbl` element from table data.
+
+    Parameters:
+        table_data (iterable): Rows of cell values, e.g. a 2D list.
+        col_width (int): Width of every column in EMU.
+        row_height (int): Height of every row in EMU.
+        cols (int, optional): Number of columns. Defaults to the length of
+            the longest row, which requires `table_data` to be a list.
+
+    Returns:
+        pptx.oxml.table.CT_Table: The new table element.
+    """
+    if cols is None:
+        cols = max(len(row) for row in table_data)
+
+    tbl = parse_xml(_TBL_XML)
+    for _ in range(cols):
+        tbl.tblGrid.add_gridCol(width=int(col_width))
+
+    prototype = tbl._add_tr(h=int(row_height))
+    tc = parse_xml(_TC_XML)
+    for _ in range(cols):
+        prototype.append(deepcopy(tc))
+
+    fill_table(tbl, table_data)
+    return tbl
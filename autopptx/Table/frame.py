@@ -0,0 +1,171 @@
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, install with `autopptx[dataframe]`
+    np = None
+
+
+def is_array_like(data):
+    """
+    Return True if `data` looks like a 2D NumPy array, DataFrame or FormattedTable.
+
+    Duck typing keeps NumPy and pandas optional: only objects that already
+    carry `ndim` and `shape` take the vectorized path.
+    """
+    return hasattr(data, "ndim") and hasattr(data, "shape")
+
+
+class FormattedTable:
+    """
+    Table data formatted column by column into NumPy string arrays.
+
+    Iterating yields the header row (if any) followed by one tuple per data
+    row, zipped lazily from the column arrays, so the formatted strings go
+    into the table in one pass without an intermediate list of rows.
+
+    Parameters:
+        columns (list[numpy.ndarray]): One 1D array of strings per column.
+        header (list[str], optional): Column headers, written as the first row.
+    """
+
+    ndim = 2
+
+    def __init__(self, columns, header=None):
+        self.columns = columns
+        self.header = header
+        num_rows = len(columns[0]) if columns else 0
+        self.shape = (num_rows + (header is not None), len(columns))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        if self.header is not None:
+            yield self.header
+        yield from zip(*self.columns)
+
+
+def _missing(column, values):
+    """Return a boolean mask of the missing (None/NaN/NaT/NA) entries."""
+    if hasattr(column, "isna"):
+        return column.isna().to_numpy()
+
+    kind = values.dtype.kind
+    if kind in "fc":
+        return np.isnan(values)
+    if kind in "mM":
+        return np.isnat(values)
+    if kind == "O":
+        is_missing = np.frompyfunc(lambda v: v is None or v != v, 1, 1)
+        return is_missing(values).astype(bool)
+    return np.zeros(len(values), dtype=bool)
+
+
+def _format_values(values, fmt, precision):
+    """Format a 1D array without missing entries into an array of strings."""
+    if callable(fmt):
+        return np.frompyfunc(fmt, 1, 1)(values)
+    if fmt is not None:
+        return np.char.mod(fmt, values)
+
+    kind = values.dtype.kind
+    if kind == "f" and precision is not None:
+        return np.char.mod(f"%.{precision}f", values)
+    if kind == "M":
+        return np.datetime_as_string(values, unit="auto")
+    return values.astype(str)
+
+
+def format_column(column, fmt=None, precision=None, na_rep=""):
+    """
+    Format one column of values into an array of strings.
+
+    Parameters:
+        column (numpy.ndarray or pandas.Series): The 1D column to format.
+        fmt (str or callable, optional): A printf-style format such as "%.1f%%",
+            applied with `numpy.char.mod`, or a callable applied per value.
+        precision (int, optional): Decimal places for float columns without
+            an explicit `fmt`.
+        na_rep (str): Text written for missing values.
+
+    Returns:
+        numpy.ndarray: Array of formatted strings.
+    """
+    values = column.to_numpy() if hasattr(column, "to_numpy") else np.asarray(column)
+    missing = _missing(column, values)
+
+    if not missing.any():
+        return _format_values(values, fmt, precision)
+
+    valid = ~missing
+    valid_values = values[valid]
+
+    # pandas nullable dtypes (Int64, boolean, ...) come out as float or
+    # object arrays when they hold NA; restore the real dtype for formatting
+    numpy_dtype = getattr(getattr(column, "dtype", None), "numpy_dtype", None)
+    if numpy_dtype is not None and valid_values.dtype != numpy_dtype:
+        valid_values = valid_values.astype(numpy_dtype)
+
+    out = np.full(len(values), na_rep, dtype=object)
+    out[valid] = _format_values(valid_values, fmt, precision)
+    return out
+
+
+def format_table(
+    data, header=True, index=False, formats=None, precision=None, na_rep=""
+):
+    """
+    Format a DataFrame or 2D array for insertion into a table, column by column.
+
+    Each column is formatted in a single vectorized call chosen by its dtype,
+    with missing values replaced by `na_rep`.
+
+    Parameters:
+        data (pandas.DataFrame or numpy.ndarray or FormattedTable):
+            The table data. A FormattedTable is returned unchanged.
+        header (bool or list[str]): For DataFrames, whether to write the
+            column labels as the first row. For arrays, an optional list of
+            column headers.
+        index (bool): Whether to write a DataFrame's index as the first column.
+        formats (dict, optional): Per-column `fmt` (see `format_column`),
+            keyed by column label or position.
+        precision (int, optional): Decimal places for float columns.
+        na_rep (str): Text written for missing values.
+
+    Returns:
+        FormattedTable: The formatted table.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If the data is not two-dimensional.
+    """
+    if isinstance(data, FormattedTable):
+        return data
+    if np is None:
+        raise ImportError(
+            "NumPy is required for DataFrame/array tables: pip install autopptx[dataframe]"
+        )
+    if data.ndim != 2:
+        raise ValueError("Table data must be two-dimensional.")
+
+    formats = formats or {}
+
+    if hasattr(data, "columns"):  # pandas.DataFrame
+        labels = list(data.columns)
+        columns = [data.iloc[:, j] for j in range(len(labels))]
+        header_row = [str(label) for label in labels] if header else None
+        if index:
+            columns.insert(0, data.index.to_series())
+            labels.insert(0, data.index.name)
+            if header_row is not None:
+                header_row.insert(0, "" if data.index.name is None else str(data.index.name))
+    else:
+        columns = list(np.asarray(data).T)
+        labels = list(range(len(columns)))
+        header_row = [str(h) for h in header] if isinstance(header, (list, tuple)) else None
+
+    formatted = []
+    for j, (label, column) in enumerate(zip(labels, columns)):
+        fmt = formats[label] if label in formats else formats.get(j)
+        formatted.append(format_column(column, fmt, precision, na_rep))
+
+    return FormattedTable(formatted, header_row)
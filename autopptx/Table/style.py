@@ -1,13 +1,15 @@
 import logging
+from copy import deepcopy
+from functools import lru_cache
 from pptx.dml.color import RGBColor
+from pptx.oxml.ns import qn
+from pptx.oxml.table import CT_TableCell
+from pptx.table import _Cell
 from pptx.util import Pt
 from pptx.enum.text import PP_ALIGN
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
+from autopptx.Type.modified import mark_modified
+
 logger = logging.getLogger(__name__)
 
 # Text alignment map
@@ -19,6 +21,99 @@ ALIGN_MAP = {
     "distribute": PP_ALIGN.DISTRIBUTE,
 }
 
+_A_P = qn("a:p")
+_A_R = qn("a:r")
+
+
+@lru_cache(maxsize=128)
+def _cell_style_prototype(
+    font_name, font_size, bold, italic, font_color, align, bg_color
+):
+    """
+    Build the XML a cell style produces, once per distinct style.
+
+    The style is applied through python-pptx's own setters to a scratch cell,
+    so the prototypes are exactly what `set_table_cell` used to write into
+    every cell one property at a time.
+
+    Returns:
+        tuple: (rPr, pPr, fill) elements; fill is None without a background.
+    """
+    cell = _Cell(CT_TableCell.new(), None)
+    paragraph = cell.text_frame.paragraphs[0]
+    font = paragraph.add_run().font
+    font.name = font_name
+    font.size = Pt(font_size)
+    font.bold = bold
+    font.italic = italic
+    font.color.rgb = RGBColor(*font_color)
+    paragraph.alignment = ALIGN_MAP[align]
+
+    fill = None
+    if bg_color:
+        cell.fill.solid()
+        cell.fill.fore_color.rgb = RGBColor(*bg_color)
+        fill = cell._tc.tcPr.eg_fillProperties
+
+    p = paragraph._p
+    return p.r_lst[0].rPr, p.pPr, fill
+
+
+def _stamp_cell_style(tc, prototype):
+    """
+    Apply a prepared cell style prototype to a table cell element.
+
+    Like `set_table_cell`, the first run of every paragraph is styled (a run
+    is added to empty paragraphs) and the other runs are left alone. Runs
+    without properties get a copy of the prototype; existing properties are
+    merged so attributes such as the language survive.
+    """
+    rPr_proto, pPr_proto, fill = prototype
+
+    for p in tc.get_or_add_txBody().iterchildren(_A_P):
+        r = p.find(_A_R)
+        if r is None:
+            r = p.add_r()
+
+        rPr = r.rPr
+        if rPr is None:
+            r.insert(0, deepcopy(rPr_proto))
+        else:
+            rPr.attrib.update(rPr_proto.attrib)
+            rPr._remove_eg_fillProperties()
+            rPr._insert_solidFill(deepcopy(rPr_proto.solidFill))
+            rPr.get_or_add_latin().set("typeface", rPr_proto.latin.get("typeface"))
+
+        pPr = p.pPr
+        if pPr is None:
+            p.insert(0, deepcopy(pPr_proto))
+        else:
+            pPr.set("algn", pPr_proto.get("algn"))
+
+    if fill is not None:
+        tcPr = tc.get_or_add_tcPr()
+        tcPr._remove_eg_fillProperties()
+        tcPr._insert_solidFill(deepcopy(fill))
+
+
+def _get_style_prototype(
+    font_name, font_size, bold, italic, font_color, align, bg_color
+):
+    """Validate a cell style and return its (cached) prototype."""
+    if align.lower() not in ALIGN_MAP:
+        raise ValueError(
+            f"Invalid alignment: '{align}'. Must be one of {list(ALIGN_MAP.keys())}"
+        )
+    return _cell_style_prototype(
+        font_name,
+        font_size,
+        bold,
+        italic,
+        tuple(font_color),
+        align.lower(),
+        tuple(bg_color) if bg_color else None,
+    )
+
 
 def set_table_cell(
     cell,
@@ -33,6 +128,9 @@ def set_table_cell(
     """
     Apply text and background style to a table cell.
 
+    The style's XML is built once per distinct style and copied into the
+    cell, instead of going through a separate setter for every property.
+
     Parameters:
         cell (pptx.table._Cell): Table cell
         font_name (str): Font family
@@ -46,26 +144,11 @@ def set_table_cell(
     if not hasattr(cell, "text_frame") or not cell.text_frame:
         raise ValueError("Provided cell has no text_frame, cannot style.")
 
-    if align.lower() not in ALIGN_MAP:
-        raise ValueError(
-            f"Invalid alignment: '{align}'. Must be one of {list(ALIGN_MAP.keys())}"
-        )
-
-    for paragraph in cell.text_frame.paragraphs:
-        run = paragraph.runs[0] if paragraph.runs else paragraph.add_run()
-        font = run.font
-        font.name = font_name
-        font.size = Pt(font_size)
-        font.bold = bold
-        font.italic = italic
-        font.color.rgb = RGBColor(*font_color)
-
-        if align.lower() in ALIGN_MAP:
-            paragraph.alignment = ALIGN_MAP[align.lower()]
-
-    if bg_color:
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(*bg_color)
+    prototype = _get_style_prototype(
+        font_name, font_size, bold, italic, font_color, align, bg_color
+    )
+    _stamp_cell_style(cell._tc, prototype)
+    mark_modified(cell)
 
 
 def set_table_style(
@@ -80,27 +163,24 @@ def set_table_style(
 ):
     """
     Apply style to all cells in a shape that contains a table.
+
+    The style is prepared once and stamped into every cell element directly,
+    so the cost per cell is a couple of element copies.
     """
     if not hasattr(shape, "table") or shape.table is None:
         logger.warning(f"⛔️ Shape '{shape.name}' does not contain a table. Skipping.")
         return
     
-    table = shape.table
-    logger.info("🎯 Applying table style...")
+    prototype = _get_style_prototype(
+        font_name, font_size, bold, italic, font_color, align, bg_color
+    )
+    logger.debug("🎯 Applying table style...")
+    mark_modified(shape)
 
-    for row in table.rows:
-        for cell in row.cells:
-            set_table_cell(
-                cell,
-                font_name=font_name,
-                font_size=font_size,
-                bold=bold,
-                italic=italic,
-                font_color=font_color,
-                align=align,
-                bg_color=bg_color
-            )
-    logger.info("✅ Table styling complete!")
+    for tr in shape.table._tbl.tr_lst:
+        for tc in tr.tc_lst:
+            _stamp_cell_style(tc, prototype)
+    logger.debug("✅ Table styling complete!")
 
 
 def _get_rgb_safe(color_obj):
@@ -125,6 +205,8 @@ def extract_cell_style(cell):
         logger.warning("⚠️ Empty cell, returning empty style.")
         return style
 
+    # Reading adds a run and a solid fill to the cell if it has none
+    mark_modified(cell)
     para = cell.text_frame.paragraphs[0]
     run = para.runs[0] if para.runs else para.add_run()
     font = run.font
@@ -204,23 +286,12 @@ def transfer_table_style(src_shape, dst_shape, mode="full"):
             logger.warning("⚠️ Source (0,0) cell style empty, skipping transfer.")
             return
 
-        dst_rows = len(dst_table.rows)
-        dst_cols = len(dst_table.columns)
-
-        for i in range(dst_rows):
-            for j in range(dst_cols):
-                set_table_cell(dst_table.cell(i, j), **base_style)
+        set_table_style(dst_shape, **base_style)
 
     elif mode == "full":
-        rows = min(len(src_table.rows), len(dst_table.rows))
-        cols = min(len(src_table.columns), len(dst_table.columns))
-
         logger.info("📐 Applying styles cell-by-cell.")
-        for i in range(rows):
-            for j in range(cols):
-                src_cell = src_table.cell(i, j)
-                dst_cell = dst_table.cell(i, j)
-
+        for i, (src_row, dst_row) in enumerate(zip(src_table.rows, dst_table.rows)):
+            for j, (src_cell, dst_cell) in enumerate(zip(src_row.cells, dst_row.cells)):
                 style = extract_cell_style(src_cell)
                 if style:
                     set_table_cell(dst_cell, **style)
@@ -234,6 +305,11 @@ def transfer_table_style(src_shape, dst_shape, mode="full"):
 
 
 if __name__ == '__main__':
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     from pptx import Presentation
 
     prs = Presentation("data/output_demo.pptx")
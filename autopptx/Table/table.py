@@ -1,27 +1,27 @@
 import logging
-import textwrap
 from pptx.enum.shapes import PP_PLACEHOLDER
-from pptx.oxml import parse_xml
 from pptx.util import Inches
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
+from autopptx.Table.builder import build_table, fill_table
+from autopptx.Table.frame import format_table, is_array_like
+from autopptx.Type.modified import mark_modified
+
 logger = logging.getLogger(__name__)
 
 
 def validate_single_table(table):
     """
-    Validate a single table as a non-empty 2D list with consistent row lengths.
+    Validate a single table as a non-empty 2D list with consistent row lengths,
+    or a non-empty 2D array or DataFrame.
 
     Parameters:
-        table (list[list]): Table data to validate.
+        table (list[list] or numpy.ndarray or pandas.DataFrame): Table data to validate.
 
     Returns:
         bool: True if valid, False otherwise.
     """
+    if is_array_like(table):
+        return table.ndim == 2 and all(table.shape)
     if not isinstance(table, list) or not table:
         return False
     if not all(isinstance(row, list) for row in table):
@@ -42,8 +42,12 @@ def insert_table(shape, table_data):
     Parameters:
         shape (pptx.shapes.placeholder.TablePlaceholder):
             A placeholder shape of type TABLE, currently empty.
-        table_data (list[list[str]]):
-            A 2D list representing the table content (rows × columns).
+        table_data (list[list[str]] or numpy.ndarray or pandas.DataFrame):
+            A 2D list representing the table content (rows × columns), or a
+            2D array or DataFrame, which is formatted with `format_table`.
+
+    Returns:
+        PlaceholderGraphicFrame: The new shape containing the table.
 
     Raises:
         ValueError: If the shape is not a table placeholder or data is invalid.
@@ -55,21 +59,28 @@ def insert_table(shape, table_data):
         raise ValueError("The provided shape is not a table placeholder.")
 
     if not validate_single_table(table_data):
-        raise ValueError("table_data must be a 2D list.")
+        raise ValueError("table_data must be a 2D list, array or DataFrame.")
 
-    rows = len(table_data)
-    cols = len(table_data[0])
+    if is_array_like(table_data):
+        table_data = format_table(table_data)
+        rows, cols = table_data.shape
+    else:
+        rows = len(table_data)
+        cols = len(table_data[0])
 
-    # Insert an empty table into the placeholder
-    table_shape = shape.insert_table(rows, cols)
-    table = table_shape.table
+    # Insert a one-row table sized to the placeholder and use its empty row
+    # as the prototype for every data row
+    mark_modified(shape)
+    table_shape = shape.insert_table(1, cols)
+    tbl = table_shape._element.graphic.graphicData.tbl
 
-    # Fill in cell values
-    for i in range(rows):
-        for j in range(cols):
-            table.cell(i, j).text = str(table_data[i][j])
+    # python-pptx sizes the frame to its rows; keep that for the data rows
+    row_height = tbl.tr_lst[0].h
+    fill_table(tbl, table_data)
+    table_shape.height = row_height * rows
 
-    logger.info("✅ Inserted %d×%d table into placeholder.", rows, cols)
+    logger.debug("✅ Inserted %d×%d table into placeholder.", rows, cols)
+    return table_shape
 
 
 def replace_table(shape, table_data):
@@ -79,13 +90,18 @@ def replace_table(shape, table_data):
 
     If the placeholder does not contain a table yet (blank placeholder),
     this function will insert a new one. Otherwise, it rebuilds the table
-    via XML.
+    element directly; shorter rows are padded with empty cells.
 
     Parameters:
         shape (pptx.shapes.placeholder.TablePlaceholder):
             The table placeholder shape to modify.
-        table_data (list[list[str]]):
-            A 2D list representing the table content (rows × columns).
+        table_data (list[list[str]] or numpy.ndarray or pandas.DataFrame):
+            A 2D list representing the table content (rows × columns), or a
+            2D array or DataFrame, which is formatted with `format_table`.
+
+    Returns:
+        Shape: The shape holding the table. This is a new graphic frame when
+            a blank placeholder was filled, otherwise the given shape.
 
     Raises:
         ValueError: If the shape is not a table placeholder or data is invalid.
@@ -96,66 +112,39 @@ def replace_table(shape, table_data):
     ):
         raise ValueError("The provided shape is not a table placeholder.")
 
-    if not table_data or not all(isinstance(row, list) for row in table_data):
-        raise ValueError("table_data must be a 2D list.")
+    if is_array_like(table_data):
+        if not validate_single_table(table_data):
+            raise ValueError("table_data must be a 2D list, array or DataFrame.")
+        table_data = format_table(table_data)
+    elif not table_data or not all(isinstance(row, list) for row in table_data):
+        raise ValueError("table_data must be a 2D list, array or DataFrame.")
 
     # Check if the shape already contains a table
     if not hasattr(shape, "table"):
-        insert_table(shape, table_data)
-        return
+        return insert_table(shape, table_data)
 
-    rows = len(table_data)
-    cols = max(len(row) for row in table_data)
+    if is_array_like(table_data):
+        rows, cols = table_data.shape
+    else:
+        rows = len(table_data)
+        cols = max(len(row) for row in table_data)
 
     col_width = Inches(1.5)
     row_height = Inches(0.5)
+    mark_modified(shape)
 
-    # Remove existing table structure from XML
+    # Remove existing table structure from XML. Clearing first matters for
+    # large tables: lxml detaches a removed subtree node by node, which is
+    # quadratic in its size, while clear() simply frees the nodes.
     graphic_data = shape._element.graphic.graphicData
     for child in list(graphic_data):
+        child.clear()
         graphic_data.remove(child)
 
-    # Build XML grid definition
-    grid_cols_xml = "\n".join(f'<a:gridCol w="{int(col_width)}"/>' for _ in range(cols))
-
-    # Build XML row and cell definitions
-    rows_xml = ""
-    for row in table_data:
-        row_cells = ""
-        for cell in row:
-            cell_xml = textwrap.dedent(
-                f"""
-                <a:tc>
-                  <a:txBody>
-                    <a:bodyPr/>
-                    <a:lstStyle/>
-                    <a:p><a:r><a:t>{cell}</a:t></a:r></a:p>
-                  </a:txBody>
-                  <a:tcPr/>
-                </a:tc>
-                """
-            )
-            row_cells += cell_xml
-        row_xml = f'<a:tr h="{int(row_height)}">{row_cells}</a:tr>'
-        rows_xml += row_xml
-
-    # Compose full table XML
-    tbl_xml = textwrap.dedent(
-        f"""
-        <a:tbl xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
-          <a:tblPr firstRow="1" bandRow="1"/>
-          <a:tblGrid>
-            {grid_cols_xml}
-          </a:tblGrid>
-          {rows_xml}
-        </a:tbl>
-        """
-    )
-
-    tbl_element = parse_xml(tbl_xml)
-    graphic_data.append(tbl_element)
+    graphic_data.append(build_table(table_data, col_width, row_height, cols))
 
-    logger.info("✅ Replaced table: %d rows × %d columns.", rows, cols)
+    logger.debug("✅ Replaced table: %d rows × %d columns.", rows, cols)
+    return shape
 
 
 def replace_table_cell(table_shape, row_idx, col_idx, new_text):
@@ -195,11 +184,17 @@ def replace_table_cell(table_shape, row_idx, col_idx, new_text):
 
     cell = table.cell(row_idx, col_idx)
     cell.text = new_text
+    mark_modified(table_shape)
 
-    logger.info('✅ Cell updated: row %d, column %d → "%s"', row_idx, col_idx, new_text)
+    logger.debug('✅ Cell updated: row %d, column %d → "%s"', row_idx, col_idx, new_text)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     from pptx import Presentation
 
     prs = Presentation("./data/output_demo.pptx")
@@ -2,12 +2,8 @@ import logging
 
 from autopptx.Type.find import find_placeholders
 from autopptx.Table.table import replace_table,validate_single_table
+from autopptx.Table.frame import is_array_like
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -29,7 +25,7 @@ def validate_table_data(table_data):
     return True
 
 
-def replace_tables(slide, table_list):
+def replace_tables(slide, table_list, index=None):
     """
     Replace all table placeholders in a slide using the provided list of table data.
 
@@ -38,17 +34,21 @@ def replace_tables(slide, table_list):
 
     Parameters:
         slide (pptx.slide.Slide): The slide containing table placeholders.
-        table_list (list[list[list[str]]]): A list of 2D tables (list of rows),
-            where each row is a list of strings.
+        table_list (list): A list of 2D tables. Each table is a list of rows,
+            where each row is a list of strings, or a 2D NumPy array or pandas
+            DataFrame.
+        index (PlaceholderIndex, optional): Prebuilt placeholder index of the slide.
+            It is kept up to date when a blank placeholder is filled.
 
     Notes:
         - If the number of provided tables is fewer than the number of placeholders,
           only the first few placeholders will be filled.
         - If the number of tables exceeds the number of placeholders, the extra
           tables will be ignored.
-        - Each table must be a 2D list, and each row must be a list of strings.
+        - Each table must be a 2D list, and each row must be a list of strings,
+          or a non-empty 2D array or DataFrame.
     """
-    shapes = find_placeholders(slide, "table")
+    shapes = find_placeholders(slide, "table", index=index)
     if not shapes:
         logger.warning("⚠️ No table placeholder found.")
         return
@@ -78,18 +78,22 @@ def replace_tables(slide, table_list):
             break
 
         table_data = table_list[i]
-        if not table_data or not all(isinstance(row, list) for row in table_data):
+        if not is_array_like(table_data) and (
+            not table_data or not all(isinstance(row, list) for row in table_data)
+        ):
             logger.error("❌ Invalid table format at index %d, skipped.", i)
             continue
 
         try:
-            replace_table(shape, table_data)
+            new_shape = replace_table(shape, table_data)
+            if index is not None:
+                index.replace(shape, new_shape)
             replaced += 1
         except Exception as e:
             logger.error("❌ Failed to replace table at index %d: %s", i, e)
             raise
 
-    logger.info(
+    logger.debug(
         "✅ Table placeholder replacement complete: %d / %d tables replaced.",
         replaced,
         min(num_shapes, num_tables),
@@ -97,6 +101,11 @@ def replace_tables(slide, table_list):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     from pptx import Presentation
 
     prs = Presentation("./data/template.pptx")
@@ -1,5 +1,6 @@
 from .text import replace_bodytext
 from .texts import replace_title, replace_subtitle, replace_bodytexts
+from .writer import write_paragraphs, write_text
 from .style import (
     set_paragraph_style,
     set_textbox_style,
@@ -12,6 +13,8 @@ __all__ = [
     "replace_subtitle",
     "replace_bodytexts",
     "replace_bodytext",
+    "write_paragraphs",
+    "write_text",
     "set_paragraph_style",
     "set_textbox_style",
     "extract_paragraph_style",
@@ -3,11 +3,8 @@ from pptx.util import Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
+from autopptx.Type.modified import mark_modified
+
 logger = logging.getLogger(__name__)
 
 # Text alignment mapping
@@ -44,6 +41,7 @@ def set_paragraph_style(
     if not hasattr(paragraph, "runs") or not hasattr(paragraph, "alignment"):
         raise ValueError("Input does not appear to be a paragraph object.")
     
+    mark_modified(paragraph)
     run = paragraph.runs[0] if paragraph.runs else paragraph.add_run()
     font = run.font
 
@@ -102,7 +100,7 @@ def set_textbox_style(
             align=align,
         )
     
-    logger.info("✅ Text styling complete!")
+    logger.debug("✅ Text styling complete!")
 
 
 def extract_paragraph_style(paragraph):
@@ -116,6 +114,9 @@ def extract_paragraph_style(paragraph):
     if not hasattr(paragraph, "runs") or not hasattr(paragraph, "alignment"):
         raise ValueError("Input does not appear to be a paragraph object.")
     
+    if not paragraph.runs:
+        # The font of an empty paragraph is read from a run added to it
+        mark_modified(paragraph)
     run = paragraph.runs[0] if paragraph.runs else paragraph.add_run()
     font = run.font
 
@@ -204,6 +205,11 @@ def transfer_text_style(src_shape, dst_shape, mode="full"):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     from pptx import Presentation
     from autopptx.Type.find import find_placeholders
 
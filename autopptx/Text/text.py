@@ -1,11 +1,8 @@
 import logging
 from pptx.enum.shapes import PP_PLACEHOLDER
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
+from autopptx.Text.writer import write_text
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,14 +29,14 @@ def replace_bodytext(shape, text):
         raise ValueError("The provided shape is not a body text placeholder.")
 
     try:
-        tf = shape.text_frame
-        tf.clear()
-        tf.paragraphs[0].text = text
-        logger.info(
-            "✅ Replaced text: %s -> placeholder %s",
-            text,
-            shape.placeholder_format.idx,
-        )
+        count = write_text(shape, str(text))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "✅ Replaced text (%d paragraph(s) from %s) -> placeholder %s",
+                count,
+                type(text).__name__,
+                shape.placeholder_format.idx,
+            )
     except Exception as e:
         logger.error(
             "❌ Failed to replace text in placeholder %s: %s",
@@ -50,6 +47,11 @@ def replace_bodytext(shape, text):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     from pptx import Presentation
     import sys
 
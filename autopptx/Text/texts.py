@@ -1,69 +1,81 @@
 import logging
+from collections.abc import Iterable
 
+from autopptx.Text.writer import write_text
 from autopptx.Type.find import find_placeholders
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
-def replace_title(slide, text):
+def replace_title(slide, text, index=None, style=None):
     """
     Replace the content of the title placeholder.
 
     Parameters:
         slide (pptx.slide.Slide): The slide object to operate on.
         text (str): The title text to insert.
+        index (PlaceholderIndex, optional): Prebuilt placeholder index of the slide.
+        style (dict, optional): Keyword arguments of `set_paragraph_style`,
+            stamped onto the text as it is written.
     """
-    shapes = find_placeholders(slide, "title")
+    shapes = find_placeholders(slide, "title", index=index)
     if not shapes:
         logger.warning("⚠️ Title placeholder not found.")
         return
 
-    shape = shapes[0]
-    tf = shape.text_frame
-    tf.clear()
-    tf.paragraphs[0].text = str(text)
+    write_text(shapes[0], str(text), style=style)
 
 
-def replace_subtitle(slide, text):
+def replace_subtitle(slide, text, index=None, style=None):
     """
     Replace the content of the subtitle placeholder.
 
     Parameters:
         slide (pptx.slide.Slide): The slide object to operate on.
         text (str): The subtitle text to insert.
+        index (PlaceholderIndex, optional): Prebuilt placeholder index of the slide.
+        style (dict, optional): Keyword arguments of `set_paragraph_style`,
+            stamped onto the text as it is written.
     """
-    shapes = find_placeholders(slide, "subtitle")
+    shapes = find_placeholders(slide, "subtitle", index=index)
     if not shapes:
         logger.warning("⚠️ Subtitle placeholder not found.")
         return
 
-    shape = shapes[0]
-    tf = shape.text_frame
-    tf.clear()
-    tf.paragraphs[0].text = str(text)
+    write_text(shapes[0], str(text), style=style)
 
 
-def replace_bodytexts(slide, text, distribute_to_multiple_boxes=True):
+def replace_bodytexts(
+    slide, text, distribute_to_multiple_boxes=True, index=None, style=None
+):
     """
     Replace body text content in the slide. Optionally distribute content
     across multiple placeholders.
 
+    Paragraphs are written with `write_text`, which keeps the formatting the
+    placeholder has for each paragraph level, so no restyling pass is needed.
+
     Parameters:
         slide (pptx.slide.Slide): The slide object to operate on.
-        text (list[str] or str): Paragraph content to insert.
+        text (Iterable[str] or str): Paragraph content to insert. Paragraphs
+            may also be dicts {"text": ..., "level": n}. With
+            `distribute_to_multiple_boxes=False`, an iterator is streamed
+            into the text box without being materialized.
         distribute_to_multiple_boxes (bool):
             - If True: Assign each paragraph to a separate text box.
             - If False: Insert all paragraphs into a single text box.
+        index (PlaceholderIndex, optional): Prebuilt placeholder index of the slide.
+        style (dict, optional): Keyword arguments of `set_paragraph_style`,
+            stamped onto every paragraph as it is written.
     """
-    if not isinstance(text, list):
+    if isinstance(text, dict):
+        text = [text]
+    elif isinstance(text, str) or not isinstance(text, Iterable):
         text = [str(text)]
+    elif distribute_to_multiple_boxes and not isinstance(text, list):
+        text = list(text)
 
-    shapes = find_placeholders(slide, "bodytext")
+    shapes = find_placeholders(slide, "bodytext", index=index)
     if not shapes:
         logger.warning("⚠️ Body text placeholder not found.")
         return
@@ -87,23 +99,22 @@ def replace_bodytexts(slide, text, distribute_to_multiple_boxes=True):
         for i, shape in enumerate(shapes):
             if i >= len(text):
                 break
-            tf = shape.text_frame
-            tf.clear()
-            tf.paragraphs[0].text = text[i]
+            write_text(shape, (text[i],), style=style)
     else:
         shape = shapes[0]
         if not shape.has_text_frame:
             return
-        tf = shape.text_frame
-        tf.clear()
-        for i, para in enumerate(text):
-            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-            p.text = para
+        write_text(shape, text, style=style)
 
-    logger.info("✅ Replaced texts successfully")
+    logger.debug("✅ Replaced texts successfully")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     from pptx import Presentation
 
     prs = Presentation("./data/template.pptx")
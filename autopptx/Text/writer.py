@@ -0,0 +1,263 @@
+import re
+from copy import deepcopy
+from functools import lru_cache
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.oxml.ns import qn
+from pptx.oxml.text import CT_TextBody
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.text.text import _Paragraph
+from pptx.util import Pt
+
+from autopptx.Text.style import ALIGN_MAP
+from autopptx.Type.modified import mark_modified
+
+# Line feed and vertical tab become <a:br/> between runs, as in python-pptx
+_LINE_BREAK_RE = re.compile("\n|\v")
+# Other control characters are not valid XML; python-pptx escapes them as "_xHHHH_"
+_CTRL_CHAR_RE = re.compile(r"[\x00-\x08\x0b-\x1f]")
+
+_A_P = qn("a:p")
+_A_PPR = qn("a:pPr")
+_A_R = qn("a:r")
+_A_RPR = qn("a:rPr")
+_A_T = qn("a:t")
+_A_BR = qn("a:br")
+_A_END_PARA_RPR = qn("a:endParaRPr")
+
+# Prototype key of the first paragraph, used for texts without a level
+FIRST = None
+
+
+def _escape_ctrl_char(match):
+    return "_x%04X_" % ord(match.group(0))
+
+
+def _level(pPr):
+    return int(pPr.get("lvl", 0)) if pPr is not None else 0
+
+
+def _capture(p):
+    """Return the (pPr, rPr of the first run, endParaRPr) of a paragraph."""
+    r = p.find(_A_R)
+    rPr = r.find(_A_RPR) if r is not None else None
+    return p.find(_A_PPR), rPr, p.find(_A_END_PARA_RPR)
+
+
+def paragraph_prototype(txBody):
+    """
+    Return the formatting of the first paragraph of a text body.
+
+    Parameters:
+        txBody (pptx.oxml.text.CT_TextBody): The `p:txBody` element.
+
+    Returns:
+        tuple: (pPr, rPr of the first run, endParaRPr); each element or None.
+    """
+    p = txBody.find(_A_P)
+    if p is None:
+        return None, None, None
+    return _capture(p)
+
+
+def capture_prototypes(txBody):
+    """
+    Capture the formatting of a text body once, per paragraph level.
+
+    Parameters:
+        txBody (pptx.oxml.text.CT_TextBody): The `p:txBody` element.
+
+    Returns:
+        dict: {level: (pPr, rPr, endParaRPr)} from the first paragraph of
+            each level, plus `FIRST` for the first paragraph itself.
+    """
+    prototypes = {FIRST: paragraph_prototype(txBody)}
+    for p in txBody.iterchildren(_A_P):
+        prototype = _capture(p)
+        prototypes.setdefault(_level(prototype[0]), prototype)
+    return prototypes
+
+
+def _prototype_for(prototypes, level):
+    """Return the prototype of a level, deriving it from the first paragraph if needed."""
+    prototype = prototypes.get(level)
+    if prototype is None:
+        pPr, rPr, endParaRPr = prototypes[FIRST]
+        pPr = deepcopy(pPr) if pPr is not None else OxmlElement("a:pPr")
+        if level:
+            pPr.set("lvl", str(level))
+        else:
+            pPr.attrib.pop("lvl", None)
+        prototype = prototypes[level] = (pPr, rPr, endParaRPr)
+    return prototype
+
+
+@lru_cache(maxsize=128)
+def _text_style_prototype(font_name, font_size, bold, italic, font_color, align):
+    """
+    Build the (pPr, rPr) a text style produces, once per distinct style.
+
+    The style is applied through python-pptx's own setters to a scratch
+    paragraph, so the result is what `set_paragraph_style` writes.
+    """
+    paragraph = _Paragraph(CT_TextBody.new_a_txBody().p_lst[0], None)
+    font = paragraph.add_run().font
+    font.name = font_name
+    font.size = Pt(font_size)
+    font.bold = bold
+    font.italic = italic
+    font.color.rgb = RGBColor(*font_color)
+    paragraph.alignment = ALIGN_MAP[align]
+    p = paragraph._p
+    return p.pPr, p.r_lst[0].rPr
+
+
+def text_style_prototype(
+    font_name="Arial",
+    font_size=18,
+    bold=False,
+    italic=False,
+    font_color=(0, 0, 0),
+    align="left",
+):
+    """
+    Validate a text style and return its (cached) (pPr, rPr) prototype.
+
+    The parameters and defaults are those of `set_paragraph_style`.
+
+    Raises:
+        ValueError: If `align` is not supported.
+    """
+    if align.lower() not in ALIGN_MAP:
+        raise ValueError(
+            f"Unsupported align value: '{align}'. Must be one of {list(ALIGN_MAP.keys())}"
+        )
+    return _text_style_prototype(
+        font_name, font_size, bold, italic, tuple(font_color), align.lower()
+    )
+
+
+def apply_style(prototypes, style):
+    """
+    Merge a text style into captured prototypes, once per level.
+
+    Existing run properties are kept and the style's attributes, color and
+    typeface are written over them, as `set_paragraph_style` does.
+
+    Parameters:
+        prototypes (dict): Prototypes from `capture_prototypes`.
+        style (dict): Keyword arguments of `set_paragraph_style`.
+
+    Returns:
+        dict: New prototypes with the style applied.
+    """
+    style_pPr, style_rPr = text_style_prototype(**style)
+    styled = {}
+    for level, (pPr, rPr, endParaRPr) in prototypes.items():
+        if pPr is None:
+            pPr = deepcopy(style_pPr)
+        else:
+            pPr = deepcopy(pPr)
+            pPr.set("algn", style_pPr.get("algn"))
+
+        if rPr is None:
+            rPr = deepcopy(style_rPr)
+        else:
+            rPr = deepcopy(rPr)
+            rPr.attrib.update(style_rPr.attrib)
+            rPr._remove_eg_fillProperties()
+            rPr._insert_solidFill(deepcopy(style_rPr.solidFill))
+            rPr.get_or_add_latin().set("typeface", style_rPr.latin.get("typeface"))
+        styled[level] = (pPr, rPr, endParaRPr)
+    return styled
+
+
+def _append_paragraph(txBody, text, prototype):
+    """Append one `a:p` built from a prototype to a text body."""
+    pPr, rPr, endParaRPr = prototype
+    p = etree.SubElement(txBody, _A_P)
+    if pPr is not None:
+        p.append(deepcopy(pPr))
+    for i, line in enumerate(_LINE_BREAK_RE.split(text)):
+        # Breaks go between lines; empty lines get no run
+        if i:
+            etree.SubElement(p, _A_BR)
+        if line:
+            r = etree.SubElement(p, _A_R)
+            if rPr is not None:
+                r.append(deepcopy(rPr))
+            etree.SubElement(r, _A_T).text = _CTRL_CHAR_RE.sub(_escape_ctrl_char, line)
+    if endParaRPr is not None:
+        p.append(deepcopy(endParaRPr))
+
+
+def write_paragraphs(txBody, paragraphs, prototypes=None, style=None):
+    """
+    Replace all paragraphs of a text body with the given texts.
+
+    The new `a:p` elements are built directly with lxml instead of through
+    python-pptx's text frame proxies. The formatting of the existing
+    paragraphs is captured once, per paragraph level, and copied into every
+    new paragraph and run as it is written, so no restyling pass is needed
+    afterwards. As with `_Paragraph.text`, "\\n" and "\\v" become line
+    breaks and other control characters are escaped. The caller records
+    the change of the part with `mark_modified`, as `write_text` does.
+
+    Parameters:
+        txBody (pptx.oxml.text.CT_TextBody): The `p:txBody` element to fill.
+        paragraphs (Iterable): Paragraphs, each a value converted with
+            `str()` (formatted like the first paragraph) or a dict
+            {"text": ..., "level": n} (formatted like the first paragraph
+            of that level). Consumed one at a time, so a generator can
+            stream them.
+        prototypes (dict, optional): Prototypes to use instead of capturing
+            the current ones, see `capture_prototypes`.
+        style (dict, optional): Keyword arguments of `set_paragraph_style`
+            (font_name, font_size, bold, italic, font_color, align) stamped
+            onto every paragraph and run.
+
+    Returns:
+        int: The number of paragraphs written. An empty iterable leaves one
+            empty paragraph, like `TextFrame.clear()`.
+    """
+    if prototypes is None:
+        prototypes = capture_prototypes(txBody)
+    if style:
+        prototypes = apply_style(prototypes, style)
+    else:
+        prototypes = dict(prototypes)
+    for p in txBody.findall(_A_P):
+        txBody.remove(p)
+
+    count = 0
+    for item in paragraphs:
+        if isinstance(item, dict):
+            text, level = str(item.get("text", "")), item.get("level", 0)
+            prototype = _prototype_for(prototypes, level)
+        else:
+            text, prototype = str(item), prototypes[FIRST]
+        _append_paragraph(txBody, text, prototype)
+        count += 1
+
+    if not count:
+        _append_paragraph(txBody, "", prototypes[FIRST])
+    return count
+
+
+def write_text(shape, paragraphs, style=None):
+    """
+    Replace the text of a shape with one or more paragraphs.
+
+    Parameters:
+        shape (pptx.shapes.autoshape.Shape): A shape with a text frame.
+        paragraphs (str or Iterable): A single text, or paragraphs as
+            accepted by `write_paragraphs`.
+        style (dict, optional): Text style stamped onto the new paragraphs.
+
+    Returns:
+        int: The number of paragraphs written.
+    """
+    if isinstance(paragraphs, (str, dict)):
+        paragraphs = (paragraphs,)
+    mark_modified(shape)
+    return write_paragraphs(shape._element.get_or_add_txBody(), paragraphs, style=style)
@@ -1,4 +1,8 @@
 from .find import find_placeholders
+from .index import PlaceholderIndex, PLACEHOLDER_KINDS
+from .layout import LayoutPlaceholderMap
+from .modified import mark_modified, is_modified
+from .plan import FillPlan
 from .type import (
     is_text,
     is_title,
@@ -10,6 +14,12 @@ from .type import (
 
 __all__ = [
     "find_placeholders",
+    "PlaceholderIndex",
+    "PLACEHOLDER_KINDS",
+    "LayoutPlaceholderMap",
+    "mark_modified",
+    "is_modified",
+    "FillPlan",
     "is_text",
     "is_title",
     "is_subtitle",
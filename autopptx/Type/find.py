@@ -1,15 +1,10 @@
 import logging
 from pptx.enum.shapes import PP_PLACEHOLDER
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
-def find_placeholders(slide, placeholder_type):
+def find_placeholders(slide, placeholder_type, index=None):
     """
     Return a list of shapes matching the specified placeholder type
     in the given slide.
@@ -26,6 +21,9 @@ def find_placeholders(slide, placeholder_type):
     Parameters:
         slide (pptx.slide.Slide): The slide object to search.
         placeholder_type (str): The type of placeholder to find.
+        index (PlaceholderIndex, optional): A prebuilt index of the slide.
+            When given, the shapes are looked up in the index instead of
+            scanning the slide again.
 
     Returns:
         List[Shape]: A list of placeholder shapes matching the specified
@@ -34,6 +32,9 @@ def find_placeholders(slide, placeholder_type):
     Raises:
         ValueError: If an unsupported placeholder_type is provided.
     """
+    if index is not None:
+        return index.get(placeholder_type)
+
     shapes = []
 
     if placeholder_type == "title":
@@ -0,0 +1,155 @@
+import logging
+from pptx.enum.shapes import PP_PLACEHOLDER
+
+logger = logging.getLogger(__name__)
+
+# Placeholder kinds understood by find_placeholders and PlaceholderIndex
+PLACEHOLDER_KINDS = ("title", "subtitle", "bodytext", "image", "table")
+# Kinds filled through the shape's text frame
+_TEXT_KINDS = ("subtitle", "bodytext")
+# Placeholder type each fillable kind is classified from
+_KIND_TYPES = {
+    "subtitle": PP_PLACEHOLDER.SUBTITLE,
+    "bodytext": PP_PLACEHOLDER.BODY,
+    "image": PP_PLACEHOLDER.PICTURE,
+    "table": PP_PLACEHOLDER.TABLE,
+}
+
+
+class PlaceholderIndex:
+    """
+    One-pass index of the placeholders on a slide, bucketed by kind and idx.
+
+    `find_placeholders` walks `slide.placeholders` and re-reads every
+    placeholder's `p:ph` element each time it is called. The index reads each
+    `p:ph` element exactly once and answers the same queries from memory, so a
+    slide can be filled with a single scan.
+
+    The buckets follow the rules of `find_placeholders`:
+        - "title": the placeholder with idx 0 (same as slide.shapes.title)
+        - "subtitle": SUBTITLE placeholders with a text frame
+        - "bodytext": BODY placeholders with a text frame
+        - "image": PICTURE placeholders
+        - "table": TABLE placeholders
+
+    When a `LayoutPlaceholderMap` (or `FillPlan`) of the template is given,
+    the kind of each placeholder is looked up by idx in the slide layout's
+    (or the slide's own) slots instead of being inspected. The slot is only
+    used if the placeholder's own `p:ph` type is the one the kind comes
+    from, so a slide that overrides its layout's type is classified by its
+    own type, as `find_placeholders` does. Placeholders whose idx is not in
+    the slots fall back to inspection, and shapes without a text frame (a
+    picture or table at a text idx) never go into the text buckets.
+
+    Parameters:
+        slide (pptx.slide.Slide): The slide to index.
+        layout_map (LayoutPlaceholderMap, optional): Precomputed layout slots
+            of the template the slide comes from.
+    """
+
+    def __init__(self, slide, layout_map=None):
+        self.slide = slide
+        self._kinds = {kind: [] for kind in PLACEHOLDER_KINDS}
+        self._by_idx = {}
+
+        layout_kinds = None
+        if layout_map is not None:
+            layout_kinds = layout_map.slide_kinds(slide)
+
+        for shape in slide.placeholders:
+            ph = shape._element.ph
+            idx, ph_type = ph.idx, ph.type
+            self._by_idx[idx] = shape
+
+            if layout_kinds is not None and idx in layout_kinds:
+                kind = layout_kinds[idx]
+                if kind in _KIND_TYPES and _KIND_TYPES[kind] != ph_type:
+                    # The slide overrides the placeholder type of its layout
+                    kind = self.classify(shape, idx, ph_type)
+                elif kind == "title" or (kind in _TEXT_KINDS and not shape.has_text_frame):
+                    kind = None
+            else:
+                kind = self.classify(shape, idx, ph_type)
+            if kind is not None:
+                self._kinds[kind].append(shape)
+            if idx == 0 and not self._kinds["title"]:
+                self._kinds["title"].append(shape)
+
+        logger.debug(
+            "Indexed %d placeholder(s) in slide %d", len(self._by_idx), slide.slide_id
+        )
+
+    @staticmethod
+    def classify(shape, idx, ph_type):
+        """
+        Return the fill kind of a placeholder, or None if it is not fillable.
+
+        Title placeholders are matched by idx rather than by type, so they are
+        not classified here.
+
+        Parameters:
+            shape (Shape): The placeholder shape.
+            idx (int): The placeholder idx.
+            ph_type (PP_PLACEHOLDER): The placeholder type.
+
+        Returns:
+            str or None: "subtitle", "bodytext", "image", "table" or None.
+        """
+        if ph_type == PP_PLACEHOLDER.SUBTITLE and shape.has_text_frame:
+            return "subtitle"
+        if ph_type == PP_PLACEHOLDER.BODY and shape.has_text_frame:
+            return "bodytext"
+        if ph_type == PP_PLACEHOLDER.PICTURE:
+            return "image"
+        if ph_type == PP_PLACEHOLDER.TABLE:
+            return "table"
+        return None
+
+    def get(self, placeholder_type):
+        """
+        Return the shapes of one kind, in slide order.
+
+        Parameters:
+            placeholder_type (str): One of "title", "subtitle", "bodytext",
+                "image" or "table".
+
+        Returns:
+            List[Shape]: The matching shapes (a new list each call).
+
+        Raises:
+            ValueError: If an unsupported placeholder_type is provided.
+        """
+        if placeholder_type not in self._kinds:
+            raise ValueError(f"Unsupported placeholder_type: {placeholder_type}")
+        return list(self._kinds[placeholder_type])
+
+    def by_idx(self, idx):
+        """
+        Return the placeholder with the given idx, or None if there is none.
+
+        Parameters:
+            idx (int): The placeholder idx.
+        """
+        return self._by_idx.get(idx)
+
+    def replace(self, old_shape, new_shape):
+        """
+        Swap a shape for the one that replaced it in the slide.
+
+        Inserting a picture or table into an empty placeholder replaces the
+        placeholder element with a new one. Calling this keeps the index
+        pointing at the live shape.
+
+        Parameters:
+            old_shape (Shape): The shape that was replaced.
+            new_shape (Shape): The shape now occupying its place.
+        """
+        if new_shape is None or new_shape is old_shape:
+            return
+        for shapes in self._kinds.values():
+            for i, shape in enumerate(shapes):
+                if shape is old_shape:
+                    shapes[i] = new_shape
+        for idx, shape in self._by_idx.items():
+            if shape is old_shape:
+                self._by_idx[idx] = new_shape
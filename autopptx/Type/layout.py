@@ -0,0 +1,110 @@
+import logging
+
+from autopptx.Type.index import PLACEHOLDER_KINDS, PlaceholderIndex
+
+logger = logging.getLogger(__name__)
+
+
+class LayoutPlaceholderMap:
+    """
+    Placeholder slots of every slide layout in a presentation, computed once.
+
+    Slides based on the same layout share its placeholder structure: a slide
+    placeholder inherits from the layout placeholder with the same idx. This
+    map records, for each layout, which idx holds which kind of placeholder
+    (title/subtitle/bodytext/image/table), so slides can be bucketed by a
+    dictionary lookup on idx instead of inspecting every placeholder type.
+
+    Layouts are keyed by their part name, which is stable across copies of
+    the same template, so one map can serve every slide of every deck built
+    from that template.
+
+    Parameters:
+        prs (pptx.presentation.Presentation): The template presentation.
+    """
+
+    def __init__(self, prs):
+        self._layouts = {}
+        for master in prs.slide_masters:
+            for layout in master.slide_layouts:
+                self._layouts[str(layout.part.partname)] = self._scan_layout(layout)
+
+        logger.debug("Mapped placeholders of %d slide layout(s)", len(self._layouts))
+
+    @staticmethod
+    def _scan_layout(layout):
+        """Return the {idx: kind} mapping of one layout, in layout order."""
+        kinds = {}
+        for shape in layout.placeholders:
+            ph = shape._element.ph
+            if ph.idx == 0:
+                kinds[0] = "title"
+                continue
+            # Layout placeholders are always p:sp, i.e. text-capable
+            kind = PlaceholderIndex.classify(shape, ph.idx, ph.type)
+            if kind is not None:
+                kinds[ph.idx] = kind
+        return kinds
+
+    def __len__(self):
+        return len(self._layouts)
+
+    def __contains__(self, layout):
+        return self._key(layout) in self._layouts
+
+    @staticmethod
+    def _key(layout):
+        return str(layout.part.partname)
+
+    def kinds(self, layout):
+        """
+        Return the {idx: kind} mapping of a layout.
+
+        Parameters:
+            layout (pptx.slide.SlideLayout): The slide layout.
+
+        Returns:
+            dict or None: Placeholder kind per idx, or None if the layout is
+                not part of the mapped template.
+        """
+        return self._layouts.get(self._key(layout))
+
+    def slide_kinds(self, slide):
+        """
+        Return the {idx: kind} mapping used to index a slide: its layout's.
+
+        Parameters:
+            slide (pptx.slide.Slide): A slide of the mapped template.
+
+        Returns:
+            dict or None: Placeholder kind per idx, or None if unknown.
+        """
+        return self.kinds(slide.slide_layout)
+
+    def slots(self, layout):
+        """
+        Return the ordered placeholder idx values of a layout, per kind.
+
+        Parameters:
+            layout (pptx.slide.SlideLayout): The slide layout.
+
+        Returns:
+            dict: {kind: [idx, ...]} for every supported kind, in layout order.
+        """
+        slots = {kind: [] for kind in PLACEHOLDER_KINDS}
+        for idx, kind in (self.kinds(layout) or {}).items():
+            slots[kind].append(idx)
+        return slots
+
+    def index(self, slide):
+        """
+        Build a PlaceholderIndex for a slide using this map.
+
+        Parameters:
+            slide (pptx.slide.Slide): A slide of a presentation built from the
+                mapped template.
+
+        Returns:
+            PlaceholderIndex: The slide's placeholder index.
+        """
+        return PlaceholderIndex(slide, layout_map=self)
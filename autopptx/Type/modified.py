@@ -0,0 +1,34 @@
+import weakref
+from pptx.opc.package import Part
+
+# Parts changed by the replace_* / set_* functions, dropped together with the parts
+_modified = weakref.WeakSet()
+
+
+def part_of(obj):
+    """Return the package part of a part, slide, shape, paragraph or cell, or None."""
+    if isinstance(obj, Part):
+        return obj
+    return getattr(obj, "part", None)
+
+
+def mark_modified(obj):
+    """
+    Record that the XML of a part was changed.
+
+    The replace_* and set_* functions call this for the part they edit. On
+    save, a marked part is written out without first being compared with
+    the template archive, see `source_members`. Marking is optional: parts
+    that are not marked are compared, so no edit is ever lost.
+
+    Parameters:
+        obj: A part, or a slide, shape, paragraph or cell of that part.
+    """
+    part = part_of(obj)
+    if part is not None:
+        _modified.add(part)
+
+
+def is_modified(part):
+    """Return True if the part was marked with `mark_modified`."""
+    return part in _modified
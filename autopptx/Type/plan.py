@@ -0,0 +1,147 @@
+import os
+import json
+import logging
+
+from autopptx.Type.index import PlaceholderIndex
+from autopptx.Type.layout import LayoutPlaceholderMap
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the serialized plan format changes
+PLAN_VERSION = 2
+
+
+def _compile_slot(shape):
+    """Return the plan slot of one slide placeholder."""
+    ph = shape._element.ph
+    idx = ph.idx
+    kind = "title" if idx == 0 else PlaceholderIndex.classify(shape, idx, ph.type)
+    return {"idx": idx, "kind": kind, "name": shape.name}
+
+
+class FillPlan(LayoutPlaceholderMap):
+    """
+    Fill plan of a template: every slot of every slide, decided once.
+
+    Compiling a template records, per slide, each placeholder's idx, fill
+    kind and name. The plan is plain JSON data, so it can be written to disk
+    and loaded by worker processes instead of inspecting the template again.
+
+    A plan is a drop-in replacement for a `LayoutPlaceholderMap`: indexing a
+    slide looks up the slide's own slots, so no placeholder is classified at
+    fill time. Slides that are not in the plan fall back to their layout's
+    slots, which the plan also carries.
+
+    Parameters:
+        slides (list[dict]): Per-slide entries with "part", "layout" and "slots".
+        layouts (dict): {layout part name: {idx: kind}}.
+        template (str, optional): Digest of the template the plan was compiled from.
+    """
+
+    def __init__(self, slides, layouts, template=None):
+        self.slides = slides
+        self.template = template
+        self._layouts = layouts
+        self._by_part = {
+            slide["part"]: {slot["idx"]: slot["kind"] for slot in slide["slots"]}
+            for slide in slides
+        }
+
+    @classmethod
+    def compile(cls, prs, template=None):
+        """
+        Inspect a template once and return its fill plan.
+
+        Parameters:
+            prs (pptx.presentation.Presentation): The template presentation.
+            template (str, optional): Digest of the template, stored in the plan.
+
+        Returns:
+            FillPlan: The compiled plan.
+        """
+        layouts = LayoutPlaceholderMap(prs)._layouts
+        slides = []
+        for slide in prs.slides:
+            slides.append(
+                {
+                    "part": str(slide.part.partname),
+                    "layout": str(slide.slide_layout.part.partname),
+                    "slots": [_compile_slot(shape) for shape in slide.placeholders],
+                }
+            )
+
+        logger.debug("Compiled fill plan of %d slide(s)", len(slides))
+        return cls(slides, layouts, template=template)
+
+    def slide_kinds(self, slide):
+        """
+        Return the {idx: kind} mapping of a slide from its compiled slots.
+
+        Parameters:
+            slide (pptx.slide.Slide): A slide of a deck built from the template.
+
+        Returns:
+            dict or None: Placeholder kind per idx (None for unfillable ones).
+        """
+        kinds = self._by_part.get(str(slide.part.partname))
+        if kinds is None:
+            return self.kinds(slide.slide_layout)
+        return kinds
+
+    def slide_slots(self, slide_no):
+        """
+        Return the compiled slots of a slide, in slide order.
+
+        Parameters:
+            slide_no (int): Zero-based slide number.
+
+        Returns:
+            list[dict]: Slots with idx, kind and name.
+        """
+        return self.slides[slide_no]["slots"]
+
+    def to_dict(self):
+        """Return the plan as JSON-serializable data."""
+        return {
+            "version": PLAN_VERSION,
+            "template": self.template,
+            "layouts": {
+                part: {str(idx): kind for idx, kind in kinds.items()}
+                for part, kinds in self._layouts.items()
+            },
+            "slides": self.slides,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a plan from `to_dict` data.
+
+        Raises:
+            ValueError: If the data is of another plan format version.
+        """
+        if data.get("version") != PLAN_VERSION:
+            raise ValueError(f"Unsupported fill plan version: {data.get('version')}")
+        layouts = {
+            part: {int(idx): kind for idx, kind in kinds.items()}
+            for part, kinds in data["layouts"].items()
+        }
+        return cls(data["slides"], layouts, template=data.get("template"))
+
+    def dump(self, path):
+        """
+        Write the plan to a JSON file.
+
+        The file is written next to its final name and then renamed, so
+        processes reading the same plan never see a partial file.
+        """
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a plan written by `dump`."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
@@ -1,11 +1,6 @@
 import logging
 from pptx.enum.shapes import PP_PLACEHOLDER
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -93,6 +88,11 @@ def is_table(shape):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     from pptx import Presentation
 
     prs = Presentation("./data/output_demo.pptx")
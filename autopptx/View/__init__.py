@@ -3,11 +3,24 @@ from .view import (
     get_table,
     get_image,
     view_slide,
+    classify_shape,
+    get_image_handle,
+    ImageHandle,
 )
+from .bulk import view_presentation, view_many, write_ndjson
+from .scan import scan_presentation, scan_placeholders
 
 __all__ = [
     "get_text",
     "get_table",
     "get_image",
     "view_slide",
+    "classify_shape",
+    "get_image_handle",
+    "ImageHandle",
+    "view_presentation",
+    "view_many",
+    "write_ndjson",
+    "scan_presentation",
+    "scan_placeholders",
 ]
\ No newline at end of file
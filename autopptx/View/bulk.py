@@ -0,0 +1,207 @@
+"""
+Bulk extraction of generated decks for QA.
+
+    python -m autopptx.View.bulk decks/*.pptx --workers 8 --output qa.ndjson
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pptx import Presentation
+
+from autopptx.View.scan import scan_presentation
+from autopptx.View.view import ImageHandle, _table_rows, classify_shape
+
+logger = logging.getLogger(__name__)
+
+
+def view_shape(shape, index, image_dir=None):
+    """
+    Return the record of one shape: {"index", "type", "content"}.
+
+    Unlike `view_slide`, empty table and picture placeholders give None
+    content instead of raising, and images are only written to disk when
+    `image_dir` is given (under their content hash, so each is stored once).
+    """
+    kind = classify_shape(shape)
+    content = None
+    if kind == "table":
+        if shape.has_table:
+            content = _table_rows(shape)
+    elif kind == "image":
+        if hasattr(shape, "image"):
+            handle = ImageHandle(shape.image)
+            content = handle.to_dict() if image_dir is None else handle.save(image_dir)
+    elif kind is not None:
+        content = shape.text.strip()
+    else:
+        kind = str(shape.shape_type)
+        logger.debug("Unsupported shape type at index %d: %s", index, kind)
+    return {"index": index, "type": kind, "content": content}
+
+
+def view_presentation(source, image_dir=None):
+    """
+    Extract the content of every slide of a deck, one slide at a time.
+
+    Parameters:
+        source (str or file-like): Path to the PPTX file, or a binary stream.
+        image_dir (str, optional): Directory to write images to. If None,
+            image content is {"sha1", "ext", "size"} and nothing is written.
+
+    Yields:
+        dict: {"slide": zero-based number, "shapes": [shape records]}.
+    """
+    prs = Presentation(source)
+    for number, slide in enumerate(prs.slides):
+        yield {
+            "slide": number,
+            "shapes": [
+                view_shape(shape, idx, image_dir) for idx, shape in enumerate(slide.shapes)
+            ],
+        }
+
+
+def view_deck(path, image_dir=None, scan=False):
+    """
+    Extract a whole deck into one record; never raises.
+
+    This runs inside the worker processes of `view_many`. With `scan`, the
+    deck is read by `scan_presentation` instead of python-pptx.
+
+    Returns:
+        dict: {"path", "slides", "error", "elapsed"}; "slides" is None and
+            "error" holds the message when the deck could not be read.
+    """
+    start = time.perf_counter()
+    record = {"path": path, "slides": None, "error": None}
+    try:
+        if scan:
+            record["slides"] = list(scan_presentation(path))
+        else:
+            record["slides"] = list(view_presentation(path, image_dir))
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["elapsed"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def view_many(paths, workers=None, image_dir=None, scan=False):
+    """
+    Extract many decks across a process pool, yielding records as they complete.
+
+    Paths are pulled from `paths` lazily and at most `workers * 4` decks are
+    in flight, so an archive of any size is streamed rather than collected.
+
+    Parameters:
+        paths (Iterable[str]): Paths of the PPTX files.
+        workers (int): Number of worker processes. Defaults to the CPU count.
+            With 1, decks are read in this process without a pool.
+        image_dir (str, optional): Directory to write images to, see
+            `view_presentation`.
+        scan (bool): Read the decks with the read-only `scan_presentation`
+            fast path; images are then never read nor written.
+
+    Yields:
+        dict: One `view_deck` record per deck, in completion order.
+
+    Raises:
+        ValueError: If both `scan` and `image_dir` are given.
+    """
+    if scan and image_dir is not None:
+        raise ValueError("Images cannot be extracted in scan mode.")
+    return _view_many(paths, workers or os.cpu_count() or 1, image_dir, scan)
+
+
+def _view_many(paths, workers, image_dir, scan):
+    if workers == 1:
+        for path in paths:
+            yield view_deck(path, image_dir, scan)
+        return
+
+    max_pending = workers * 4
+    pending = {}
+
+    def collect(done):
+        for future in done:
+            path = pending.pop(future)
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker itself died (e.g. BrokenProcessPool)
+                yield {
+                    "path": path,
+                    "slides": None,
+                    "error": f"{type(e).__name__}: {e}",
+                    "elapsed": 0.0,
+                }
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for path in paths:
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from collect(done)
+            pending[executor.submit(view_deck, path, image_dir, scan)] = path
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from collect(done)
+
+
+def write_ndjson(records, stream):
+    """
+    Write records as NDJSON (one JSON object per line) as they arrive.
+
+    Parameters:
+        records (Iterable[dict]): e.g. the output of `view_many`.
+        stream (file-like): Text stream to write to.
+
+    Returns:
+        int: The number of records written.
+    """
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AutoPPTX bulk deck extraction (NDJSON)")
+    parser.add_argument("decks", nargs="+", help="PPTX files, or directories searched for them")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--images", type=str, default=None, help="Write extracted images to this directory")
+    parser.add_argument("--output", type=str, default=None, help="NDJSON output file (default: stdout)")
+    parser.add_argument("--scan", action="store_true", help="Use the read-only XML scanner (faster, no images)")
+    args = parser.parse_args(argv)
+    if args.scan and args.images:
+        parser.error("--images cannot be used with --scan")
+
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+    def iter_paths():
+        for entry in args.decks:
+            if not os.path.isdir(entry):
+                yield entry
+                continue
+            for root, _, files in os.walk(entry):
+                for name in sorted(files):
+                    if name.lower().endswith(".pptx"):
+                        yield os.path.join(root, name)
+
+    records = view_many(iter_paths(), workers=args.workers, image_dir=args.images, scan=args.scan)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            count = write_ndjson(records, f)
+    else:
+        count = write_ndjson(records, sys.stdout)
+    logger.info("✅ Extracted %d deck(s)", count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,139 @@
 import logging
 import os
-import uuid
 from pptx import Presentation
+from pptx.enum.shapes import PP_PLACEHOLDER
 
-from autopptx.Type.type import (
-    is_text, is_title, is_subtitle, is_bodytext,
-    is_image, is_table
-)
+from autopptx.Type.type import is_text, is_image, is_table
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
 logger = logging.getLogger(__name__)
 
+# Where extracted images are written by default
+DEFAULT_IMAGE_DIR = "data/extracted_images"
+
+# Placeholder types that decide the kind of a shape on their own
+_PLACEHOLDER_KINDS = {
+    PP_PLACEHOLDER.TABLE: "table",
+    PP_PLACEHOLDER.PICTURE: "image",
+}
+# Kinds of text-capable shapes by placeholder type; any other text shape is "text"
+_TEXT_KINDS = {
+    PP_PLACEHOLDER.TITLE: "title",
+    PP_PLACEHOLDER.CENTER_TITLE: "title",
+    PP_PLACEHOLDER.SUBTITLE: "subtitle",
+    PP_PLACEHOLDER.BODY: "bodytext",
+}
+
+
+def classify_shape(shape):
+    """
+    Return the view kind of a shape in a single dispatch.
+
+    The `p:ph` element is read once instead of once per `is_*` check; the
+    result is the same as the chain of checks in `view_slide` used to be.
+
+    Parameters:
+        shape (Shape): The shape to classify.
+
+    Returns:
+        str or None: "table", "image", "title", "subtitle", "bodytext",
+            "text", or None for shapes without text that are neither.
+    """
+    ph = shape._element.ph
+    ph_type = ph.type if ph is not None else None
+    kind = _PLACEHOLDER_KINDS.get(ph_type)
+    if kind is not None:
+        return kind
+    if shape.has_text_frame:
+        return _TEXT_KINDS.get(ph_type, "text")
+    return None
+
+
+def _table_rows(shape):
+    return [[cell.text.strip() for cell in row.cells] for row in shape.table.rows]
+
+
+class ImageHandle:
+    """
+    Lazy reference to the image of a picture shape.
+
+    Nothing is written to disk and the content hash is computed only when it
+    is first asked for. `save` writes the image under its content hash, so
+    an image shown on many slides or in many decks is stored once.
+
+    Parameters:
+        image (pptx.parts.image.Image): The image of the shape.
+    """
+
+    __slots__ = ("_image",)
+
+    def __init__(self, image):
+        self._image = image
+
+    @property
+    def sha1(self):
+        """SHA-1 hex digest of the image bytes."""
+        return self._image.sha1
+
+    @property
+    def ext(self):
+        """File extension, e.g. "png"."""
+        return self._image.ext or "png"
+
+    @property
+    def content_type(self):
+        """MIME type, e.g. "image/png"."""
+        return self._image.content_type
+
+    @property
+    def size(self):
+        """Size of the image in bytes."""
+        return len(self._image.blob)
+
+    @property
+    def blob(self):
+        """The image bytes."""
+        return self._image.blob
+
+    @property
+    def filename(self):
+        """Content-addressed file name: "<sha1>.<ext>"."""
+        return f"{self.sha1}.{self.ext}"
+
+    def save(self, output_dir=DEFAULT_IMAGE_DIR):
+        """
+        Write the image to `output_dir` under its content hash.
+
+        The file is not written again if it already exists. A new file is
+        written next to its final name and renamed, so concurrent extractions
+        never leave a partial file behind.
+
+        Returns:
+            str: The file path.
+        """
+        filepath = os.path.join(output_dir, self.filename)
+        if not os.path.exists(filepath):
+            os.makedirs(output_dir, exist_ok=True)
+            tmp_path = f"{filepath}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(self.blob)
+            os.replace(tmp_path, filepath)
+        return filepath
+
+    def to_dict(self):
+        """Return {"sha1", "ext", "size"} for JSON output."""
+        return {"sha1": self.sha1, "ext": self.ext, "size": self.size}
+
+    def __eq__(self, other):
+        if not isinstance(other, ImageHandle):
+            return NotImplemented
+        return self.sha1 == other.sha1
+
+    def __hash__(self):
+        return hash(self.sha1)
+
+    def __repr__(self):
+        return f"ImageHandle({self.filename}, {self.size} bytes)"
+
 
 def get_table(shape):
     """Extract all rows of text from a PPT table shape."""
@@ -22,11 +141,7 @@ def get_table(shape):
         logger.warning(f"⛔️ Shape at index unknown is not a table shape: {getattr(shape, 'shape_type', 'Unknown')}")
         return None
 
-    table_data = []
-    for row in shape.table.rows:
-        row_data = [cell.text.strip() for cell in row.cells]
-        table_data.append(row_data)
-    return table_data
+    return _table_rows(shape)
 
 
 def get_text(shape):
@@ -37,28 +152,30 @@ def get_text(shape):
     return shape.text.strip()
 
 
-def get_image(shape, output_dir="data/extracted_images"):
-    """Extract image from shape and save to local file."""
-    if not is_image(shape):
-        logger.warning(f"⛔️ Shape is not an image shape: {shape.shape_type}")
+def get_image_handle(shape):
+    """Return a lazy ImageHandle of a picture shape, or None if it has no image."""
+    if not is_image(shape) or not hasattr(shape, "image"):
         return None
+    return ImageHandle(shape.image)
 
-    os.makedirs(output_dir, exist_ok=True)
-    image = shape.image
-    ext = image.ext or "png"
-    filename = f"{uuid.uuid4().hex}.{ext}"
-    filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, "wb") as f:
-        f.write(image.blob)
+def get_image(shape, output_dir=DEFAULT_IMAGE_DIR):
+    """Extract image from shape and save it to a content-addressed local file."""
+    if not is_image(shape):
+        logger.warning(f"⛔️ Shape is not an image shape: {shape.shape_type}")
+        return None
 
-    return filepath
+    return ImageHandle(shape.image).save(output_dir)
 
 
-def view_slide(slide):
+def view_slide(slide, image_dir=None):
     """
     Extract all content (text, table, image) from a slide.
     Returns a list of dicts with index, type, content.
+
+    Image content is a lazy `ImageHandle`; nothing is written unless
+    `image_dir` is given, in which case it is the path of the image saved
+    there under its content hash.
     """
     results = []
     for idx, shape in enumerate(slide.shapes):
@@ -68,28 +185,22 @@ def view_slide(slide):
             "content": None,
         }
 
-        if is_table(shape):
-            shape_info["type"] = "table"
-            shape_info["content"] = get_table(shape)
-
-        elif is_image(shape):
-            shape_info["type"] = "image"
-            shape_info["content"] = get_image(shape)
-
-        elif is_text(shape):
-            if is_title(shape):
-                shape_info["type"] = "title"
-            elif is_subtitle(shape):
-                shape_info["type"] = "subtitle"
-            elif is_bodytext(shape):
-                shape_info["type"] = "bodytext"
-            else:
-                shape_info["type"] = "text"
-            shape_info["content"] = get_text(shape)
+        kind = classify_shape(shape)
+        shape_info["type"] = kind
+
+        if kind == "table":
+            shape_info["content"] = _table_rows(shape)
+
+        elif kind == "image":
+            handle = ImageHandle(shape.image)
+            shape_info["content"] = handle if image_dir is None else handle.save(image_dir)
+
+        elif kind is not None:
+            shape_info["content"] = shape.text.strip()
 
         else:
             shape_info["type"] = str(shape.shape_type)
-            logger.info(f"ℹ️ Unsupported shape type at index {idx}: {shape.shape_type}")
+            logger.debug("Unsupported shape type at index %d: %s", idx, shape.shape_type)
 
         results.append(shape_info)
 
@@ -97,6 +208,11 @@ def view_slide(slide):
 
 
 if __name__ == '__main__':
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     ppt_path = "data/output_demo.pptx"
     prs = Presentation(ppt_path)
 
@@ -6,11 +6,18 @@ __license__ = "MIT"
 __url__ = "https://github.com/chenzhex/AutoPPTX"
 __description__ = "Automated PowerPoint template editing toolkit based on python-pptx."
 
+import logging
+
+# Library logging: no basicConfig side effects, the application (or the CLI)
+# decides where records go.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 # ───────────────────────────────
 # Text module
 # ───────────────────────────────
 from .Text.text import replace_bodytext
 from .Text.texts import replace_title, replace_subtitle, replace_bodytexts
+from .Text.writer import write_paragraphs, write_text
 from .Text.style import (
     set_paragraph_style,
     set_textbox_style,
@@ -22,6 +29,8 @@ from .Text.style import (
 # Image module
 # ───────────────────────────────
 from .Image.image import replace_image
+from .Image.cache import ImageFileCache, image_cache
+from .Image.dedup import ImagePartStore, get_image_store, get_or_add_image_part
 from .Image.images import replace_images
 from .Image.style import (
     set_image_style,
@@ -38,6 +47,8 @@ from .Table.table import (
     replace_table_cell,
     validate_single_table,
 )
+from .Table.builder import build_table, fill_table
+from .Table.frame import FormattedTable, format_table
 from .Table.tables import replace_tables, validate_table_data
 from .Table.style import (
     set_table_cell,
@@ -51,6 +62,10 @@ from .Table.style import (
 # Type module
 # ───────────────────────────────
 from .Type.find import find_placeholders
+from .Type.index import PlaceholderIndex
+from .Type.layout import LayoutPlaceholderMap
+from .Type.modified import mark_modified
+from .Type.plan import FillPlan
 from .Type.type import (
     is_text,
     is_title,
@@ -63,7 +78,9 @@ from .Type.type import (
 # ───────────────────────────────
 # View module
 # ───────────────────────────────
-from .View.view import get_text, get_table, get_image, view_slide
+from .View.view import get_text, get_table, get_image, view_slide, ImageHandle
+from .View.bulk import view_presentation, view_many
+from .View.scan import scan_presentation
 
 # ───────────────────────────────
 # Exported API
@@ -71,6 +88,8 @@ from .View.view import get_text, get_table, get_image, view_slide
 __all__ = [
     # Text
     "replace_bodytext",
+    "write_paragraphs",
+    "write_text",
     "replace_title",
     "replace_subtitle",
     "replace_bodytexts",
@@ -80,6 +99,11 @@ __all__ = [
     "extract_textbox_style",
     # Image
     "replace_image",
+    "ImageFileCache",
+    "image_cache",
+    "ImagePartStore",
+    "get_image_store",
+    "get_or_add_image_part",
     "replace_images",
     "set_image_style",
     "extract_image_style",
@@ -90,6 +114,10 @@ __all__ = [
     "replace_table_cell",
     "validate_single_table",
     "replace_tables",
+    "build_table",
+    "fill_table",
+    "FormattedTable",
+    "format_table",
     "validate_table_data",
     "set_table_cell",
     "set_table_style",
@@ -98,6 +126,10 @@ __all__ = [
     "transfer_table_style",
     # Type
     "find_placeholders",
+    "PlaceholderIndex",
+    "LayoutPlaceholderMap",
+    "mark_modified",
+    "FillPlan",
     "is_text",
     "is_title",
     "is_subtitle",
@@ -109,4 +141,8 @@ __all__ = [
     "get_table",
     "get_image",
     "view_slide",
+    "ImageHandle",
+    "view_presentation",
+    "view_many",
+    "scan_presentation",
 ]
\ No newline at end of file
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import weakref
+
+from autopptx.Image.cache import image_cache
+from autopptx.core.cache import TemplateCache
+from autopptx.core.runner import process_presentation
+
+logger = logging.getLogger(__name__)
+
+# Template cache of the process running the render step. Thread executors
+# share it; each worker of a process pool gets its own copy.
+_template_cache = TemplateCache()
+
+# Default number of decks rendered at the same time by `render_deck`
+DEFAULT_CONCURRENCY = 4
+
+
+def _render(template_path, input_data, output_path):
+    """Render one deck; runs inside the executor."""
+    content = process_presentation(
+        template_path, input_data, output_path, template_cache=_template_cache
+    )
+    return output_path if output_path is not None else content
+
+
+def _image_paths(input_data):
+    """Return the distinct image paths referenced by the input data."""
+    paths = []
+    for slide in input_data:
+        images = slide.get("image") or []
+        for path in images if isinstance(images, list) else [images]:
+            # Only paths are prefetched; in-memory images need no I/O
+            if isinstance(path, str) and path and path not in paths:
+                paths.append(path)
+    return paths
+
+
+class DeckRenderer:
+    """
+    Render decks from asyncio code without blocking the event loop.
+
+    Template parsing, placeholder replacement and saving run in `executor`
+    (the loop's default thread pool if None). Before a deck is handed to the
+    executor, its images are read concurrently in the loop's default thread
+    pool into the process-wide image cache, so the render step only checks
+    that they are up to date. With a ProcessPoolExecutor the worker reads the
+    images itself, still off the loop.
+
+    At most `max_concurrency` decks are in flight at a time per event loop;
+    further calls wait for a slot, which applies backpressure to the callers.
+    A renderer can be used from several loops, e.g. by successive
+    `asyncio.run` calls.
+
+    Parameters:
+        max_concurrency (int): Maximum number of decks rendered concurrently.
+        executor (concurrent.futures.Executor, optional): Executor for the
+            CPU-bound render step.
+    """
+
+    def __init__(self, max_concurrency=DEFAULT_CONCURRENCY, executor=None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        # asyncio primitives are bound to the loop that first waits on them
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self):
+        """Return the concurrency limit of the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def prefetch_images(self, input_data):
+        """
+        Read the images of a deck into the image cache without blocking the loop.
+
+        Parameters:
+            input_data (list[dict]): The per-slide input data.
+        """
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(None, image_cache.get, path)
+                for path in _image_paths(input_data)
+            )
+        )
+
+    async def render(self, template_path, input_data, output_path=None):
+        """
+        Render a deck to `output_path`, or to bytes.
+
+        Parameters:
+            template_path (str or bytes): Path to the PPTX template file, or
+                its content.
+            input_data (Iterable[dict]): Dictionaries, one per slide. The data
+                is materialized into a list before rendering.
+            output_path (str or file-like, optional): Output file path or
+                writable binary stream (thread executors only). If None, the
+                deck is returned as bytes.
+
+        Returns:
+            str or file-like or bytes: The output target, or the file content
+                when `output_path` is None.
+        """
+        input_data = list(input_data)
+        async with self._semaphore():
+            await self.prefetch_images(input_data)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, _render, template_path, input_data, output_path
+            )
+
+
+_default_renderer = None
+
+
+def get_default_renderer():
+    """Return the renderer used by `render_deck`, creating it on first use."""
+    global _default_renderer
+    if _default_renderer is None:
+        _default_renderer = DeckRenderer()
+    return _default_renderer
+
+
+async def render_deck(template_path, input_data, output_path=None, renderer=None):
+    """
+    Render a deck from a coroutine: `await render_deck(template, data, out)`.
+
+    Parameters:
+        template_path (str or bytes): Path to the PPTX template file, or its content.
+        input_data (Iterable[dict]): Dictionaries, one per slide.
+        output_path (str or file-like, optional): Output target; None returns bytes.
+        renderer (DeckRenderer, optional): Renderer with its own executor and
+            concurrency limit. Defaults to a shared renderer limited to
+            `DEFAULT_CONCURRENCY` decks at a time.
+
+    Returns:
+        str or file-like or bytes: The output target, or the file content
+            when `output_path` is None.
+    """
+    renderer = renderer or get_default_renderer()
+    return await renderer.render(template_path, input_data, output_path)
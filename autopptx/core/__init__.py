@@ -1,3 +1,41 @@
-from .runner import main, process_presentation, load_input_data
+from .runner import (
+    main,
+    process_presentation,
+    load_input_data,
+    iter_input_data,
+    read_input_data,
+)
+from .cache import TemplateCache, load_fill_plan
+from .archive import open_presentation
+from .incremental import render_incremental, slide_fingerprint
+from .metrics import StageMetrics
+from .batch import (
+    validate_job,
+    load_manifest,
+    iter_manifest,
+    read_manifest,
+    render_job,
+    iter_batch,
+    run_batch,
+)
 
-__all__ = ["main", "process_presentation", "load_input_data"]
\ No newline at end of file
+__all__ = [
+    "main",
+    "process_presentation",
+    "load_input_data",
+    "iter_input_data",
+    "read_input_data",
+    "TemplateCache",
+    "load_fill_plan",
+    "open_presentation",
+    "render_incremental",
+    "slide_fingerprint",
+    "StageMetrics",
+    "validate_job",
+    "load_manifest",
+    "iter_manifest",
+    "read_manifest",
+    "render_job",
+    "iter_batch",
+    "run_batch",
+]
@@ -0,0 +1,363 @@
+import io
+import os
+import mmap
+import hashlib
+import struct
+import weakref
+import logging
+import zipfile
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.package import PartFactory, XmlPart, _PackageLoader
+from pptx.opc.packuri import PACKAGE_URI
+from pptx.opc.serialized import PackageReader, _PhysPkgReader
+from pptx.package import Package
+from pptx.util import lazyproperty
+
+from autopptx.Type.modified import is_modified
+
+logger = logging.getLogger(__name__)
+
+# Local file header of a zip member (APPNOTE 4.3.7): signature, version,
+# flags, method, time, date, CRC, sizes, then the name and extra lengths
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+class _Map(mmap.mmap):
+    """A read-only memory map zipfile can read from (`seekable` is missing before Python 3.13)."""
+
+    def seekable(self):
+        return True
+
+
+class ArchiveMember:
+    """
+    A member of a template archive, read only when asked for.
+
+    Parameters:
+        archive (MappedArchive): The archive holding the member.
+        info (zipfile.ZipInfo): The member's zip directory entry.
+    """
+
+    __slots__ = ("archive", "info")
+
+    def __init__(self, archive, info):
+        self.archive = archive
+        self.info = info
+
+    @property
+    def size(self):
+        """Uncompressed size in bytes, from the zip directory."""
+        return self.info.file_size
+
+    def read(self):
+        """Return the uncompressed bytes of the member."""
+        return self.archive.zipf.read(self.info)
+
+    def raw(self):
+        """
+        Return the compressed bytes of the member as they are in the archive.
+
+        The data follows the member's local header, whose name and extra
+        field lengths may differ from those of its directory entry.
+
+        Returns:
+            memoryview: A view on the mapped archive; nothing is copied or
+                decompressed.
+
+        Raises:
+            zipfile.BadZipFile: If no local header is found at the member's offset.
+        """
+        offset = self.info.header_offset
+        header = _LOCAL_HEADER.unpack_from(self.archive.buffer, offset)
+        if header[0] != _LOCAL_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile(f"Bad local header of member {self.info.filename!r}")
+        name_length, extra_length = header[-2:]
+        start = offset + _LOCAL_HEADER.size + name_length + extra_length
+        return self.archive.buffer[start:start + self.info.compress_size]
+
+
+class MappedArchive:
+    """
+    A PPTX zip opened through a read-only memory map.
+
+    Members are decompressed only when they are read, and their compressed
+    bytes can be copied out without being decompressed. The pages of the
+    map are shared by every process mapping the same file, so a pool of
+    workers holds one copy of a large template in memory, not one each.
+
+    Parameters:
+        source (str or bytes): Path of the PPTX file, or its content (which
+            is used in place instead of being mapped).
+    """
+
+    def __init__(self, source):
+        if isinstance(source, (str, os.PathLike)):
+            self.path = os.path.abspath(source)
+            with open(self.path, "rb") as f:
+                self._map = _Map(f.fileno(), 0, access=mmap.ACCESS_READ)
+            data = self._map
+        else:
+            self.path = None
+            self._map = None
+            data = bytes(source)
+        self.buffer = memoryview(data)
+        self.zipf = zipfile.ZipFile(io.BytesIO(data) if self._map is None else self._map)
+        self._finalizer = weakref.finalize(self, _close, self.zipf, self.buffer, self._map)
+
+    def member(self, membername):
+        """Return the `ArchiveMember` of a member name, or None if it is missing."""
+        info = self.zipf.NameToInfo.get(membername)
+        return ArchiveMember(self, info) if info is not None else None
+
+    def is_file(self, path):
+        """Return True if `path` is the file this archive maps."""
+        if self.path is None or not isinstance(path, (str, os.PathLike)):
+            return False
+        return os.path.exists(path) and os.path.samefile(self.path, path)
+
+    @property
+    def closed(self):
+        return not self._finalizer.alive
+
+    def close(self):
+        """Close the archive; members that were not read can no longer be."""
+        self._finalizer()
+
+
+def _close(zipf, buffer, mapped):
+    zipf.close()
+    buffer.release()
+    if mapped is not None:
+        mapped.close()
+
+
+class _LazyBlobMixin:
+    """
+    Blob of a binary part (image, video, font, ...) read from its archive on first use.
+
+    Assigning a new blob detaches the part from the archive.
+    """
+
+    _source = None
+    _loaded_blob = None
+
+    @property
+    def _blob(self):
+        blob = self._loaded_blob
+        if blob is None and self._source is not None:
+            blob = self._loaded_blob = self._source.read()
+        return blob
+
+    @_blob.setter
+    def _blob(self, blob):
+        self._loaded_blob = blob
+        if blob is not None:
+            self._source = None
+
+    @property
+    def blob_size(self):
+        """Size of the blob in bytes, known without reading it."""
+        if self._source is not None:
+            return self._source.size
+        return len(self._loaded_blob or b"")
+
+
+_lazy_classes = {}
+
+
+def _lazy_class(cls):
+    """Return the lazy-blob subclass of a binary part class."""
+    lazy_cls = _lazy_classes.get(cls)
+    if lazy_cls is None:
+        lazy_cls = _lazy_classes[cls] = type(f"Lazy{cls.__name__}", (_LazyBlobMixin, cls), {})
+    return lazy_cls
+
+
+def _rels_key(part):
+    """Return the relationships of a part in a comparable form."""
+    return tuple(sorted(
+        (rId, rel.reltype, rel.target_ref, rel.is_external) for rId, rel in part.rels.items()
+    ))
+
+
+def _xml_digest(part):
+    """Return the SHA-1 digest of the XML a part serializes to."""
+    return hashlib.sha1(part.blob).digest()
+
+
+def source_members(part):
+    """
+    Return the archive members an untouched part and its relationships can be copied from.
+
+    The part itself can be copied if it was loaded from an archive that is
+    still open, its relationships are those it was loaded with, and it is
+    unchanged: a binary part whose blob was never replaced, or an XML part
+    that serializes to the same XML as when it was loaded. Parts marked with
+    `mark_modified` are known to have changed and are not compared. The
+    relationships can be copied whenever they are unchanged, even if the
+    part changed.
+
+    Returns:
+        tuple: (ArchiveMember or None, ArchiveMember or None) for the part
+            and its ".rels" member.
+    """
+    loaded_rels = getattr(part, "_source_rels", None)
+    if loaded_rels is None:
+        return None, None
+    key, rels_member = loaded_rels
+    if rels_member is not None and rels_member.archive.closed:
+        return None, None
+    rels_unchanged = _rels_key(part) == key
+    source = getattr(part, "_source", None)
+    if source is None or source.archive.closed or is_modified(part) or not rels_unchanged:
+        source = None
+    elif isinstance(part, XmlPart) and _xml_digest(part) != part._source_digest:
+        source = None
+    return source, rels_member if rels_unchanged else None
+
+
+def source_member(part):
+    """
+    Return the archive member an untouched part can be copied from.
+
+    Returns:
+        ArchiveMember or None: None if the part was not loaded from an
+            archive, was modified or its blob replaced, its relationships
+            changed, or its archive is closed.
+    """
+    return source_members(part)[0]
+
+
+class _MappedPkgReader(_PhysPkgReader):
+    """Reads members from a `MappedArchive` on demand instead of all up front."""
+
+    def __init__(self, archive):
+        self._archive = archive
+
+    def __contains__(self, pack_uri):
+        return pack_uri.membername in self._archive.zipf.NameToInfo
+
+    def __getitem__(self, pack_uri):
+        if pack_uri not in self:
+            raise KeyError("no member '%s' in package" % pack_uri)
+        return self._archive.zipf.read(pack_uri.membername)
+
+
+class _MappedPackageReader(PackageReader):
+    def __init__(self, archive):
+        super().__init__(archive.path)
+        self._archive = archive
+
+    @lazyproperty
+    def _blob_reader(self):
+        return _MappedPkgReader(self._archive)
+
+
+class _MappedPackageLoader(_PackageLoader):
+    """Loads XML parts as usual and binary parts as lazy parts, remembering where each came from."""
+
+    def __init__(self, archive, package):
+        super().__init__(archive.path, package)
+        self._archive = archive
+
+    @lazyproperty
+    def _package_reader(self):
+        return _MappedPackageReader(self._archive)
+
+    @lazyproperty
+    def _parts(self):
+        content_types = self._content_types
+        package_reader = self._package_reader
+        parts = {}
+        for partname in self._xml_rels:
+            if partname == "/" or partname not in package_reader:
+                continue
+            content_type = content_types[partname]
+            cls = PartFactory._part_cls_for(content_type)
+            if issubclass(cls, XmlPart):
+                part = PartFactory(partname, content_type, self._package, package_reader[partname])
+            else:
+                part = _lazy_class(cls).load(partname, content_type, self._package, None)
+            part._source = self._archive.member(partname.membername)
+            parts[partname] = part
+        return parts
+
+
+class MappedPackage(Package):
+    """
+    A python-pptx package whose binary parts stay in a `MappedArchive` until used.
+
+    The relationships of every part and a digest of the XML of every XML
+    part are recorded as loaded, so that the parts and ".rels" members that
+    end up unchanged can be copied from the archive on save.
+    """
+
+    def __init__(self, archive):
+        super().__init__(archive.path)
+        self.archive = archive
+
+    def _load(self):
+        pkg_xml_rels, parts = _MappedPackageLoader.load(self.archive, self)
+        self._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
+        for part in parts.values():
+            rels_member = self.archive.member(part.partname.rels_uri.membername)
+            part._source_rels = (_rels_key(part), rels_member)
+            if isinstance(part, XmlPart):
+                part._source_digest = _xml_digest(part)
+        return self
+
+
+def open_presentation(source):
+    """
+    Open a presentation with its binary parts left in a memory-mapped archive.
+
+    XML parts are parsed as by `Presentation`, but images, video, audio,
+    fonts and other binary parts are only read (and decompressed) when a job
+    asks for their bytes. On save, `save_presentation` copies the parts that
+    are unchanged straight from the archive, still compressed. XML parts
+    are checked against a digest of their XML taken at load time, so any
+    edit is saved; the replace_* and set_* functions mark what they modify
+    (see `mark_modified`), which skips that check.
+
+    Parameters:
+        source (str or bytes): Path of the PPTX file (mapped) or its content.
+
+    Returns:
+        pptx.presentation.Presentation: The presentation.
+
+    Raises:
+        ValueError: If the package is not a PowerPoint presentation.
+    """
+    archive = MappedArchive(source)
+    presentation_part = MappedPackage(archive)._load().main_document_part
+    if presentation_part.content_type not in (CT.PML_PRESENTATION_MAIN, CT.PML_PRES_MACRO_MAIN):
+        archive.close()
+        raise ValueError(
+            f"file '{archive.path or '<bytes>'}' is not a PowerPoint file, "
+            f"content type is '{presentation_part.content_type}'"
+        )
+    return presentation_part.presentation
+
+
+def detach_archive(package):
+    """
+    Read every lazy part still in the archive of a package, then close it.
+
+    Needed before the mapped file itself is overwritten. XML parts are
+    written out of their parsed XML from then on.
+    """
+    archive = getattr(package, "archive", None)
+    if archive is None or archive.closed:
+        return
+    loaded = 0
+    for part in package.iter_parts():
+        if getattr(part, "_source", None) is None:
+            continue
+        if isinstance(part, XmlPart):
+            part._source = None
+        else:
+            part._blob = part._blob
+            loaded += 1
+    archive.close()
+    logger.debug("Detached %d lazy part(s) from %s", loaded, archive.path)
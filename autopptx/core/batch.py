@@ -0,0 +1,320 @@
+import os
+import json
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from autopptx.core.cache import TemplateCache, load_fill_plan
+from autopptx.core.runner import read_input_data, process_presentation
+from autopptx.core.writer import DEFAULT_COMPRESSLEVEL
+
+logger = logging.getLogger(__name__)
+
+# Per-process template cache: each worker parses a template only once
+_template_cache = TemplateCache()
+
+
+def validate_job(job, index):
+    """
+    Check that a job names an output and either an input file or inline slides.
+
+    Parameters:
+        job (dict): Job description.
+        index (int): Position of the job, used in the error message.
+
+    Raises:
+        ValueError: If the job is malformed.
+    """
+    if not isinstance(job, dict) or "output" not in job:
+        raise ValueError(f"Invalid job at index {index}: 'output' is required.")
+    if "input" not in job and "slides" not in job:
+        raise ValueError(f"Invalid job at index {index}: 'input' or 'slides' is required.")
+
+
+def load_manifest(manifest_path):
+    """
+    Load a batch manifest from a JSON file.
+
+    Expected format:
+    [
+        {"input": "path/to/deck1.json", "output": "out/deck1.pptx"},
+        {"input": "path/to/deck2.json", "output": "out/deck2.pptx",
+         "template": "path/to/other_template.pptx"},
+        {"slides": [{"title": "Inline deck"}], "output": "out/deck3.pptx"},
+        ...
+    ]
+
+    The optional "template" key overrides the batch-wide template for one job.
+    Instead of an "input" file, a job may carry its slide data inline under
+    "slides".
+
+    Parameters:
+        manifest_path (str): Path to the manifest file.
+
+    Returns:
+        list[dict]: The list of job descriptions.
+
+    Raises:
+        ValueError: If the manifest is not a list of valid jobs.
+    """
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        jobs = json.load(f)
+
+    if not isinstance(jobs, list):
+        raise ValueError("Batch manifest must be a list of jobs.")
+    for i, job in enumerate(jobs):
+        validate_job(job, i)
+    return jobs
+
+
+def iter_manifest(manifest_path):
+    """
+    Lazily read a batch manifest in JSON Lines format, one job per line.
+
+    Each line holds one job as described in `load_manifest`, typically a
+    whole deck inline:
+        {"output": "out/deck1.pptx", "slides": [{"title": "..."}, ...]}
+
+    Only the jobs currently being dispatched are held in memory.
+
+    Parameters:
+        manifest_path (str): Path to the JSONL manifest.
+
+    Yields:
+        dict: The next job description.
+
+    Raises:
+        ValueError: If a line does not hold a valid job.
+    """
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        index = 0
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            job = json.loads(line)
+            validate_job(job, index)
+            index += 1
+            yield job
+
+
+def read_manifest(manifest_path):
+    """
+    Read a batch manifest, streaming it when the file is JSON Lines.
+
+    Parameters:
+        manifest_path (str): Path to a .json manifest, or a .jsonl/.ndjson
+            manifest with one job per line.
+
+    Returns:
+        Iterable[dict]: The job descriptions.
+    """
+    if manifest_path.lower().endswith((".jsonl", ".ndjson")):
+        return iter_manifest(manifest_path)
+    return load_manifest(manifest_path)
+
+
+def render_job(
+    job, template_path=None, retries=0, compresslevel=DEFAULT_COMPRESSLEVEL, store_media=True
+):
+    """
+    Render a single batch job, retrying on failure.
+
+    This function runs inside a worker process and never raises; failures
+    are reported through the returned status record instead.
+
+    Parameters:
+        job (dict): Job description with "output", either "input" or
+            "slides", and an optional "template" key.
+        template_path (str): Template used when the job does not name one.
+        retries (int): Number of extra attempts after a failed render.
+        compresslevel (int): Deflate level of the XML parts (0-9).
+        store_media (bool): Store already-compressed media uncompressed.
+
+    Returns:
+        dict: Status record with input, output, status ("ok" or "failed"),
+            attempts, elapsed seconds and the last error message (or None).
+    """
+    template = job.get("template", template_path)
+    result = {
+        "input": job.get("input"),
+        "output": job["output"],
+        "status": "failed",
+        "attempts": 0,
+        "elapsed": 0.0,
+        "error": None,
+    }
+
+    start = time.perf_counter()
+    for attempt in range(1, retries + 2):
+        result["attempts"] = attempt
+        try:
+            if template is None:
+                raise ValueError("No template given for job.")
+            output_dir = os.path.dirname(job["output"])
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            if "slides" in job:
+                input_data = job["slides"]
+            else:
+                input_data = read_input_data(job["input"])
+            process_presentation(
+                template,
+                input_data,
+                job["output"],
+                template_cache=_template_cache,
+                compresslevel=compresslevel,
+                store_media=store_media,
+            )
+            result["status"] = "ok"
+            result["error"] = None
+            break
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+
+    result["elapsed"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def _init_worker(plan_dir, lazy_media=False):
+    """Point the worker's template cache at the shared fill plan directory."""
+    _template_cache.plan_dir = plan_dir
+    _template_cache.lazy_media = lazy_media
+
+
+def iter_batch(
+    jobs,
+    template_path=None,
+    workers=None,
+    retries=1,
+    plan_dir=None,
+    lazy_media=False,
+    compresslevel=DEFAULT_COMPRESSLEVEL,
+    store_media=True,
+):
+    """
+    Render many decks in parallel, yielding each status record as it completes.
+
+    Jobs are pulled from `jobs` lazily and submitted to at most `workers`
+    processes, with a bounded number of jobs in flight, so a streamed
+    manifest (see `iter_manifest`) is never materialized as a whole. Each job
+    is retried up to `retries` times inside its worker before being reported
+    as failed.
+
+    Parameters:
+        jobs (Iterable[dict]): Job descriptions, see `load_manifest`.
+        template_path (str): Default template for jobs without "template".
+        workers (int): Number of worker processes. Defaults to the CPU count.
+        retries (int): Number of extra attempts per failed job.
+        plan_dir (str, optional): Directory of compiled fill plans. The
+            default template's plan is compiled here before the workers
+            start, so they only read it.
+        lazy_media (bool): Memory-map templates in the workers, which then
+            share the pages of the file instead of each loading its media.
+        compresslevel (int): Deflate level of the XML parts (0-9).
+        store_media (bool): Store already-compressed media uncompressed.
+
+    Yields:
+        tuple: (job index, status record) in completion order.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 4
+    pending = {}
+
+    def collect(done):
+        for future in done:
+            index, job = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. BrokenProcessPool); no retry possible
+                result = {
+                    "input": job.get("input"),
+                    "output": job["output"],
+                    "status": "failed",
+                    "attempts": 0,
+                    "elapsed": 0.0,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            if result["status"] == "ok":
+                logger.info(
+                    "✅ Job %d done in %.2fs: %s", index, result["elapsed"], result["output"]
+                )
+            else:
+                logger.error(
+                    "❌ Job %d failed after %d attempt(s): %s",
+                    index,
+                    result["attempts"],
+                    result["error"],
+                )
+            yield index, result
+
+    if plan_dir is not None and template_path is not None:
+        load_fill_plan(template_path, plan_dir)
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(plan_dir, lazy_media)
+    ) as executor:
+        for index, job in enumerate(jobs):
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from collect(done)
+            future = executor.submit(
+                render_job, job, template_path, retries, compresslevel, store_media
+            )
+            pending[future] = (index, job)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from collect(done)
+
+
+def run_batch(
+    jobs,
+    template_path=None,
+    workers=None,
+    retries=1,
+    plan_dir=None,
+    lazy_media=False,
+    compresslevel=DEFAULT_COMPRESSLEVEL,
+    store_media=True,
+):
+    """
+    Render many decks in parallel across a process pool.
+
+    This is the collecting counterpart of `iter_batch`.
+
+    Parameters:
+        jobs (Iterable[dict]): Job descriptions, see `load_manifest`.
+        template_path (str): Default template for jobs without "template".
+        workers (int): Number of worker processes. Defaults to the CPU count.
+        retries (int): Number of extra attempts per failed job.
+        plan_dir (str, optional): Directory of compiled fill plans.
+        lazy_media (bool): Memory-map templates in the workers.
+        compresslevel (int): Deflate level of the XML parts (0-9).
+        store_media (bool): Store already-compressed media uncompressed.
+
+    Returns:
+        list[dict]: One status record per job, in manifest order.
+    """
+    results = dict(
+        iter_batch(
+            jobs,
+            template_path,
+            workers=workers,
+            retries=retries,
+            plan_dir=plan_dir,
+            lazy_media=lazy_media,
+            compresslevel=compresslevel,
+            store_media=store_media,
+        )
+    )
+    ordered = [results[i] for i in sorted(results)]
+    failed = sum(1 for r in ordered if r["status"] != "ok")
+    logger.info(
+        "📦 Batch complete: %d / %d decks rendered, %d failed.",
+        len(ordered) - failed,
+        len(ordered),
+        failed,
+    )
+    return ordered
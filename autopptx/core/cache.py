@@ -0,0 +1,289 @@
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from pptx import Presentation
+from pptx.opc.package import XmlPart, _Relationship
+from pptx.util import lazyproperty
+
+from autopptx.Type.layout import LayoutPlaceholderMap
+from autopptx.Type.plan import FillPlan
+from autopptx.core.archive import open_presentation
+from autopptx.core.streams import open_source, read_source, source_digest
+
+logger = logging.getLogger(__name__)
+
+
+def load_fill_plan(template_path, plan_dir, prs=None):
+    """
+    Return the fill plan of a template, compiling it only if it is not on disk.
+
+    Plans are stored in `plan_dir` as "<template SHA-1>.json", so an edited
+    template gets a new plan and every process rendering the same template
+    shares one file.
+
+    Parameters:
+        template_path (str or bytes or file-like): The PPTX template.
+        plan_dir (str): Directory of the cached plans (created if missing).
+        prs (pptx.presentation.Presentation, optional): The parsed template,
+            used when the plan has to be compiled. Compiling walks its slides,
+            so it must not be a presentation that is cloned afterwards.
+
+    Returns:
+        FillPlan: The template's fill plan.
+    """
+    template = read_source(template_path)
+    digest = source_digest(template)
+    plan_path = os.path.join(plan_dir, f"{digest}.json")
+    try:
+        return FillPlan.load(plan_path)
+    except FileNotFoundError:
+        pass
+    except ValueError as e:
+        logger.warning("⚠️ Recompiling unreadable fill plan %s: %s", plan_path, e)
+
+    if prs is None:
+        prs = Presentation(open_source(template))
+    plan = FillPlan.compile(prs, template=digest)
+    os.makedirs(plan_dir, exist_ok=True)
+    plan.dump(plan_path)
+    logger.debug("Compiled fill plan: %s", plan_path)
+    return plan
+
+
+_lazy_names = {}
+
+
+def _lazy_attributes(cls):
+    """Return the names under which python-pptx caches lazy properties (proxies, ...) of a class."""
+    names = _lazy_names.get(cls)
+    if names is None:
+        names = _lazy_names[cls] = frozenset(
+            name for klass in cls.__mro__ for name, value in vars(klass).items()
+            if isinstance(value, lazyproperty)
+        )
+    return names
+
+
+def _shallow_clone(obj, **attributes):
+    """Copy the state of a package or part, leaving out its cached lazy properties."""
+    clone = obj.__class__.__new__(obj.__class__)
+    lazy = _lazy_attributes(obj.__class__)
+    clone.__dict__.update((k, v) for k, v in obj.__dict__.items() if k not in lazy)
+    clone.__dict__.update(attributes)
+    return clone
+
+
+def _clone_rels(rels, clone_rels, parts):
+    for rId, rel in rels.items():
+        target = rel.target_ref if rel.is_external else parts[rel.target_part]
+        clone_rels._rels[rId] = _Relationship(
+            clone_rels._base_uri, rId, rel.reltype, rel._target_mode, target
+        )
+
+
+def clone_package(package):
+    """
+    Return an independent copy of a parsed package.
+
+    The XML of every part is deep-copied and the parts and relationships are
+    rebuilt around the copies. Nothing python-pptx caches on the original
+    (slides, shapes, placeholder proxies, ...) is carried over, as those
+    would point at the original's XML. Blobs of binary parts are immutable
+    and shared until a clone assigns a new one.
+
+    Parameters:
+        package (pptx.package.Package): The package to copy.
+
+    Returns:
+        pptx.package.Package: The copy.
+    """
+    clone = _shallow_clone(package)
+    parts = {part: _shallow_clone(part, _package=clone) for part in package.iter_parts()}
+    for part, part_clone in parts.items():
+        if isinstance(part, XmlPart):
+            part_clone._element = deepcopy(part._element)
+        _clone_rels(part.rels, part_clone.rels, parts)
+    _clone_rels(package._rels, clone._rels, parts)
+    return clone
+
+
+class TemplateCache:
+    """
+    Parse-once cache of PPTX templates with cheap per-job clones.
+
+    Each template is unzipped and parsed by python-pptx only once. The parsed
+    package is kept in memory as a pristine master copy and every call to
+    `get` returns an independent copy of it (see `clone_package`). Cloning
+    copies the lxml trees of the XML parts, which is much faster than
+    re-parsing them, while binary parts (images, media) share their
+    immutable blob bytes with the master until a job assigns a new blob,
+    i.e. they are copy-on-write.
+
+    Together with the parsed package, each entry keeps the template's
+    `LayoutPlaceholderMap`, computed once at load time and shared by all
+    clones (see `layout_map`).
+
+    With `plan_dir`, the layout map is a `FillPlan` read from that directory
+    (compiled and written there on first use), so processes sharing the
+    directory never analyse a template another process already compiled.
+
+    With `lazy_media`, templates are memory-mapped and their binary parts
+    stay in the mapped file (see `open_presentation`): the master and all
+    clones share one map, and the parts no job replaces are copied into each
+    output without being read.
+
+    Entries are keyed by absolute path plus file modification time and size
+    (or a SHA-1 of the file content when `validate="hash"`), so an edited
+    template is picked up automatically. Templates given as bytes or binary
+    streams are keyed by the SHA-1 of their content. The least recently used template is
+    evicted once more than `maxsize` templates are cached.
+
+    Parameters:
+        maxsize (int): Maximum number of templates kept in memory.
+        validate (str): "mtime" to key on (path, mtime, size), or "hash" to
+            key on the SHA-1 of the file content.
+        plan_dir (str, optional): Directory of cached fill plans.
+        lazy_media (bool): Memory-map templates and load binary parts lazily.
+    """
+
+    def __init__(self, maxsize=8, validate="mtime", plan_dir=None, lazy_media=False):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        if validate not in ("mtime", "hash"):
+            raise ValueError("validate must be either 'mtime' or 'hash'")
+
+        self.maxsize = maxsize
+        self.validate = validate
+        self.plan_dir = plan_dir
+        self.lazy_media = lazy_media
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, template_path):
+        return self._key(read_source(template_path)) in self._entries
+
+    def _key(self, template_path):
+        """Return the cache key identifying the current version of a template."""
+        if isinstance(template_path, bytes):
+            return (f"<bytes:{hashlib.sha1(template_path).hexdigest()}>",)
+
+        path = os.path.abspath(template_path)
+        if self.validate == "hash":
+            with open(path, "rb") as f:
+                return path, hashlib.sha1(f.read()).hexdigest()
+        stat = os.stat(path)
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def _load(self, template_path):
+        """Parse a template and return the (package, layout_map) entry to cache."""
+        if self.lazy_media:
+            prs = open_presentation(template_path)
+        else:
+            prs = Presentation(open_source(template_path))
+        if self.plan_dir is not None:
+            # Compiled, if need be, on a presentation of its own: the master stays untouched
+            return prs.part.package, load_fill_plan(template_path, self.plan_dir)
+        return prs.part.package, LayoutPlaceholderMap(prs)
+
+    def _entry(self, template_path):
+        """Return the cached entry of a template, loading it on a miss."""
+        template_path = read_source(template_path)
+        key = self._key(template_path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._load(template_path)
+        with self._lock:
+            self.misses += 1
+            # Drop stale versions of the same template before inserting
+            for old_key in [k for k in self._entries if k[0] == key[0]]:
+                del self._entries[old_key]
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug("Evicted template from cache: %s", evicted[0])
+        return entry
+
+    def get(self, template_path):
+        """
+        Return a fresh, independently editable copy of a template.
+
+        Parameters:
+            template_path (str or bytes or file-like): Path to the PPTX template
+                file, its content, or a readable binary stream.
+
+        Returns:
+            pptx.presentation.Presentation: A clone of the cached template.
+        """
+        prs, _ = self.checkout(template_path)
+        return prs
+
+    def checkout(self, template_path):
+        """
+        Return a fresh copy of a template together with its layout map.
+
+        Both come from the same cache entry, so the map always matches the
+        version of the template that was cloned.
+
+        Parameters:
+            template_path (str or bytes or file-like): Path to the PPTX template
+                file, its content, or a readable binary stream.
+
+        Returns:
+            tuple: (pptx.presentation.Presentation, LayoutPlaceholderMap)
+        """
+        package, layout_map = self._entry(template_path)
+        clone = clone_package(package)
+        return clone.presentation_part.presentation, layout_map
+
+    def layout_map(self, template_path):
+        """
+        Return the precomputed layout placeholder map of a template.
+
+        The map is shared by all clones of the template and must be treated
+        as read-only.
+
+        Parameters:
+            template_path (str or bytes or file-like): Path to the PPTX template
+                file, its content, or a readable binary stream.
+
+        Returns:
+            LayoutPlaceholderMap: The template's layout placeholder slots.
+        """
+        _, layout_map = self._entry(template_path)
+        return layout_map
+
+    def clear(self):
+        """Remove all cached templates and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Return cache statistics.
+
+        Returns:
+            dict: Number of cached templates, maxsize, hits and misses.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,357 @@
+import os
+import json
+import time
+import hashlib
+import logging
+from copy import deepcopy
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationship
+from pptx.parts.image import ImagePart
+
+from autopptx.Image.dedup import get_image_store, load_image
+from autopptx.Table.frame import format_table, is_array_like
+from autopptx.Type.modified import mark_modified
+from autopptx.Type.layout import LayoutPlaceholderMap
+from autopptx.core.metrics import NULL_METRICS
+from autopptx.core.runner import _REPLACERS, _save_summary, fill_slide
+from autopptx.core.streams import (
+    describe,
+    is_path,
+    open_source,
+    read_source,
+    save_presentation_to,
+    source_digest,
+)
+from autopptx.core.writer import DEFAULT_COMPRESSLEVEL
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the fingerprint format or its inputs change
+FINGERPRINT_VERSION = 1
+
+# Sidecar file written next to the output: "<output>.fingerprints.json"
+FINGERPRINT_SUFFIX = ".fingerprints.json"
+
+# Relationships a slide part keeps even though its XML does not reference them
+_IMPLICIT_RELS = frozenset((RT.SLIDE_LAYOUT, RT.NOTES_SLIDE))
+
+
+def fingerprint_path_for(output_path):
+    """Return the default sidecar path of an output file."""
+    return os.fspath(output_path) + FINGERPRINT_SUFFIX
+
+
+def _json_default(value):
+    """Encode the non-JSON input values a slide may hold."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"sha1": hashlib.sha1(value).hexdigest()}
+    if is_array_like(value):
+        return [list(row) for row in format_table(value)]
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    raise TypeError(
+        f"Cannot fingerprint a {type(value).__name__} value; pass paths or bytes instead."
+    )
+
+
+def _image_stamp(image):
+    """Return an image path with its mtime and size, so edited files count as changed."""
+    if not is_path(image):
+        return image
+    try:
+        stat = os.stat(image)
+    except FileNotFoundError:
+        return [os.fspath(image), None, None]
+    return [os.fspath(image), stat.st_mtime_ns, stat.st_size]
+
+
+def slide_fingerprint(data):
+    """
+    Return a stable hash of the input data of one slide.
+
+    Only the keys that are rendered are hashed. Image paths are hashed with
+    the mtime and size of the file, in-memory images with their SHA-1.
+
+    Parameters:
+        data (dict or None): The input data of the slide.
+
+    Returns:
+        str or None: Hex digest, or None for a slide without input data.
+
+    Raises:
+        TypeError: If the data holds a value that cannot be fingerprinted,
+            e.g. an image given as a stream.
+    """
+    if data is None:
+        return None
+
+    values = {kind: data[kind] for kind, _ in _REPLACERS if kind in data}
+    images = values.get("image")
+    if images:
+        images = images if isinstance(images, list) else [images]
+        values["image"] = [_image_stamp(image) for image in images]
+
+    text = json.dumps(values, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def load_fingerprints(fingerprint_path):
+    """
+    Read a fingerprint sidecar file.
+
+    Returns:
+        dict or None: The fingerprints, or None if the file is missing or invalid.
+    """
+    try:
+        with open(fingerprint_path, "r", encoding="utf-8") as f:
+            fingerprints = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("⚠️ Ignoring unreadable fingerprint file %s: %s", fingerprint_path, e)
+        return None
+    return fingerprints if isinstance(fingerprints, dict) else None
+
+
+def _same_target(rel, template_rel):
+    """Return True if a relationship of the output points where the template's does."""
+    if rel.reltype != template_rel.reltype or rel.is_external != template_rel.is_external:
+        return False
+    if rel.is_external:
+        return rel.target_ref == template_rel.target_ref
+    target, template_target = rel.target_part, template_rel.target_part
+    if isinstance(target, ImagePart) and isinstance(template_target, ImagePart):
+        return target.sha1 == template_target.sha1
+    return target.partname == template_target.partname
+
+
+def _restore_rels(part, template_part):
+    """
+    Give a restored slide part every relationship its template XML refers to.
+
+    An earlier run may have dropped a template relationship (the template
+    image of a relinked picture) or reused its rId for something else. Such
+    relationships are put back under their template rId; images go through
+    the package's image store, other parts are looked up by name.
+    """
+    rels = part.rels
+    parts_by_name = None
+    for rId, template_rel in template_part.rels.items():
+        rel = rels.get(rId)
+        if rel is not None and _same_target(rel, template_rel):
+            continue
+        if rel is not None and rel.reltype in _IMPLICIT_RELS:
+            logger.warning(
+                "⚠️ Cannot restore relationship %s of %s: rId in use.", rId, part.partname
+            )
+            continue
+
+        if template_rel.is_external:
+            target = template_rel.target_ref
+        elif isinstance(template_rel.target_part, ImagePart):
+            image = load_image(template_rel.target_part.blob)
+            target = get_image_store(part.package).get_or_add(image)
+        else:
+            if parts_by_name is None:
+                parts_by_name = {p.partname: p for p in part.package.iter_parts()}
+            target = parts_by_name.get(template_rel.target_part.partname)
+            if target is None:
+                logger.warning(
+                    "⚠️ Cannot restore relationship %s of %s: %s is missing.",
+                    rId, part.partname, template_rel.target_part.partname,
+                )
+                continue
+        rels._rels[rId] = _Relationship(
+            rels._base_uri, rId, template_rel.reltype, template_rel._target_mode, target
+        )
+
+
+def _restore_slide(slide, template_slide):
+    """
+    Put a rendered slide back into its template state, relationships included.
+
+    Must run before the slide's shapes are accessed, since the shape
+    collections of python-pptx hold on to the replaced elements.
+    """
+    element, source = slide._element, template_slide._element
+    for child in list(element):
+        element.remove(child)
+    element.extend(deepcopy(child) for child in source)
+    element.attrib.clear()
+    element.attrib.update(source.attrib)
+    _restore_rels(slide.part, template_slide.part)
+    mark_modified(slide)
+
+
+def _drop_orphan_rels(slide, template_slide):
+    """Drop relationships (old images, ...) the re-rendered slide no longer uses."""
+    part = slide.part
+    keep = set(template_slide.part.rels.keys())
+    referenced = set(part._element.xpath("//@r:*"))
+    for rId, rel in list(part.rels.items()):
+        if rId in keep or rId in referenced or rel.reltype in _IMPLICIT_RELS:
+            continue
+        part.rels.pop(rId)
+
+
+def _open_previous(output_path):
+    """
+    Open the previous output.
+
+    Returns:
+        Presentation or None: The presentation, or None if it cannot be opened.
+    """
+    try:
+        return Presentation(output_path)
+    except Exception as e:
+        logger.warning("⚠️ Ignoring unreadable previous output %s: %s", output_path, e)
+        return None
+
+
+def _save_output(prs, output_path, fingerprint_path, compresslevel, store_media):
+    """
+    Save the output next to its final name and rename it over the previous one.
+
+    The old sidecar is removed first, so a crash can never pair the previous
+    fingerprints with a new or partially written output.
+
+    Returns:
+        dict: The report of `save_presentation`.
+    """
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        _, save_report = save_presentation_to(prs, tmp_path, compresslevel, store_media)
+        try:
+            os.remove(fingerprint_path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return save_report
+
+
+def render_incremental(
+    template_path,
+    input_data,
+    output_path,
+    fingerprint_path=None,
+    metrics=None,
+    compresslevel=DEFAULT_COMPRESSLEVEL,
+    store_media=True,
+):
+    """
+    Re-render only the slides whose input data changed since the last run.
+
+    A fingerprint of every slide's input is stored in a sidecar JSON file
+    next to the output. On the next run, the previous output is opened
+    instead of the template: slides with an unchanged fingerprint are kept
+    as they are, and only the changed slides are reset to their template
+    state and filled again. A full render happens when there is no previous
+    output or sidecar, when the previous output cannot be opened, or when the
+    template, the slide count or the AutoPPTX version changed. The output is
+    written to a temporary file and renamed, so an interrupted run never
+    leaves a truncated output behind.
+
+    Parameters:
+        template_path (str or bytes or file-like): The PPTX template.
+        input_data (Iterable[dict]): Dictionaries, one per slide. The data is
+            materialized into a list to fingerprint it.
+        output_path (str): Output file path; it is also the previous output.
+        fingerprint_path (str, optional): Sidecar file path. Defaults to
+            "<output_path>.fingerprints.json".
+        metrics (StageMetrics, optional): Records stage timings.
+        compresslevel (int): Deflate level of the XML parts (0-9).
+        store_media (bool): Store already-compressed media uncompressed.
+
+    Returns:
+        dict: {"rendered": [slide numbers], "reused": [slide numbers]},
+            zero-based.
+
+    Raises:
+        ValueError: If `output_path` is not a file path.
+    """
+    from autopptx import __version__
+
+    if not is_path(output_path):
+        raise ValueError("Incremental rendering needs an output file path.")
+    if metrics is None:
+        metrics = NULL_METRICS
+    start = time.perf_counter()
+
+    output_path = os.fspath(output_path)
+    fingerprint_path = fingerprint_path or fingerprint_path_for(output_path)
+    input_data = list(input_data)
+
+    with metrics.stage("load_template"):
+        template = read_source(template_path)
+        header = {
+            "version": FINGERPRINT_VERSION,
+            "autopptx": __version__,
+            "template": source_digest(template),
+        }
+        previous = load_fingerprints(fingerprint_path)
+        reuse = (
+            previous is not None
+            and all(previous.get(key) == value for key, value in header.items())
+            and os.path.exists(output_path)
+        )
+        prs = _open_previous(output_path) if reuse else None
+        old = previous.get("slides", []) if prs is not None else []
+        if prs is None or len(old) != len(prs.slides):
+            reuse, old = False, []
+            prs = Presentation(open_source(template))
+        layout_map = LayoutPlaceholderMap(prs)
+
+    template_slides = None
+    filled = {kind: 0 for kind, _ in _REPLACERS}
+    fingerprints, rendered, reused = [], [], []
+
+    for idx, slide in enumerate(prs.slides):
+        data = input_data[idx] if idx < len(input_data) else None
+        fingerprint = slide_fingerprint(data)
+        fingerprints.append(fingerprint)
+        if idx < len(old) and old[idx] == fingerprint:
+            reused.append(idx)
+            continue
+
+        if reuse:
+            if template_slides is None:
+                template_slides = list(Presentation(open_source(template)).slides)
+            _restore_slide(slide, template_slides[idx])
+        if data is not None:
+            fill_slide(slide, data, layout_map, filled, metrics, idx)
+        if reuse:
+            _drop_orphan_rels(slide, template_slides[idx])
+        rendered.append(idx)
+
+    with metrics.stage("save"):
+        save_report = _save_output(
+            prs, output_path, fingerprint_path, compresslevel, store_media
+        )
+    metrics.add_save_report(save_report)
+    with open(fingerprint_path, "w", encoding="utf-8") as f:
+        json.dump({**header, "slides": fingerprints}, f, indent=2)
+
+    if logger.isEnabledFor(logging.INFO):
+        summary = {
+            "template": describe(template),
+            "output": output_path,
+            "slides": len(prs.slides),
+            "rendered": len(rendered),
+            "reused": len(reused),
+            "filled": filled,
+            "save": _save_summary(save_report),
+            "elapsed": round(time.perf_counter() - start, 4),
+        }
+        logger.info(
+            "✅ Saved generated PPT file: %s (%d of %d slides re-rendered, %.2fs)",
+            output_path,
+            summary["rendered"],
+            summary["slides"],
+            summary["elapsed"],
+            extra={"deck_summary": summary},
+        )
+    return {"rendered": rendered, "reused": reused}
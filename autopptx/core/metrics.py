@@ -0,0 +1,189 @@
+import json
+import time
+
+# Counters of `save_presentation` reports kept by StageMetrics
+SAVE_COUNTERS = ("parts", "stored", "copied", "bytes", "uncompressed_bytes")
+
+
+class _Stage:
+    """Context manager timing one stage call into a StageMetrics."""
+
+    __slots__ = ("_metrics", "_name", "_slide", "_start")
+
+    def __init__(self, metrics, name, slide):
+        self._metrics = metrics
+        self._name = name
+        self._slide = slide
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._metrics.record(self._name, time.perf_counter() - self._start, slide=self._slide)
+        return False
+
+
+class _NullStage:
+    """Shared no-op context manager used when metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class StageMetrics:
+    """
+    Opt-in record of wall time, call counts and bytes per rendering stage.
+
+    Pass an instance to `process_presentation(..., metrics=...)` to find out
+    where a deck spends its time (template loading, each placeholder kind,
+    table styling, saving). Totals are kept per stage and, optionally, per
+    slide. Without an instance the runner uses `NULL_METRICS`, whose methods
+    do nothing, so disabled instrumentation costs one no-op call per stage.
+
+    The reports of the saves are summed in `save`: parts written, media
+    parts stored uncompressed, parts copied from the template archive, and
+    compressed and uncompressed bytes, i.e. the size/time trade-off of
+    `compresslevel` and `store_media`.
+
+    Parameters:
+        per_slide (bool): Also keep a per-slide breakdown of stage times.
+
+    Example:
+        metrics = StageMetrics()
+        process_presentation(template, data, "out.pptx", metrics=metrics)
+        print(metrics.to_prometheus())
+    """
+
+    enabled = True
+
+    def __init__(self, per_slide=True):
+        self.per_slide = per_slide
+        self.stages = {}
+        self.slides = {}
+        self.save = dict.fromkeys(SAVE_COUNTERS, 0)
+
+    def _stage_totals(self, name):
+        totals = self.stages.get(name)
+        if totals is None:
+            totals = self.stages[name] = {"calls": 0, "seconds": 0.0, "bytes": 0}
+        return totals
+
+    def stage(self, name, slide=None):
+        """
+        Return a context manager that times one call of a stage.
+
+        Parameters:
+            name (str): Stage name, e.g. "table" or "save".
+            slide (int, optional): Zero-based slide number the call belongs to.
+        """
+        return _Stage(self, name, slide)
+
+    def record(self, name, seconds, slide=None):
+        """Add one call of `seconds` to a stage (and to its slide)."""
+        totals = self._stage_totals(name)
+        totals["calls"] += 1
+        totals["seconds"] += seconds
+        if self.per_slide and slide is not None:
+            per_slide = self.slides.setdefault(slide, {})
+            per_slide[name] = per_slide.get(name, 0.0) + seconds
+
+    def add_bytes(self, name, nbytes):
+        """Add `nbytes` read or written by a stage."""
+        self._stage_totals(name)["bytes"] += nbytes
+
+    def add_save_report(self, report):
+        """Add the counters of a `save_presentation` report."""
+        for key in SAVE_COUNTERS:
+            self.save[key] += report[key]
+
+    def to_dict(self):
+        """
+        Return the metrics as a JSON-serializable dict.
+
+        Returns:
+            dict: {"stages": {name: {calls, seconds, bytes}},
+                "slides": [{"slide": n, name: seconds, ...}, ...],
+                "save": {parts, stored, copied, bytes, uncompressed_bytes}}
+        """
+        return {
+            "stages": {name: dict(totals) for name, totals in self.stages.items()},
+            "slides": [
+                {"slide": slide, **stages} for slide, stages in sorted(self.slides.items())
+            ],
+            "save": dict(self.save),
+        }
+
+    def to_json(self, **kwargs):
+        """Return `to_dict()` as a JSON string; keyword arguments go to json.dumps."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_prometheus(self, prefix="autopptx"):
+        """
+        Return the per-stage totals in the Prometheus text exposition format.
+
+        The per-slide breakdown is left out to keep label cardinality bounded.
+
+        Parameters:
+            prefix (str): Metric name prefix.
+
+        Returns:
+            str: The metrics text.
+        """
+        series = (
+            ("stage_seconds_total", "seconds", "Wall time spent per rendering stage."),
+            ("stage_calls_total", "calls", "Number of calls per rendering stage."),
+            ("stage_bytes_total", "bytes", "Bytes read or written per rendering stage."),
+        )
+        lines = []
+        for suffix, key, help_text in series:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for stage, totals in self.stages.items():
+                lines.append(f'{name}{{stage="{stage}"}} {totals[key]}')
+
+        name = f"{prefix}_save_parts_total"
+        lines.append(f"# HELP {name} Parts saved, by how they were written.")
+        lines.append(f"# TYPE {name} counter")
+        deflated = self.save["parts"] - self.save["stored"] - self.save["copied"]
+        for written, count in (
+            ("deflated", deflated), ("stored", self.save["stored"]), ("copied", self.save["copied"])
+        ):
+            lines.append(f'{name}{{written="{written}"}} {count}')
+        name = f"{prefix}_save_bytes_total"
+        lines.append(f"# HELP {name} Size of the saved parts, compressed and uncompressed.")
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f'{name}{{size="compressed"}} {self.save["bytes"]}')
+        lines.append(f'{name}{{size="uncompressed"}} {self.save["uncompressed_bytes"]}')
+        return "\n".join(lines) + "\n"
+
+
+class _NullMetrics:
+    """StageMetrics stand-in that records nothing."""
+
+    enabled = False
+
+    def stage(self, name, slide=None):
+        return _NULL_STAGE
+
+    def record(self, name, seconds, slide=None):
+        pass
+
+    def add_bytes(self, name, nbytes):
+        pass
+
+    def add_save_report(self, report):
+        pass
+
+
+# Used by the runner when no metrics object is given
+NULL_METRICS = _NullMetrics()
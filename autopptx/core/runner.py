@@ -1,12 +1,39 @@
+import os
+import sys
 import json
+import time
+import logging
 import argparse
 from pptx import Presentation
 
 from autopptx.Text.texts import replace_title, replace_subtitle, replace_bodytexts
 from autopptx.Image.images import replace_images
 from autopptx.Table.tables import replace_tables
-from autopptx.Type.find import find_placeholders
+from autopptx.Type.layout import LayoutPlaceholderMap
 from autopptx.Table.style import set_table_style
+from autopptx.core.archive import open_presentation
+from autopptx.core.metrics import NULL_METRICS, StageMetrics
+from autopptx.core.writer import DEFAULT_COMPRESSLEVEL
+from autopptx.core.streams import (
+    describe,
+    is_path,
+    open_source,
+    read_source,
+    save_presentation_to,
+    source_digest,
+    source_size,
+)
+
+logger = logging.getLogger(__name__)
+
+# Input keys and the replace function filling each placeholder kind
+_REPLACERS = (
+    ("title", replace_title),
+    ("subtitle", replace_subtitle),
+    ("bodytext", replace_bodytexts),
+    ("image", replace_images),
+    ("table", replace_tables),
+)
 
 
 def load_input_data(json_path):
@@ -30,40 +57,234 @@ def load_input_data(json_path):
     return data
 
 
-def process_presentation(template_path, input_data, output_path):
+def iter_input_data(jsonl_path):
     """
-    Replace all placeholders in the presentation using the input data.
+    Lazily read input data from a JSON Lines file, one slide dict per line.
+
+    Lines are parsed one at a time as they are consumed, so only the current
+    slide needs to be held in memory. Blank lines are skipped.
+
+    Expected format:
+        {"title": "Title 1", "bodytext": ["Paragraph 1"]}
+        {"title": "Title 2", "image": ["path/to/img2.png"]}
+        ...
 
     Parameters:
-        template_path (str): Path to the PPTX template file.
-        input_data (list): List of dictionaries, one per slide.
-        output_path (str): Output file path to save the result.
+        jsonl_path (str): Path to the JSONL file.
+
+    Yields:
+        dict: The input data of the next slide.
+
+    Raises:
+        ValueError: If a line does not hold a JSON object.
     """
-    prs = Presentation(template_path)
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            if not isinstance(item, dict):
+                raise ValueError(f"Line {line_no} of {jsonl_path} is not a JSON object.")
+            yield item
+
+
+def read_input_data(path):
+    """
+    Read input data, streaming it when the file is JSON Lines.
+
+    Files ending in ".jsonl" or ".ndjson" are read lazily with
+    `iter_input_data`; any other file is loaded with `load_input_data`.
+
+    Parameters:
+        path (str): Path to the input file.
+
+    Returns:
+        Iterable[dict]: The per-slide input data.
+    """
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        return iter_input_data(path)
+    return load_input_data(path)
+
+
+def _image_bytes(image_path):
+    """Return the total size of the image file(s) or bytes given for a slide."""
+    images = image_path if isinstance(image_path, list) else [image_path]
+    return sum(
+        source_size(image) for image in images if is_path(image) or isinstance(image, bytes)
+    )
 
-    for idx, slide in enumerate(prs.slides):
-        if idx >= len(input_data):
-            print(f"⚠️ Slide {idx + 1} skipped: no input data.")
-            continue
 
-        data = input_data[idx]
-        replace_title(slide, data.get("title", ""))
-        replace_subtitle(slide, data.get("subtitle", ""))
-        replace_bodytexts(slide, data.get("bodytext", ""))
-        replace_images(slide, data.get("image", ""))
-        replace_tables(slide, data.get("table", ""))
+def _output_size(output_path, content):
+    """Return the number of bytes written by `save_presentation_to`."""
+    if content is not None:
+        return len(content)
+    if is_path(output_path):
+        return os.path.getsize(output_path)
+    try:
+        return output_path.tell()
+    except (AttributeError, OSError):
+        return 0
 
-        table_shapes = find_placeholders(slide, 'table')
-        if table_shapes:
+
+def _save_summary(report):
+    """Return the `save_presentation` report as logged in the deck summary."""
+    return {**report, "seconds": round(report["seconds"], 4)}
+
+
+def fill_slide(slide, data, layout_map, filled, metrics=NULL_METRICS, idx=None):
+    """
+    Fill the placeholders of one slide and style its tables.
+
+    Parameters:
+        slide (pptx.slide.Slide): Slide still in its template state.
+        data (dict): The input data of the slide.
+        layout_map (LayoutPlaceholderMap): Placeholder map of the deck.
+        filled (dict): Per-kind counters of filled placeholders, updated in place.
+        metrics (StageMetrics, optional): Stage timings to record into.
+        idx (int, optional): Zero-based slide number, for per-slide metrics.
+    """
+    with metrics.stage("index", slide=idx):
+        index = layout_map.index(slide)
+
+    for kind, replace in _REPLACERS:
+        value = data.get(kind, "")
+        # Nothing to fill and nowhere to put it: skip the "not found" warning
+        if not value and not index.get(kind):
+            continue
+        with metrics.stage(kind, slide=idx):
+            replace(slide, value, index=index)
+        if value:
+            filled[kind] += 1
+            if kind == "image" and metrics.enabled:
+                metrics.add_bytes("image", _image_bytes(value))
+
+    table_shapes = index.get("table")
+    if table_shapes:
+        with metrics.stage("table_style", slide=idx):
             for shape in table_shapes:
                 set_table_style(shape, font_name="等线")
 
 
-    prs.save(output_path)
-    print(f"✅ Saved generated PPT file: {output_path}")
+def process_presentation(
+    template_path,
+    input_data,
+    output_path=None,
+    template_cache=None,
+    metrics=None,
+    compresslevel=DEFAULT_COMPRESSLEVEL,
+    store_media=True,
+    plan=None,
+    lazy_media=False,
+):
+    """
+    Replace all placeholders in the presentation using the input data.
+
+    Parameters:
+        template_path (str or bytes or file-like): Path to the PPTX template
+            file, its content, or a readable binary stream.
+        input_data (Iterable[dict]): Dictionaries, one per slide. Any iterable
+            works, including a generator from `iter_input_data`; items are
+            consumed one slide at a time. Images may be given as paths,
+            bytes or binary streams.
+        output_path (str or file-like, optional): Output file path or writable
+            binary stream to save the result to. If None, the file content
+            is returned instead, so nothing touches the filesystem.
+        template_cache (TemplateCache, optional): Cache to take a parsed copy
+            of the template from instead of parsing it again.
+        metrics (StageMetrics, optional): Records wall time, calls and bytes
+            of every stage ("load_template", "index", one stage per
+            placeholder kind, "table_style", "save"), per slide as well.
+        compresslevel (int): Deflate level (0-9) of the XML parts of the
+            saved file; 0 stores everything, 1 is fastest, 9 smallest.
+        store_media (bool): Store already-compressed images and media
+            uncompressed instead of deflating them again.
+        plan (FillPlan, optional): Compiled fill plan of the template (see
+            `load_fill_plan`), used instead of analysing the template. A
+            `template_cache` brings its own map or plan.
+        lazy_media (bool): Memory-map the template and leave its images,
+            video and other binary parts in it until needed; the untouched
+            ones are copied into the output still compressed (see
+            `open_presentation`). A `template_cache` has its own setting.
+
+    Returns:
+        bytes or None: The PPTX file content when `output_path` is None.
+
+    Raises:
+        ValueError: If `plan` was compiled from a different template.
 
+    Logs:
+        One INFO record per deck whose `deck_summary` attribute holds a dict
+        (template, output, slides, skipped, filled per kind, the report of
+        `save_presentation`, elapsed) for structured log handlers.
+        Per-shape messages are DEBUG only.
+    """
+    if metrics is None:
+        metrics = NULL_METRICS
+    start = time.perf_counter()
+
+    with metrics.stage("load_template"):
+        # A stream can be read only once: keep its content
+        template = read_source(template_path)
+        if template_cache is None and plan is not None and plan.template is not None:
+            if plan.template != source_digest(template):
+                raise ValueError("The fill plan was compiled from a different template.")
+        if template_cache is not None:
+            prs, layout_map = template_cache.checkout(template)
+        else:
+            if lazy_media:
+                prs = open_presentation(template)
+            else:
+                prs = Presentation(open_source(template))
+            layout_map = plan if plan is not None else LayoutPlaceholderMap(prs)
+    if metrics.enabled:
+        metrics.add_bytes("load_template", source_size(template))
+
+    filled = {kind: 0 for kind, _ in _REPLACERS}
+    skipped = 0
 
-def main():
+    input_iter = iter(input_data)
+    for idx, slide in enumerate(prs.slides):
+        data = next(input_iter, None)
+        if data is None:
+            skipped += 1
+            logger.debug("Slide %d skipped: no input data.", idx + 1)
+            continue
+
+        fill_slide(slide, data, layout_map, filled, metrics, idx)
+
+    with metrics.stage("save"):
+        content, save_report = save_presentation_to(prs, output_path, compresslevel, store_media)
+    if lazy_media and template_cache is None:
+        # Unmap now rather than whenever the part graph is garbage collected
+        prs.part.package.archive.close()
+    if metrics.enabled:
+        metrics.add_bytes("save", _output_size(output_path, content))
+        metrics.add_save_report(save_report)
+
+    if skipped:
+        logger.warning("⚠️ %d slide(s) skipped: no input data.", skipped)
+    if logger.isEnabledFor(logging.INFO):
+        summary = {
+            "template": describe(template),
+            "output": describe(output_path),
+            "slides": len(prs.slides),
+            "skipped": skipped,
+            "filled": filled,
+            "save": _save_summary(save_report),
+            "elapsed": round(time.perf_counter() - start, 4),
+        }
+        logger.info(
+            "✅ Saved generated PPT file: %s (%d slides, %.2fs)",
+            summary["output"],
+            summary["slides"],
+            summary["elapsed"],
+            extra={"deck_summary": summary},
+        )
+    return content
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="AutoPPTX: Automated placeholder replacement for PPTX templates"
     )
@@ -77,7 +298,7 @@ def main():
         "--input",
         type=str,
         default="./data/input_data.json",
-        help="Path to the input JSON file",
+        help="Path to the input JSON file (.jsonl/.ndjson files are streamed)",
     )
     parser.add_argument(
         "--output",
@@ -85,10 +306,143 @@ def main():
         default="./data/output_demo.pptx",
         help="Path to save the generated PPTX file",
     )
+    parser.add_argument(
+        "--batch",
+        type=str,
+        default=None,
+        help=(
+            "Path to a JSON manifest of {input, output} jobs to render in parallel "
+            "(.jsonl/.ndjson manifests are streamed, one job per line)"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes in batch mode (default: CPU count)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=1,
+        help="Number of retries per failed job in batch mode",
+    )
+    parser.add_argument(
+        "--report",
+        type=str,
+        default=None,
+        help="Optional path to write the per-job batch status report (JSON)",
+    )
+
+    parser.add_argument(
+        "--metrics",
+        type=str,
+        default=None,
+        help=(
+            "Write per-stage timings of the rendered deck to this file "
+            "(Prometheus text for .prom/.txt, JSON otherwise)"
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Re-render only the slides whose input changed since the last run "
+            "(fingerprints are kept in <output>.fingerprints.json)"
+        ),
+    )
+    parser.add_argument(
+        "--plan-cache",
+        type=str,
+        default=None,
+        help="Directory of compiled template fill plans, shared by batch workers",
+    )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        default=DEFAULT_COMPRESSLEVEL,
+        choices=range(10),
+        metavar="0-9",
+        help="Deflate level of the saved file (0: store, 1: fastest, 9: smallest)",
+    )
+    parser.add_argument(
+        "--deflate-media",
+        action="store_true",
+        help="Deflate images and media too (by default they are stored as-is)",
+    )
+    parser.add_argument(
+        "--lazy-media",
+        action="store_true",
+        help=(
+            "Memory-map the template and copy its untouched media into the output "
+            "without loading it (for templates with large embedded media)"
+        ),
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level (DEBUG shows per-placeholder messages)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.incremental and (args.lazy_media or args.plan_cache):
+        parser.error("--lazy-media and --plan-cache cannot be used with --incremental")
+    if args.batch and (args.metrics or args.incremental):
+        parser.error("--metrics and --incremental cannot be used with --batch")
+
+    logging.basicConfig(
+        level=args.log_level,
+        format="[%(levelname)s] %(message)s",
+    )
+
+    if args.batch:
+        from autopptx.core.batch import read_manifest, run_batch
+
+        jobs = read_manifest(args.batch)
+        results = run_batch(
+            jobs,
+            args.template,
+            workers=args.workers,
+            retries=args.retries,
+            plan_dir=args.plan_cache,
+            lazy_media=args.lazy_media,
+            compresslevel=args.compress_level,
+            store_media=not args.deflate_media,
+        )
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+        if any(r["status"] != "ok" for r in results):
+            sys.exit(1)
+        return
+
+    input_data = read_input_data(args.input)
+    metrics = StageMetrics() if args.metrics else None
+    options = dict(
+        metrics=metrics,
+        compresslevel=args.compress_level,
+        store_media=not args.deflate_media,
+    )
+    if args.incremental:
+        from autopptx.core.incremental import render_incremental
+
+        render_incremental(args.template, input_data, args.output, **options)
+    else:
+        options["lazy_media"] = args.lazy_media
+        if args.plan_cache:
+            from autopptx.core.cache import load_fill_plan
+
+            options["plan"] = load_fill_plan(args.template, args.plan_cache)
+        process_presentation(args.template, input_data, args.output, **options)
 
-    args = parser.parse_args()
-    input_data = load_input_data(args.input)
-    process_presentation(args.template, input_data, args.output)
+    if metrics is not None:
+        with open(args.metrics, "w", encoding="utf-8") as f:
+            if args.metrics.lower().endswith((".prom", ".txt")):
+                f.write(metrics.to_prometheus())
+            else:
+                f.write(metrics.to_json(indent=2))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+import io
+import os
+import hashlib
+
+from autopptx.core.writer import DEFAULT_COMPRESSLEVEL, save_presentation
+
+
+def is_path(source):
+    """Return True if `source` is a filesystem path rather than in-memory data."""
+    return isinstance(source, (str, os.PathLike))
+
+
+def read_source(source):
+    """
+    Normalize a template or image source to a path or to bytes.
+
+    Parameters:
+        source (str or os.PathLike or bytes or file-like): A path, the file
+            content, or a readable binary stream (read from its current position).
+
+    Returns:
+        str or bytes: The path, or the content as bytes.
+
+    Raises:
+        TypeError: If `source` is none of the supported types.
+    """
+    if is_path(source):
+        return os.fspath(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, "read"):
+        return source.read()
+    raise TypeError(
+        f"Expected a path, bytes or a binary stream, got {type(source).__name__}."
+    )
+
+
+def open_source(source):
+    """Return something python-pptx can open: the path itself or a BytesIO."""
+    source = read_source(source)
+    return source if isinstance(source, str) else io.BytesIO(source)
+
+
+def source_size(source):
+    """Return the size in bytes of a path or of in-memory content."""
+    if is_path(source):
+        return os.path.getsize(source)
+    return len(source)
+
+
+def source_digest(source):
+    """
+    Return the SHA-1 hex digest of a template or image given as a path or bytes.
+
+    Files are hashed in chunks, so large templates are never held in memory.
+    """
+    if not is_path(source):
+        return hashlib.sha1(source).hexdigest()
+
+    digest = hashlib.sha1()
+    with open(source, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def describe(target):
+    """Return a short label of a path, stream or in-memory target for logs."""
+    if target is None:
+        return "<bytes>"
+    if is_path(target):
+        return os.fspath(target)
+    return f"<{type(target).__name__}>"
+
+
+def save_presentation_to(
+    prs, output, compresslevel=DEFAULT_COMPRESSLEVEL, store_media=True
+):
+    """
+    Save a presentation to a path, to a writable binary stream, or to bytes.
+
+    Parameters:
+        prs (pptx.presentation.Presentation): The presentation to save.
+        output (str or os.PathLike or file-like or None): Where to save;
+            None returns the file content.
+        compresslevel (int): Deflate level of the XML parts (0-9).
+        store_media (bool): Store already-compressed media uncompressed.
+
+    Returns:
+        tuple: (bytes or None, dict) — the file content when `output` is
+            None, and the report of `save_presentation`.
+    """
+    if output is None:
+        stream = io.BytesIO()
+        report = save_presentation(prs, stream, compresslevel, store_media)
+        return stream.getvalue(), report
+    return None, save_presentation(prs, output, compresslevel, store_media)
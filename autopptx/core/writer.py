@@ -0,0 +1,187 @@
+import io
+import sys
+import time
+import logging
+import zipfile
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+from autopptx.core.archive import detach_archive, source_members
+
+logger = logging.getLogger(__name__)
+
+# zlib's own default, which is also what `Presentation.save` uses
+DEFAULT_COMPRESSLEVEL = 6
+
+# Media types that deflate does not shrink: they are compressed already
+_PRECOMPRESSED_TYPES = frozenset(
+    (
+        "image/png",
+        "image/jpeg",
+        "image/gif",
+        "image/webp",
+        "image/vnd.ms-photo",
+    )
+)
+_PRECOMPRESSED_PREFIXES = ("audio/", "video/")
+
+
+def is_precompressed(part):
+    """Return True if the part holds media (PNG, JPEG, audio, video, ...) that is compressed already."""
+    content_type = part.content_type
+    return content_type in _PRECOMPRESSED_TYPES or content_type.startswith(
+        _PRECOMPRESSED_PREFIXES
+    )
+
+
+# `zipfile.ZipFile` has no public way to append compressed bytes as they
+# are; `_append_raw` uses these internals, present in CPython 3.8 to 3.13
+_RAW_APPEND_ATTRIBUTES = (
+    "fp", "filelist", "NameToInfo", "start_dir", "_seekable", "_didModify", "_writecheck",
+)
+_RAW_APPEND_PYTHON = ((3, 8), (3, 14))
+
+
+def _raw_append_supported():
+    """Return True if this Python's zipfile has the internals `_append_raw` uses."""
+    low, high = _RAW_APPEND_PYTHON
+    if not low <= sys.version_info[:2] < high:
+        return False
+    with zipfile.ZipFile(io.BytesIO(), "w") as zipf:
+        return all(hasattr(zipf, name) for name in _RAW_APPEND_ATTRIBUTES)
+
+
+_RAW_APPEND = _raw_append_supported()
+
+
+def _append_raw(zipf, zinfo, data):
+    """
+    Append a member whose compressed bytes, CRC and sizes are already known.
+
+    This is the only code relying on zipfile internals, and it only runs
+    when `_RAW_APPEND` is true.
+    """
+    zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+    zipf._writecheck(zinfo)
+    if zipf._seekable:
+        zipf.fp.seek(zipf.start_dir)
+    zinfo.header_offset = zipf.fp.tell()
+    zipf._didModify = True
+    zipf.fp.write(zinfo.FileHeader(zip64))
+    zipf.fp.write(data)
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _copy_member(zipf, membername, source):
+    """
+    Append a member copied as-is, still compressed, from a template archive.
+
+    The local header is written from the source's directory entry (CRC and
+    sizes are known), followed by the compressed bytes straight out of the
+    mapped archive, so nothing is decompressed or compressed again. Where
+    zipfile's internals are not as expected (see `_RAW_APPEND`), the member
+    is read and compressed again instead.
+    """
+    info = source.info
+    zinfo = zipfile.ZipInfo(membername, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    zinfo.external_attr = 0o600 << 16
+    if not _RAW_APPEND:
+        zipf.writestr(zinfo, source.read())
+        return
+    with source.raw() as data:
+        _append_raw(zipf, zinfo, data)
+
+
+def save_presentation(prs, output, compresslevel=DEFAULT_COMPRESSLEVEL, store_media=True):
+    """
+    Save a presentation with a chosen deflate level, storing media as-is.
+
+    `Presentation.save` deflates every part, including PNG and JPEG images
+    that gain nothing from it but still cost most of the save time of an
+    image-heavy deck. This writes the same package, but media parts that are
+    compressed already are stored and only the XML parts are deflated.
+
+    Parts of a presentation opened with `open_presentation` that are
+    unchanged (see `source_members`) are copied from the template archive
+    as they are, without being read or compressed again, and so are the
+    unchanged ".rels" members. Binary parts are not even read, and XML parts
+    marked with `mark_modified` are not compared, so saving a deck filled
+    from a large template costs little more than what was filled.
+
+    Parameters:
+        prs (pptx.presentation.Presentation): The presentation to save.
+        output (str or file-like): Output file path or writable binary stream.
+        compresslevel (int): Deflate level of the XML parts, from 0 (no
+            compression, every part is stored) to 9 (smallest, slowest).
+        store_media (bool): Store already-compressed media parts uncompressed.
+
+    Returns:
+        dict: {"parts", "stored", "copied", "bytes", "uncompressed_bytes",
+            "seconds"} where `bytes` is the compressed size of the parts and
+            `copied` the number of parts copied from the template archive.
+
+    Raises:
+        ValueError: If `compresslevel` is not between 0 and 9.
+    """
+    if not 0 <= compresslevel <= 9:
+        raise ValueError(f"compresslevel must be between 0 and 9, got {compresslevel}.")
+
+    start = time.perf_counter()
+    package = prs.part.package
+    archive = getattr(package, "archive", None)
+    if archive is not None and archive.is_file(output):
+        # Overwriting the mapped template: read what is still in it first
+        detach_archive(package)
+    parts = tuple(package.iter_parts())
+    compression = zipfile.ZIP_DEFLATED if compresslevel else zipfile.ZIP_STORED
+    stored = copied = 0
+
+    with zipfile.ZipFile(
+        output, "w", compression=compression, compresslevel=compresslevel,
+        strict_timestamps=False,
+    ) as zipf:
+        # [Content_Types].xml first, as `Presentation.save` does
+        zipf.writestr(
+            CONTENT_TYPES_URI.membername,
+            serialize_part_xml(_ContentTypesItem.xml_for(parts)),
+        )
+        zipf.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        for part in parts:
+            source, rels_source = source_members(part)
+            if source is not None:
+                _copy_member(zipf, part.partname.membername, source)
+                copied += 1
+            elif store_media and compression != zipfile.ZIP_STORED and is_precompressed(part):
+                zipf.writestr(
+                    part.partname.membername, part.blob, compress_type=zipfile.ZIP_STORED
+                )
+                stored += 1
+            else:
+                zipf.writestr(part.partname.membername, part.blob)
+            if rels_source is not None:
+                _copy_member(zipf, part.partname.rels_uri.membername, rels_source)
+            elif part._rels:
+                zipf.writestr(part.partname.rels_uri.membername, part.rels.xml)
+        infos = zipf.infolist()
+
+    report = {
+        "parts": len(parts),
+        "stored": stored,
+        "copied": copied,
+        "bytes": sum(info.compress_size for info in infos),
+        "uncompressed_bytes": sum(info.file_size for info in infos),
+        "seconds": time.perf_counter() - start,
+    }
+    logger.debug(
+        "Saved %d parts (%d media stored, %d copied): %d -> %d bytes in %.3fs",
+        report["parts"], report["stored"], report["copied"], report["uncompressed_bytes"],
+        report["bytes"], report["seconds"],
+    )
+    return report
@@ -0,0 +1,249 @@
+"""
+AutoPPTX benchmark suite.
+
+Generates a synthetic template, input data and images, times each stage
+separately and prints (or writes) the results as JSON:
+
+    python -m benchmarks.run --slides 20 --placeholders 2 --output results.json
+    python -m benchmarks.run --compare results.json --threshold 0.2
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import tempfile
+from datetime import datetime, timezone
+
+import pptx
+from pptx import Presentation
+
+import autopptx
+from autopptx.core.runner import process_presentation
+from autopptx.core.writer import save_presentation
+from autopptx.Table.style import set_table_style
+from autopptx.Table.tables import replace_tables
+from autopptx.Type.layout import LayoutPlaceholderMap
+from autopptx.View.scan import scan_presentation
+from autopptx.View.view import view_slide
+
+from benchmarks.synthetic import make_deck_data, make_images, make_template
+
+# Stages in the order they are run and reported
+STAGES = (
+    "load_template",
+    "process_presentation",
+    "replace_tables",
+    "set_table_style",
+    "view_slide",
+    "scan_presentation",
+    "save",
+    "save_store_media",
+    "load_output",
+)
+
+
+def _measure(run, setup=None, repeat=5):
+    """
+    Time `run(state)` `repeat` times, calling `setup()` untimed before each run.
+
+    Returns:
+        dict: Timing statistics in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+
+    return {
+        "repeat": repeat,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "max": max(times),
+    }
+
+
+def _fill_tables(prs, data):
+    """Fill the table placeholders of every slide; return the deck."""
+    layout_map = LayoutPlaceholderMap(prs)
+    for slide, slide_data in zip(prs.slides, data):
+        replace_tables(slide, slide_data["table"], index=layout_map.index(slide))
+    return prs
+
+
+def _table_shapes(prs):
+    return [shape for slide in prs.slides for shape in slide.shapes if shape.has_table]
+
+
+def run_benchmarks(
+    slides=10, placeholders=2, rows=10, cols=5, images=4, repeat=5, workdir=None
+):
+    """
+    Generate synthetic inputs and time every stage.
+
+    Parameters:
+        slides (int): Number of slides of the synthetic template.
+        placeholders (int): Body text, picture and table placeholders per slide (each).
+        rows (int): Rows per table, including the header row.
+        cols (int): Columns per table.
+        images (int): Number of distinct synthetic images.
+        repeat (int): Timed runs per stage.
+        workdir (str, optional): Directory for generated files (default: a temp dir).
+
+    Returns:
+        dict: {"meta": ..., "params": ..., "stages": {stage: stats}}.
+    """
+    params = dict(
+        slides=slides, placeholders=placeholders, rows=rows, cols=cols,
+        images=images, repeat=repeat,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = workdir or tmp
+        template = make_template(os.path.join(workdir, "template.pptx"), slides, placeholders)
+        image_paths = make_images(os.path.join(workdir, "images"), count=images)
+        data = make_deck_data(slides, placeholders, rows, cols, image_paths)
+        output = os.path.join(workdir, "output.pptx")
+
+        stages = {}
+        stages["load_template"] = _measure(lambda _: Presentation(template), repeat=repeat)
+        stages["process_presentation"] = _measure(
+            lambda _: process_presentation(template, data, output), repeat=repeat
+        )
+        stages["replace_tables"] = _measure(
+            lambda prs: _fill_tables(prs, data),
+            setup=lambda: Presentation(template),
+            repeat=repeat,
+        )
+        stages["set_table_style"] = _measure(
+            lambda shapes: [set_table_style(shape, font_name="Arial") for shape in shapes],
+            setup=lambda: _table_shapes(_fill_tables(Presentation(template), data)),
+            repeat=repeat,
+        )
+        stages["view_slide"] = _measure(
+            lambda prs: [view_slide(slide) for slide in prs.slides],
+            setup=lambda: Presentation(output),
+            repeat=repeat,
+        )
+        # Includes opening the deck, which the view_slide stage does untimed
+        stages["scan_presentation"] = _measure(
+            lambda _: list(scan_presentation(output)), repeat=repeat
+        )
+        stages["save"] = _measure(
+            lambda prs: prs.save(io.BytesIO()),
+            setup=lambda: Presentation(output),
+            repeat=repeat,
+        )
+        stages["save_store_media"] = _measure(
+            lambda prs: save_presentation(prs, io.BytesIO()),
+            setup=lambda: Presentation(output),
+            repeat=repeat,
+        )
+        # Size side of the save trade-off: python-pptx vs media stored as-is
+        deflated, stored = io.BytesIO(), io.BytesIO()
+        Presentation(output).save(deflated)
+        save_presentation(Presentation(output), stored)
+        stages["save"]["bytes"] = len(deflated.getvalue())
+        stages["save_store_media"]["bytes"] = len(stored.getvalue())
+        with open(output, "rb") as f:
+            blob = f.read()
+        stages["load_output"] = _measure(
+            lambda _: Presentation(io.BytesIO(blob)), repeat=repeat
+        )
+
+    for stats in stages.values():
+        stats["per_slide"] = stats["median"] / slides
+
+    return {
+        "meta": {
+            "autopptx": autopptx.__version__,
+            "python-pptx": pptx.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "output_bytes": len(blob),
+        },
+        "params": params,
+        "stages": stages,
+    }
+
+
+def compare_results(baseline, current, threshold=0.2):
+    """
+    Compare the median time of every stage against a baseline.
+
+    Parameters:
+        baseline (dict): Results of an earlier run.
+        current (dict): Results of this run.
+        threshold (float): Relative slowdown that counts as a regression.
+
+    Returns:
+        tuple: (rows, regressed) where rows are (stage, baseline, current, ratio)
+            and regressed lists the stages slower than `1 + threshold`.
+    """
+    rows, regressed = [], []
+    for stage in STAGES:
+        if stage not in baseline["stages"] or stage not in current["stages"]:
+            continue
+        before = baseline["stages"][stage]["median"]
+        after = current["stages"][stage]["median"]
+        ratio = after / before if before else float("inf")
+        rows.append((stage, before, after, ratio))
+        if ratio > 1 + threshold:
+            regressed.append(stage)
+    return rows, regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AutoPPTX benchmark suite")
+    parser.add_argument("--slides", type=int, default=10, help="Slides in the synthetic template")
+    parser.add_argument(
+        "--placeholders", type=int, default=2,
+        help="Body text, picture and table placeholders per slide (each)",
+    )
+    parser.add_argument("--rows", type=int, default=10, help="Rows per table")
+    parser.add_argument("--cols", type=int, default=5, help="Columns per table")
+    parser.add_argument("--images", type=int, default=4, help="Distinct synthetic images")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage")
+    parser.add_argument("--workdir", type=str, default=None, help="Keep generated files here")
+    parser.add_argument("--output", type=str, default=None, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=str, default=None, help="Baseline JSON results to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="Relative slowdown reported as a regression (default: 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        slides=args.slides, placeholders=args.placeholders, rows=args.rows,
+        cols=args.cols, images=args.images, repeat=args.repeat, workdir=args.workdir,
+    )
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows, regressed = compare_results(baseline, results, args.threshold)
+        for stage, before, after, ratio in rows:
+            flag = "  <-- regression" if stage in regressed else ""
+            print(f"{stage:22s} {before * 1000:10.2f} ms -> {after * 1000:10.2f} ms  x{ratio:.2f}{flag}",
+                  file=sys.stderr)
+        if regressed:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+import math
+import os
+import random
+from PIL import Image, ImageDraw
+from pptx import Presentation
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.util import Emu
+
+# Placeholder kinds repeated M times per slide, with their python-pptx type
+REPEATED_KINDS = (
+    ("bodytext", PP_PLACEHOLDER.BODY),
+    ("image", PP_PLACEHOLDER.PICTURE),
+    ("table", PP_PLACEHOLDER.TABLE),
+)
+
+# Index of the "Blank" layout in python-pptx's default template
+BLANK_LAYOUT = 6
+
+
+def _add_placeholder(layout, ph_type, idx, name, x, y, cx, cy):
+    """Append a placeholder of the given type to a slide layout."""
+    spTree = layout.shapes._spTree
+    sp = CT_Shape.new_placeholder_sp(
+        spTree._next_shape_id, name, ph_type, "horz", "full", idx
+    )
+    spTree.append(sp)
+    sp.x, sp.y, sp.cx, sp.cy = Emu(x), Emu(y), Emu(cx), Emu(cy)
+
+
+def make_template(path, slides=10, placeholders=2):
+    """
+    Generate a template with `slides` slides of one synthetic layout.
+
+    The layout has a title, a subtitle and `placeholders` body text, picture
+    and table placeholders each, laid out on a grid below the title.
+
+    Parameters:
+        path (str): Where to save the template.
+        slides (int): Number of slides.
+        placeholders (int): Number of placeholders of each repeated kind.
+
+    Returns:
+        str: The template path.
+    """
+    prs = Presentation()
+    layout = prs.slide_layouts[BLANK_LAYOUT]
+    width, height = prs.slide_width, prs.slide_height
+    margin = width // 20
+
+    _add_placeholder(
+        layout, PP_PLACEHOLDER.TITLE, 0, "Title 1",
+        margin, margin, width - 2 * margin, height // 8,
+    )
+
+    kinds = [(PP_PLACEHOLDER.SUBTITLE, "Subtitle")]
+    for _, ph_type in REPEATED_KINDS:
+        kinds += [(ph_type, ph_type.name.title())] * placeholders
+
+    cols = math.ceil(math.sqrt(len(kinds)))
+    rows = math.ceil(len(kinds) / cols)
+    top = margin + height // 8 + margin // 2
+    cell_w = (width - 2 * margin) // cols
+    cell_h = (height - top - margin) // rows
+
+    for i, (ph_type, name) in enumerate(kinds):
+        row, col = divmod(i, cols)
+        _add_placeholder(
+            layout, ph_type, i + 1, f"{name} {i + 2}",
+            margin + col * cell_w, top + row * cell_h,
+            cell_w - margin // 4, cell_h - margin // 4,
+        )
+
+    for _ in range(slides):
+        prs.slides.add_slide(layout)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    prs.save(path)
+    return path
+
+
+def make_images(directory, count=4, size=(640, 480), seed=0):
+    """
+    Generate `count` distinct PNG images.
+
+    Parameters:
+        directory (str): Output directory.
+        count (int): Number of images.
+        size (tuple): Pixel size (width, height).
+        seed (int): Random seed, so runs are reproducible.
+
+    Returns:
+        list[str]: The image paths.
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+
+    paths = []
+    for i in range(count):
+        image = Image.new("RGB", size, tuple(rng.randrange(256) for _ in range(3)))
+        draw = ImageDraw.Draw(image)
+        for _ in range(20):
+            x0, y0 = rng.randrange(size[0]), rng.randrange(size[1])
+            x1, y1 = x0 + rng.randrange(1, size[0] // 2), y0 + rng.randrange(1, size[1] // 2)
+            draw.rectangle((x0, y0, x1, y1), fill=tuple(rng.randrange(256) for _ in range(3)))
+
+        path = os.path.join(directory, f"synthetic{i}.png")
+        image.save(path)
+        paths.append(path)
+    return paths
+
+
+def make_table(rows, cols, seed=0):
+    """Return a rows × cols table of strings with a header row."""
+    rng = random.Random(seed)
+    header = [f"Column {j + 1}" for j in range(cols)]
+    body = [[f"{rng.uniform(0, 1000):.2f}" for _ in range(cols)] for _ in range(rows - 1)]
+    return [header] + body
+
+
+def make_deck_data(slides=10, placeholders=2, rows=10, cols=5, images=()):
+    """
+    Generate input data matching a template from `make_template`.
+
+    Parameters:
+        slides (int): Number of slides.
+        placeholders (int): Number of placeholders of each repeated kind.
+        rows (int): Rows per table, including the header row.
+        cols (int): Columns per table.
+        images (list[str]): Image paths, used in turn.
+
+    Returns:
+        list[dict]: One input dictionary per slide.
+    """
+    data = []
+    for i in range(slides):
+        slide = {
+            "title": f"Synthetic slide {i + 1}",
+            "subtitle": f"Generated subtitle {i + 1}",
+            "bodytext": [
+                f"Body text {j + 1} of slide {i + 1}. " * 4 for j in range(placeholders)
+            ],
+            "table": [make_table(rows, cols, seed=i * placeholders + j) for j in range(placeholders)],
+        }
+        if images:
+            slide["image"] = [
+                images[(i * placeholders + j) % len(images)] for j in range(placeholders)
+            ]
+        data.append(slide)
+    return data
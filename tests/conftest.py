@@ -0,0 +1,52 @@
+import pytest
+from pptx import Presentation
+
+
+def build_template(path):
+    """
+    Build a small template covering every placeholder kind.
+
+    Slides:
+        0: title + subtitle
+        1: title + two body text placeholders
+        2: title + picture + body text
+        3: title + two table placeholders
+    """
+    prs = Presentation()
+    layouts = prs.slide_layouts
+
+    # The default template has no table layout; turn "Two Content" into one
+    table_layout = layouts[3]
+    for ph in table_layout.placeholders:
+        if ph.placeholder_format.idx in (1, 2):
+            ph._element.ph.set("type", "tbl")
+
+    prs.slides.add_slide(layouts[0])
+    prs.slides.add_slide(layouts[4])
+    prs.slides.add_slide(layouts[8])
+    prs.slides.add_slide(table_layout)
+    prs.save(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def template_path(tmp_path_factory):
+    """Return the path of a synthetic template with all placeholder kinds."""
+    return str(build_template(tmp_path_factory.mktemp("template") / "template.pptx"))
+
+
+@pytest.fixture
+def deck_data():
+    """Return input data matching the synthetic template."""
+    return [
+        {"title": "Cover", "subtitle": "Subtitle"},
+        {"title": "Body", "bodytext": ["Left", "Right"]},
+        {"title": "Picture", "image": ["data/cat1.png"], "bodytext": "Caption"},
+        {
+            "title": "Tables",
+            "table": [
+                [["A", "B"], ["1", "2"]],
+                [["X", "Y", "Z"], ["10", "20", "30"]],
+            ],
+        },
+    ]
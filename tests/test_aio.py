@@ -0,0 +1,101 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from pptx import Presentation
+
+from autopptx.aio import DeckRenderer, render_deck
+from autopptx.Image.cache import image_cache
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool recording the highest number of concurrent tasks."""
+
+    def __init__(self):
+        super().__init__(max_workers=8)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        def run():
+            with self._lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.active -= 1
+
+        return super().submit(run)
+
+
+def test_render_deck(tmp_path, template_path, deck_data):
+    """Test rendering a deck from a coroutine."""
+    output = str(tmp_path / "out.pptx")
+    assert asyncio.run(render_deck(template_path, deck_data, output)) == output
+    assert Presentation(output).slides[0].shapes.title.text == "Cover"
+
+
+def test_images_prefetched_off_loop(tmp_path, template_path, deck_data):
+    """Test that images are read into the cache before the render step."""
+    image_cache.clear()
+    renderer = DeckRenderer()
+    asyncio.run(renderer.render(template_path, deck_data, str(tmp_path / "o.pptx")))
+
+    stats = image_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+
+def test_concurrency_limit(tmp_path, template_path, deck_data):
+    """Test that no more than max_concurrency decks render at once."""
+    executor = CountingExecutor()
+    renderer = DeckRenderer(max_concurrency=2, executor=executor)
+
+    async def render_all():
+        return await asyncio.gather(
+            *(
+                renderer.render(template_path, deck_data, str(tmp_path / f"d{i}.pptx"))
+                for i in range(6)
+            )
+        )
+
+    with executor:
+        outputs = asyncio.run(render_all())
+
+    assert len(outputs) == 6
+    assert 1 <= executor.peak <= 2
+
+
+def test_renderer_across_event_loops(tmp_path, template_path, deck_data):
+    """Test that a renderer keeps working when used from a second event loop."""
+    renderer = DeckRenderer(max_concurrency=1)
+
+    async def render_all(run):
+        return await asyncio.gather(
+            *(
+                renderer.render(template_path, deck_data, str(tmp_path / f"r{run}_{i}.pptx"))
+                for i in range(3)
+            )
+        )
+
+    for run in range(2):
+        assert len(asyncio.run(render_all(run))) == 3
+
+
+def test_process_executor(tmp_path, template_path, deck_data):
+    """Test rendering in a process pool."""
+    output = str(tmp_path / "out.pptx")
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        renderer = DeckRenderer(executor=executor)
+        asyncio.run(renderer.render(template_path, deck_data, output))
+    assert len(Presentation(output).slides) == 4
+
+
+def test_invalid_concurrency():
+    """Test that a concurrency limit below one is rejected."""
+    with pytest.raises(ValueError):
+        DeckRenderer(max_concurrency=0)
@@ -0,0 +1,156 @@
+import io
+import zipfile
+
+import pytest
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.util import Inches
+
+from autopptx.Text.texts import replace_title
+from autopptx.Type.modified import is_modified, mark_modified
+from autopptx.core import archive, writer
+from autopptx.core.archive import open_presentation, source_member
+from autopptx.core.cache import TemplateCache
+from autopptx.core.runner import process_presentation
+from autopptx.core.writer import save_presentation
+
+
+@pytest.fixture
+def media_template(template_path, tmp_path):
+    """Return a template whose first slide shows a picture."""
+    prs = Presentation(template_path)
+    prs.slides[0].shapes.add_picture("data/bunny1.png", 0, 0, Inches(1))
+    path = str(tmp_path / "media.pptx")
+    prs.save(path)
+    return path
+
+
+def _lazy_parts(prs):
+    return [part for part in prs.part.package.iter_parts() if source_member(part) is not None]
+
+
+def _contents(source):
+    with zipfile.ZipFile(source) as zipf:
+        return {name: zipf.read(name) for name in zipf.namelist()}
+
+
+def test_binary_parts_stay_in_archive(media_template, deck_data):
+    prs = open_presentation(media_template)
+    media = next(p for p in _lazy_parts(prs) if p.partname == "/ppt/media/image1.png")
+    assert media._loaded_blob is None
+    assert media.blob_size == len(media.blob)
+
+    output = process_presentation(media_template, deck_data, lazy_media=True)
+    reference = process_presentation(media_template, deck_data)
+    assert _contents(io.BytesIO(output)) == _contents(io.BytesIO(reference))
+
+    with zipfile.ZipFile(media_template) as template, zipfile.ZipFile(io.BytesIO(output)) as out:
+        source, copied = template.getinfo("ppt/media/image1.png"), out.getinfo("ppt/media/image1.png")
+        assert (copied.compress_type, copied.CRC, copied.compress_size) == (
+            source.compress_type, source.CRC, source.compress_size,
+        )
+
+
+def test_replaced_blob_is_written(media_template):
+    prs = open_presentation(media_template)
+    media = next(p for p in _lazy_parts(prs) if p.partname == "/ppt/media/image1.png")
+    with open("data/cat1.png", "rb") as f:
+        media.blob = f.read()
+    assert source_member(media) is None
+
+    stream = io.BytesIO()
+    report = save_presentation(prs, stream)
+    assert _contents(stream)["ppt/media/image1.png"] == media.blob
+    assert report["copied"] == len(_lazy_parts(prs))
+
+
+def test_template_cache_clones_share_archive(media_template, deck_data):
+    cache = TemplateCache(lazy_media=True)
+    first, second = cache.get(media_template), cache.get(media_template)
+    assert first.part.package.archive is second.part.package.archive
+
+    outputs = [process_presentation(media_template, deck_data, template_cache=cache) for _ in range(2)]
+    assert _contents(io.BytesIO(outputs[0])) == _contents(io.BytesIO(outputs[1]))
+
+
+def test_overwrite_template(media_template, deck_data):
+    """Test saving over the mapped template itself."""
+    expected = _contents(io.BytesIO(process_presentation(media_template, deck_data)))
+    process_presentation(media_template, deck_data, media_template, lazy_media=True)
+    assert _contents(media_template) == expected
+
+
+def test_bytes_source(media_template):
+    with open(media_template, "rb") as f:
+        prs = open_presentation(f.read())
+    assert _lazy_parts(prs) and len(prs.slides) == 4
+
+
+def test_only_changed_parts_are_written(template_path):
+    prs = open_presentation(template_path)
+    cover, body = prs.slides[0], prs.slides[1]
+    replace_title(cover, "Filled")
+    assert is_modified(cover.part) and not is_modified(body.part)
+
+    stream = io.BytesIO()
+    report = save_presentation(prs, stream)
+    assert report["copied"] == report["parts"] - 1
+    assert Presentation(stream).slides[0].shapes.title.text == "Filled"
+
+
+def test_unmarked_edits_are_saved(template_path):
+    """Test that python-pptx edits nobody marked are not lost."""
+    prs = open_presentation(template_path)
+    slide = prs.slides[1]
+    slide.shapes.title.text_frame.text = "Unmarked"
+    slide.shapes.add_textbox(0, 0, Inches(1), Inches(1)).text_frame.text = "Added"
+    assert not is_modified(slide.part)
+
+    stream = io.BytesIO()
+    report = save_presentation(prs, stream)
+    assert report["copied"] == report["parts"] - 1
+    saved = Presentation(stream).slides[1]
+    assert saved.shapes.title.text == "Unmarked"
+    assert [shape.text_frame.text for shape in saved.shapes][-1] == "Added"
+
+    mark_modified(slide)
+    assert save_presentation(prs, io.BytesIO())["copied"] == report["copied"]
+
+
+def test_changed_rels_are_written(template_path):
+    prs = open_presentation(template_path)
+    part = prs.slides[1].part
+    rId = part.relate_to("https://example.com", RT.HYPERLINK, is_external=True)
+    assert source_member(part) is None
+
+    stream = io.BytesIO()
+    save_presentation(prs, stream)
+    saved = Presentation(stream).slides[1].part
+    assert saved.rels[rId].target_ref == "https://example.com"
+
+
+def test_zipfile_internals_unchanged():
+    """Fails when zipfile changed: raw copies fall back to compressing again."""
+    assert writer._RAW_APPEND, "zipfile internals used by writer._append_raw changed"
+
+
+def test_copy_without_zipfile_internals(media_template, deck_data, monkeypatch):
+    reference = process_presentation(media_template, deck_data, lazy_media=True)
+    monkeypatch.setattr(writer, "_RAW_APPEND", False)
+    output = process_presentation(media_template, deck_data, lazy_media=True)
+    assert _contents(io.BytesIO(output)) == _contents(io.BytesIO(reference))
+
+
+def test_modified_parts_are_not_digested(template_path, monkeypatch):
+    prs = open_presentation(template_path)
+    cover = prs.slides[0]
+    replace_title(cover, "Filled")
+    digest = archive._xml_digest
+
+    def checked_digest(part):
+        assert part is not cover.part
+        return digest(part)
+
+    monkeypatch.setattr(archive, "_xml_digest", checked_digest)
+    report = save_presentation(prs, io.BytesIO())
+    assert report["copied"] == report["parts"] - 1
@@ -0,0 +1,110 @@
+import json
+import zipfile
+import pytest
+from pptx import Presentation
+
+from autopptx.core.batch import (
+    load_manifest,
+    iter_manifest,
+    read_manifest,
+    render_job,
+    run_batch,
+)
+
+
+@pytest.fixture
+def manifest(tmp_path, deck_data):
+    """Write two input files and a manifest referencing them."""
+    jobs = []
+    for i in range(2):
+        input_path = tmp_path / f"deck{i}.json"
+        data = [dict(slide) for slide in deck_data]
+        data[0]["title"] = f"Deck {i}"
+        input_path.write_text(json.dumps(data), encoding="utf-8")
+        jobs.append(
+            {"input": str(input_path), "output": str(tmp_path / "out" / f"deck{i}.pptx")}
+        )
+
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(jobs), encoding="utf-8")
+    return str(manifest_path)
+
+
+def test_load_manifest(manifest):
+    """Test that a valid manifest loads as a list of jobs."""
+    jobs = load_manifest(manifest)
+    assert len(jobs) == 2
+    assert all("input" in job and "output" in job for job in jobs)
+
+
+@pytest.mark.parametrize(
+    "bad_job",
+    [{"input": "a.json"}, {"output": "a.pptx"}, "not a job"],
+)
+def test_load_manifest_invalid(tmp_path, bad_job):
+    """Test that malformed jobs raise ValueError."""
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps([bad_job]), encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_manifest(str(path))
+
+
+def test_iter_manifest_inline_decks(tmp_path, deck_data, template_path):
+    """Test streaming a JSONL manifest with one inline deck per line."""
+    path = tmp_path / "manifest.jsonl"
+    lines = [
+        json.dumps({"slides": deck_data, "output": str(tmp_path / f"d{i}.pptx")})
+        for i in range(3)
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    jobs = read_manifest(str(path))
+    assert not isinstance(jobs, list)
+
+    results = run_batch(jobs, template_path, workers=2, retries=0)
+    assert [r["status"] for r in results] == ["ok", "ok", "ok"]
+    assert results[0]["input"] is None
+
+
+def test_iter_manifest_invalid_line(tmp_path):
+    """Test that a malformed line is reported when it is reached."""
+    path = tmp_path / "manifest.jsonl"
+    path.write_text('{"output": "a.pptx"}\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_manifest(str(path)))
+
+
+def test_render_job_reports_failure(tmp_path, template_path):
+    """Test that a missing input is reported, retried and never raised."""
+    job = {"input": str(tmp_path / "missing.json"), "output": str(tmp_path / "x.pptx")}
+    result = render_job(job, template_path, retries=2)
+
+    assert result["status"] == "failed"
+    assert result["attempts"] == 3
+    assert "FileNotFoundError" in result["error"]
+
+
+def test_run_batch(manifest, template_path):
+    """Test rendering every job of a manifest across worker processes."""
+    jobs = load_manifest(manifest)
+    results = run_batch(jobs, template_path, workers=2, retries=0)
+
+    assert [r["status"] for r in results] == ["ok", "ok"]
+    for i, result in enumerate(results):
+        prs = Presentation(result["output"])
+        assert prs.slides[0].shapes.title.text == f"Deck {i}"
+
+
+def test_run_batch_compression(manifest, template_path):
+    """Test that the save options reach the worker processes."""
+    jobs = load_manifest(manifest)
+    results = run_batch(
+        jobs, template_path, workers=1, retries=0, compresslevel=1, store_media=False
+    )
+
+    assert [r["status"] for r in results] == ["ok", "ok"]
+    for result in results:
+        with zipfile.ZipFile(result["output"]) as zipf:
+            infos = zipf.infolist()
+        media = [i for i in infos if i.filename.startswith("ppt/media/")]
+        assert media and all(i.compress_type == zipfile.ZIP_DEFLATED for i in media)
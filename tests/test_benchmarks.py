@@ -0,0 +1,31 @@
+import json
+from pptx import Presentation
+
+from autopptx.Type.layout import LayoutPlaceholderMap
+from benchmarks.run import STAGES, compare_results, main
+from benchmarks.synthetic import make_template
+
+
+def test_synthetic_template_slots(tmp_path):
+    """Test that the synthetic layout has M placeholders of each kind."""
+    prs = Presentation(make_template(str(tmp_path / "t.pptx"), slides=3, placeholders=2))
+    slots = LayoutPlaceholderMap(prs).slots(prs.slides[0].slide_layout)
+
+    assert len(prs.slides) == 3
+    assert len(slots["title"]) == 1
+    assert len(slots["subtitle"]) == 1
+    assert all(len(slots[kind]) == 2 for kind in ("bodytext", "image", "table"))
+
+
+def test_benchmark_results_and_compare(tmp_path):
+    """Test a tiny benchmark run end to end, including the comparison."""
+    baseline = tmp_path / "baseline.json"
+    args = ["--slides", "2", "--placeholders", "1", "--rows", "3", "--repeat", "1"]
+    assert main(args + ["--output", str(baseline)]) == 0
+
+    results = json.loads(baseline.read_text())
+    assert list(results["stages"]) == list(STAGES)
+    assert results["meta"]["output_bytes"] > 0
+
+    rows, regressed = compare_results(results, results)
+    assert len(rows) == len(STAGES) and not regressed
@@ -0,0 +1,87 @@
+import io
+import os
+import shutil
+import pytest
+from pptx import Presentation
+
+from autopptx.core.cache import TemplateCache
+from autopptx.core.runner import process_presentation
+
+
+def test_get_parses_once(template_path):
+    """Test that repeated gets hit the cache after the first parse."""
+    cache = TemplateCache()
+    cache.get(template_path)
+    cache.get(template_path)
+
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert template_path in cache
+
+
+def test_clones_are_independent(template_path):
+    """Test that editing one clone does not leak into the next one."""
+    cache = TemplateCache()
+    first = cache.get(template_path)
+    first.slides[0].shapes.title.text = "Edited"
+
+    second = cache.get(template_path)
+    assert second.slides[0].shapes.title.text == ""
+    assert len(second.slides) == len(first.slides)
+
+
+def test_clone_of_used_master(template_path, deck_data):
+    """Test that proxies python-pptx cached on the master are not carried into clones."""
+    cache = TemplateCache()
+    package, _ = cache._entry(template_path)
+    master = package.presentation_part.presentation
+    for slide in master.slides:
+        list(slide.placeholders)
+        list(slide.shapes)
+
+    content = process_presentation(template_path, deck_data, template_cache=cache)
+    deck = Presentation(io.BytesIO(content))
+    assert deck.slides[0].shapes.title.text == "Cover"
+    assert deck.slides[1].placeholders[1].text_frame.text == "Left"
+    assert master.slides[0].shapes.title.text == ""
+
+
+def test_lru_eviction(template_path, tmp_path):
+    """Test that the least recently used template is evicted."""
+    copies = []
+    for i in range(3):
+        path = str(tmp_path / f"t{i}.pptx")
+        shutil.copy(template_path, path)
+        copies.append(path)
+
+    cache = TemplateCache(maxsize=2)
+    for path in copies:
+        cache.get(path)
+
+    assert len(cache) == 2
+    assert copies[0] not in cache
+    assert copies[2] in cache
+
+
+def test_modified_template_is_reloaded(template_path, tmp_path):
+    """Test that a template with a new mtime replaces the stale entry."""
+    path = str(tmp_path / "t.pptx")
+    shutil.copy(template_path, path)
+
+    cache = TemplateCache()
+    cache.get(path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache.get(path)
+
+    assert cache.stats()["misses"] == 2
+    assert len(cache) == 1
+
+
+def test_invalid_arguments():
+    """Test that invalid constructor arguments raise ValueError."""
+    with pytest.raises(ValueError):
+        TemplateCache(maxsize=0)
+    with pytest.raises(ValueError):
+        TemplateCache(validate="size")
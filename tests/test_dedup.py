@@ -0,0 +1,116 @@
+import io
+import zipfile
+import pytest
+from pptx import Presentation
+from pptx.parts.image import ImagePart
+
+from autopptx.Image.image import replace_image
+from autopptx.Image.images import replace_images
+from autopptx.Image.dedup import get_image_store
+from autopptx.Type.find import find_placeholders
+
+IMG1 = "data/bunny1.png"
+IMG2 = "data/bunny2.png"
+
+
+@pytest.fixture
+def prs(template_path):
+    """Return the template with three extra picture slides."""
+    prs = Presentation(template_path)
+    for _ in range(3):
+        prs.slides.add_slide(prs.slide_layouts[8])
+    return prs
+
+
+def picture_slides(prs):
+    return [slide for slide in prs.slides if find_placeholders(slide, "image")]
+
+
+def image_parts(prs):
+    return [
+        p
+        for p in prs.part.package.iter_parts()
+        if isinstance(p, ImagePart) and p.partname.startswith("/ppt/media/")
+    ]
+
+
+def reload(prs):
+    stream = io.BytesIO()
+    prs.save(stream)
+    stream.seek(0)
+    return Presentation(stream)
+
+
+def test_same_image_stored_once(prs):
+    """Test that one image inserted on many slides shares a single part."""
+    for slide in picture_slides(prs):
+        replace_image(find_placeholders(slide, "image")[0], IMG1)
+
+    saved = reload(prs)
+    assert len(image_parts(saved)) == 1
+
+
+def test_blob_override_relinks_instead_of_overwriting(prs):
+    """Test that replacing a shared picture leaves the other slides intact."""
+    slides = picture_slides(prs)
+    pictures = [replace_image(find_placeholders(s, "image")[0], IMG1) for s in slides]
+    sha1_before = pictures[1].image.sha1
+
+    replace_image(pictures[0], IMG2)
+
+    assert pictures[0].image.sha1 != sha1_before
+    assert pictures[1].image.sha1 == sha1_before
+    assert len(image_parts(reload(prs))) == 2
+
+
+def test_unused_image_is_dropped(prs):
+    """Test that an image no longer shown anywhere is not saved."""
+    slide = picture_slides(prs)[0]
+    picture = replace_image(find_placeholders(slide, "image")[0], IMG1)
+    replace_image(picture, IMG2)
+
+    saved = reload(prs)
+    parts = image_parts(saved)
+    assert len(parts) == 1
+    assert parts[0].sha1 == get_image_store(prs.part.package).get_or_add(
+        picture.image
+    ).sha1
+
+
+def test_store_is_per_package(prs, template_path):
+    """Test that each package gets its own store."""
+    other = Presentation(template_path)
+    assert get_image_store(prs.part.package) is get_image_store(prs.part.package)
+    assert get_image_store(prs.part.package) is not get_image_store(other.part.package)
+
+
+def test_new_parts_named_without_walking_package(prs, monkeypatch):
+    """Test that naming new image parts does not walk the package again."""
+    package = prs.part.package
+    store = get_image_store(package)
+    monkeypatch.setattr(
+        type(package), "iter_parts", lambda self: pytest.fail("package walked")
+    )
+    slides = picture_slides(prs)
+    for slide, image in zip(slides, (IMG1, IMG2, "data/cat1.png")):
+        replace_image(find_placeholders(slide, "image")[0], image)
+    monkeypatch.undo()
+
+    names = [str(p.partname) for p in image_parts(prs)]
+    assert len(names) == len(set(names)) == len(store) == 3
+
+
+def test_names_after_python_pptx_pictures(prs):
+    """Test that images python-pptx adds itself never share a name with the store's."""
+    slide = picture_slides(prs)[0]
+    replace_images(slide, [IMG1])
+    prs.slides[0].shapes.add_picture("data/cat1.png", 0, 0)
+    replace_images(slide, [IMG2])
+
+    names = [str(p.partname) for p in prs.part.package.iter_parts()]
+    assert len(names) == len(set(names))
+    stream = io.BytesIO()
+    prs.save(stream)
+    with zipfile.ZipFile(stream) as zipf:
+        members = zipf.namelist()
+    assert len(members) == len(set(members))
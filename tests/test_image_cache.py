@@ -0,0 +1,85 @@
+import os
+import shutil
+import pytest
+from pptx import Presentation
+
+from autopptx.Image.cache import ImageFileCache, image_cache
+from autopptx.Image.image import replace_image
+from autopptx.Type.find import find_placeholders
+
+IMG1 = "data/bunny1.png"
+IMG2 = "data/bunny2.png"
+
+
+def test_hit_returns_same_image():
+    """Test that a second lookup is served from memory."""
+    cache = ImageFileCache()
+    first = cache.get(IMG1)
+    second = cache.get(os.path.abspath(IMG1))
+
+    assert second is first
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["bytes"] == os.path.getsize(IMG1)
+
+
+def test_changed_file_is_reread(tmp_path):
+    """Test that a file changed on disk is read again and replaces the old entry."""
+    path = tmp_path / "img.png"
+    shutil.copy(IMG1, path)
+    cache = ImageFileCache()
+    first = cache.get(str(path))
+
+    shutil.copy(IMG2, path)
+    os.utime(path, ns=(0, 0))
+    second = cache.get(str(path))
+
+    assert second.sha1 != first.sha1
+    assert len(cache) == 1
+    assert cache.nbytes == os.path.getsize(IMG2)
+
+
+def test_lru_eviction_by_bytes():
+    """Test that the least recently used image is evicted over budget."""
+    size1, size2 = os.path.getsize(IMG1), os.path.getsize(IMG2)
+    cache = ImageFileCache(max_bytes=max(size1, size2))
+    cache.get(IMG1)
+    cache.get(IMG2)
+
+    assert len(cache) == 1
+    assert cache.stats()["evictions"] == 1
+    cache.get(IMG2)
+    assert cache.stats()["hits"] == 1
+
+
+def test_oversized_image_not_cached():
+    """Test that an image larger than the budget is returned but not kept."""
+    cache = ImageFileCache(max_bytes=1)
+    assert cache.get(IMG1).blob
+    assert len(cache) == 0
+
+    cache.resize(10 * 1024 * 1024)
+    cache.get(IMG1)
+    assert len(cache) == 1
+    cache.resize(0)
+    assert len(cache) == 0
+
+
+def test_missing_file():
+    """Test that a missing file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        ImageFileCache().get("data/does_not_exist.png")
+    with pytest.raises(ValueError):
+        ImageFileCache(max_bytes=-1)
+
+
+def test_replace_image_uses_shared_cache(template_path):
+    """Test that replace_image reads each file once across decks."""
+    image_cache.clear()
+    for _ in range(3):
+        prs = Presentation(template_path)
+        replace_image(find_placeholders(prs.slides[2], "image")[0], IMG1)
+
+    stats = image_cache.stats()
+    assert (stats["misses"], stats["hits"]) == (1, 2)
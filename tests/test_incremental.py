@@ -0,0 +1,120 @@
+import os
+import json
+
+import pytest
+from pptx import Presentation
+
+from autopptx.Image.image import replace_image
+from autopptx.core import incremental
+from autopptx.core.incremental import fingerprint_path_for, render_incremental, slide_fingerprint
+from autopptx.Type.find import find_placeholders
+
+
+@pytest.fixture
+def output(tmp_path):
+    return str(tmp_path / "out.pptx")
+
+
+def test_fingerprint_ignores_unrendered_keys():
+    """Test that only rendered keys change the fingerprint."""
+    data = {"title": "A", "bodytext": ["x"]}
+    assert slide_fingerprint(data) == slide_fingerprint({**data, "notes": "ignored"})
+    assert slide_fingerprint(data) != slide_fingerprint({**data, "title": "B"})
+    assert slide_fingerprint(None) is None
+    assert slide_fingerprint({"image": [b"png"]}) != slide_fingerprint({"image": [b"jpg"]})
+
+
+def test_unchanged_slides_are_reused(template_path, deck_data, output):
+    """Test a full render, a no-op re-render, then a partial one."""
+    assert render_incremental(template_path, deck_data, output)["rendered"] == [0, 1, 2, 3]
+    assert render_incremental(template_path, deck_data, output) == {
+        "rendered": [],
+        "reused": [0, 1, 2, 3],
+    }
+
+    deck_data[0]["title"] = "New cover"
+    deck_data[2]["image"] = ["data/bunny1.png"]
+    result = render_incremental(template_path, deck_data, output)
+    assert result == {"rendered": [0, 2], "reused": [1, 3]}
+
+    prs = Presentation(output)
+    assert [slide.shapes.title.text for slide in prs.slides] == [
+        "New cover", "Body", "Picture", "Tables",
+    ]
+    picture = prs.slides[2]
+    assert len(find_placeholders(picture, "image")) == 1
+    # The old image is no longer related to the slide
+    image_rels = [rel for rel in picture.part.rels.values() if rel.reltype.endswith("/image")]
+    assert len(image_rels) == 1
+    assert len(find_placeholders(prs.slides[3], "table")) == 2
+
+
+def test_restore_relinked_template_image(template_path, deck_data, output, tmp_path):
+    """Test restoring a slide whose template picture an earlier run relinked."""
+    prs = Presentation(template_path)
+    replace_image(find_placeholders(prs.slides[2], "image")[0], "data/bunny2.png")
+    template = str(tmp_path / "picture_template.pptx")
+    prs.save(template)
+
+    render_incremental(template, deck_data, output)
+    for image, caption in (("data/cat1.png", "Same image"), ("data/bunny1.png", "New image")):
+        deck_data[2].update(image=[image], bodytext=caption)
+        assert render_incremental(template, deck_data, output)["rendered"] == [2]
+
+        part = Presentation(output).slides[2].part
+        refs = part._element.xpath("//@r:embed")
+        assert refs and all(rId in part.rels for rId in refs)
+        with open(image, "rb") as f:
+            assert part.related_part(refs[0]).blob == f.read()
+
+
+def test_full_render_when_sidecar_is_stale(template_path, deck_data, output):
+    """Test that a different template digest forces a full render."""
+    render_incremental(template_path, deck_data, output)
+    sidecar = fingerprint_path_for(output)
+    with open(sidecar, encoding="utf-8") as f:
+        fingerprints = json.load(f)
+    fingerprints["template"] = "0" * 40
+    with open(sidecar, "w", encoding="utf-8") as f:
+        json.dump(fingerprints, f)
+
+    assert render_incremental(template_path, deck_data, output)["reused"] == []
+
+
+def test_full_render_when_output_is_truncated(template_path, deck_data, output):
+    """Test that an unreadable previous output forces a full render."""
+    render_incremental(template_path, deck_data, output)
+    with open(output, "r+b") as f:
+        f.truncate(100)
+
+    assert render_incremental(template_path, deck_data, output)["reused"] == []
+    assert len(Presentation(output).slides) == len(deck_data)
+
+
+def test_failed_save_keeps_previous_output(template_path, deck_data, output, monkeypatch):
+    """Test that a save failing midway leaves the previous output and no stale sidecar."""
+    render_incremental(template_path, deck_data, output)
+    with open(output, "rb") as f:
+        previous = f.read()
+
+    def fail(prs, path, *args):
+        with open(path, "wb") as f:
+            f.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(incremental, "save_presentation_to", fail)
+    changed = [dict(data) for data in deck_data]
+    changed[0] = {**changed[0], "title": "Changed"}
+    with pytest.raises(OSError):
+        render_incremental(template_path, changed, output)
+
+    with open(output, "rb") as f:
+        assert f.read() == previous
+    assert sorted(os.listdir(os.path.dirname(output))) == sorted(
+        [os.path.basename(output), os.path.basename(fingerprint_path_for(output))]
+    )
+
+
+def test_requires_output_path(template_path, deck_data):
+    with pytest.raises(ValueError):
+        render_incremental(template_path, deck_data, None)
@@ -0,0 +1,120 @@
+import pytest
+from pptx import Presentation
+
+from autopptx.Type.find import find_placeholders
+from autopptx.Type.index import PlaceholderIndex, PLACEHOLDER_KINDS
+from autopptx.Type.layout import LayoutPlaceholderMap
+from autopptx.core.cache import TemplateCache
+from autopptx.Table.tables import replace_tables
+from autopptx.Image.images import replace_images
+
+
+@pytest.fixture
+def prs(template_path):
+    return Presentation(template_path)
+
+
+def shape_ids(shapes):
+    return [shape.shape_id for shape in shapes]
+
+
+@pytest.mark.parametrize("kind", PLACEHOLDER_KINDS)
+def test_index_matches_find_placeholders(prs, kind):
+    """Test that every bucket matches the result of a linear scan."""
+    for slide in prs.slides:
+        index = PlaceholderIndex(slide)
+        assert shape_ids(index.get(kind)) == shape_ids(find_placeholders(slide, kind))
+        assert shape_ids(find_placeholders(slide, kind, index=index)) == shape_ids(
+            index.get(kind)
+        )
+
+
+def test_index_by_idx(prs):
+    """Test direct lookup of a placeholder by its idx."""
+    index = PlaceholderIndex(prs.slides[0])
+    assert index.by_idx(0).shape_id == prs.slides[0].shapes.title.shape_id
+    assert index.by_idx(99) is None
+
+
+def test_index_invalid_kind(prs):
+    """Test that an unsupported kind raises ValueError."""
+    index = PlaceholderIndex(prs.slides[0])
+    with pytest.raises(ValueError):
+        index.get("unknown_type")
+
+
+def test_index_follows_inserted_tables(prs):
+    """Test that filling blank table placeholders keeps the index live."""
+    slide = prs.slides[3]
+    index = PlaceholderIndex(slide)
+    replace_tables(slide, [[["A", "B"], ["1", "2"]], [["X"], ["Y"]]], index=index)
+
+    tables = index.get("table")
+    assert len(tables) == 2
+    assert all(hasattr(shape, "table") for shape in tables)
+    assert tables[1].table.cell(1, 0).text == "Y"
+
+
+def test_index_follows_inserted_images(prs):
+    """Test that filling a blank picture placeholder keeps the index live."""
+    slide = prs.slides[2]
+    index = PlaceholderIndex(slide)
+    replace_images(slide, ["data/cat1.png"], index=index)
+
+    images = index.get("image")
+    assert len(images) == 1
+    assert hasattr(images[0], "image")
+
+
+@pytest.mark.parametrize("kind", PLACEHOLDER_KINDS)
+def test_layout_map_index_matches_find_placeholders(prs, kind):
+    """Test that layout-based lookup gives the same buckets as a scan."""
+    layout_map = LayoutPlaceholderMap(prs)
+    for slide in prs.slides:
+        index = layout_map.index(slide)
+        assert shape_ids(index.get(kind)) == shape_ids(find_placeholders(slide, kind))
+
+
+def test_layout_map_skips_shapes_without_text_frame(prs):
+    """Test that a picture at a body text idx is not indexed as body text."""
+    slide = prs.slides[2]
+    replace_images(slide, ["data/cat1.png"])
+    body = find_placeholders(slide, "bodytext")[0]
+    picture = find_placeholders(slide, "image")[0]
+    picture._element.ph.idx = body.placeholder_format.idx
+    body._element.getparent().remove(body._element)
+
+    index = LayoutPlaceholderMap(prs).index(slide)
+    assert index.get("bodytext") == []
+    assert shape_ids(find_placeholders(slide, "bodytext")) == []
+
+
+@pytest.mark.parametrize("kind", PLACEHOLDER_KINDS)
+def test_layout_map_follows_slide_placeholder_type(prs, kind):
+    """Test that a slide overriding its layout's placeholder type is classified by its own."""
+    body = find_placeholders(prs.slides[1], "bodytext")[0]
+    body._element.ph.set("type", "subTitle")
+
+    index = LayoutPlaceholderMap(prs).index(prs.slides[1])
+    assert shape_ids(index.get(kind)) == shape_ids(find_placeholders(prs.slides[1], kind))
+
+
+def test_layout_map_slots(prs):
+    """Test the ordered slots recorded for the table layout."""
+    layout_map = LayoutPlaceholderMap(prs)
+    slots = layout_map.slots(prs.slides[3].slide_layout)
+
+    assert slots["title"] == [0]
+    assert slots["table"] == [1, 2]
+    assert prs.slides[3].slide_layout in layout_map
+
+
+def test_layout_map_shared_by_cache_clones(template_path):
+    """Test that the cached layout map serves slides of every clone."""
+    cache = TemplateCache()
+    layout_map = cache.layout_map(template_path)
+    clone = cache.get(template_path)
+
+    assert cache.layout_map(template_path) is layout_map
+    index = layout_map.index(clone.slides[2])
+    assert len(index.get("image")) == 1
@@ -0,0 +1,51 @@
+import logging
+import subprocess
+import sys
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_CONNECTOR
+
+from autopptx.core.runner import process_presentation
+from autopptx.View.view import view_slide
+
+
+def test_import_has_no_logging_side_effects():
+    """Test that importing the package leaves the root logger untouched."""
+    code = (
+        "import logging, autopptx, autopptx.core.runner, autopptx.View.view;"
+        "assert not logging.getLogger().handlers;"
+        "assert logging.getLogger().level == logging.WARNING"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_single_structured_summary_per_deck(tmp_path, template_path, deck_data, caplog):
+    """Test that a deck logs one INFO summary and no per-shape INFO chatter."""
+    with caplog.at_level(logging.INFO, logger="autopptx"):
+        process_presentation(template_path, deck_data, str(tmp_path / "out.pptx"))
+
+    info = [r for r in caplog.records if r.levelno == logging.INFO]
+    assert len(info) == 1
+    summary = info[0].deck_summary
+    assert summary["slides"] == 4
+    assert summary["skipped"] == 0
+    assert summary["filled"] == {
+        "title": 4,
+        "subtitle": 1,
+        "bodytext": 2,
+        "image": 1,
+        "table": 1,
+    }
+    assert summary["save"]["parts"] > 0
+    assert summary["save"]["stored"] >= 1
+    assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+
+
+def test_unsupported_shapes_logged_at_debug(template_path, caplog):
+    """Test that viewing a slide with an unsupported shape logs no INFO."""
+    slide = Presentation(template_path).slides[0]
+    slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, 0, 0, 100, 100)
+    with caplog.at_level(logging.DEBUG, logger="autopptx"):
+        view_slide(slide)
+
+    assert [r.levelno for r in caplog.records] == [logging.DEBUG]
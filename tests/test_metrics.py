@@ -0,0 +1,67 @@
+import json
+
+from autopptx.core.metrics import NULL_METRICS, StageMetrics
+from autopptx.core.runner import process_presentation
+
+
+def test_process_presentation_records_stages(tmp_path, template_path, deck_data):
+    """Test that every stage is timed, counted and sized."""
+    metrics = StageMetrics()
+    output = tmp_path / "out.pptx"
+    process_presentation(template_path, deck_data, str(output), metrics=metrics)
+
+    stages = metrics.to_dict()["stages"]
+    for name in ("load_template", "index", "title", "image", "table", "table_style", "save"):
+        assert stages[name]["calls"] >= 1
+        assert stages[name]["seconds"] >= 0
+    assert stages["index"]["calls"] == 4
+    assert stages["save"]["bytes"] == output.stat().st_size
+    assert stages["image"]["bytes"] > 0
+
+    save = metrics.to_dict()["save"]
+    assert save["stored"] >= 1 and save["copied"] == 0
+    assert 0 < save["bytes"] < save["uncompressed_bytes"]
+
+
+def test_per_slide_breakdown(tmp_path, template_path, deck_data):
+    """Test the per-slide stage times."""
+    metrics = StageMetrics()
+    process_presentation(template_path, deck_data, str(tmp_path / "o.pptx"), metrics=metrics)
+
+    slides = metrics.to_dict()["slides"]
+    assert [s["slide"] for s in slides] == [0, 1, 2, 3]
+    assert "table" in slides[3] and "image" in slides[2]
+    assert "table" not in slides[0]
+
+    assert StageMetrics(per_slide=False).to_dict()["slides"] == []
+
+
+def test_exports():
+    """Test the JSON and Prometheus exports."""
+    metrics = StageMetrics()
+    with metrics.stage("save"):
+        pass
+    metrics.add_bytes("save", 10)
+
+    assert json.loads(metrics.to_json())["stages"]["save"]["bytes"] == 10
+    text = metrics.to_prometheus()
+    assert "# TYPE autopptx_stage_seconds_total counter" in text
+    assert 'autopptx_stage_calls_total{stage="save"} 1' in text
+    assert 'autopptx_stage_bytes_total{stage="save"} 10' in text
+
+    metrics.add_save_report(
+        {"parts": 5, "stored": 1, "copied": 2, "bytes": 30, "uncompressed_bytes": 90}
+    )
+    text = metrics.to_prometheus()
+    assert 'autopptx_save_parts_total{written="deflated"} 2' in text
+    assert 'autopptx_save_parts_total{written="copied"} 2' in text
+    assert 'autopptx_save_bytes_total{size="uncompressed"} 90' in text
+
+
+def test_null_metrics_is_inert():
+    """Test that the disabled stand-in records nothing."""
+    with NULL_METRICS.stage("save", slide=0):
+        pass
+    NULL_METRICS.add_bytes("save", 10)
+    assert not NULL_METRICS.enabled
+    assert not hasattr(NULL_METRICS, "stages")
@@ -0,0 +1,89 @@
+import io
+import json
+import os
+
+import pytest
+from pptx import Presentation
+
+from autopptx.Type.find import find_placeholders
+from autopptx.Type.index import PLACEHOLDER_KINDS, PlaceholderIndex
+from autopptx.Type.plan import FillPlan
+from autopptx.core.cache import TemplateCache, load_fill_plan
+from autopptx.core.runner import process_presentation
+
+
+def shape_ids(shapes):
+    return [shape.shape_id for shape in shapes]
+
+
+@pytest.fixture
+def prs(template_path):
+    return Presentation(template_path)
+
+
+def test_compiled_slots(prs):
+    """Test the slots recorded for the table slide."""
+    slots = FillPlan.compile(prs).slide_slots(3)
+
+    assert [(slot["idx"], slot["kind"]) for slot in slots] == [
+        (0, "title"), (1, "table"), (2, "table"),
+    ]
+    assert all(set(slot) == {"idx", "kind", "name"} for slot in slots)
+
+
+@pytest.mark.parametrize("kind", PLACEHOLDER_KINDS)
+def test_plan_index_matches_find_placeholders(prs, kind, monkeypatch):
+    """Test that a plan round-tripped through JSON indexes without classifying."""
+    plan = FillPlan.from_dict(json.loads(json.dumps(FillPlan.compile(prs).to_dict())))
+    monkeypatch.setattr(
+        PlaceholderIndex, "classify", staticmethod(lambda *args: pytest.fail("classified"))
+    )
+    for slide in prs.slides:
+        index = plan.index(slide)
+        assert shape_ids(index.get(kind)) == shape_ids(find_placeholders(slide, kind))
+
+
+def assert_filled(content):
+    deck = Presentation(io.BytesIO(content))
+    assert deck.slides[0].shapes.title.text == "Cover"
+    assert deck.slides[1].placeholders[1].text_frame.text == "Left"
+    tables = find_placeholders(deck.slides[3], "table")
+    assert len(tables) == 2
+    assert tables[0].table.cell(0, 1).text == "B"
+    assert tables[1].table.cell(1, 2).text == "30"
+
+
+def test_plan_cached_on_disk(template_path, deck_data, tmp_path):
+    """Test that plans are compiled once per template digest and reused."""
+    plan_dir = str(tmp_path / "plans")
+    plan = load_fill_plan(template_path, plan_dir)
+    (plan_file,) = os.listdir(plan_dir)
+    assert plan_file == f"{plan.template}.json"
+
+    cache = TemplateCache(plan_dir=plan_dir)
+    assert isinstance(cache.layout_map(template_path), FillPlan)
+    assert os.listdir(plan_dir) == [plan_file]
+
+    assert_filled(process_presentation(template_path, deck_data, plan=plan))
+
+
+@pytest.mark.parametrize("lazy_media", [False, True])
+def test_template_cache_compiles_plan(template_path, deck_data, tmp_path, lazy_media):
+    """Test rendering through a cache that compiles the plan of a new template."""
+    cache = TemplateCache(plan_dir=str(tmp_path / "plans"), lazy_media=lazy_media)
+    _, plan = cache.checkout(template_path)
+    assert isinstance(plan, FillPlan)
+    for _ in range(2):
+        assert_filled(process_presentation(template_path, deck_data, template_cache=cache))
+
+
+def test_unsupported_plan_version():
+    with pytest.raises(ValueError):
+        FillPlan.from_dict({"version": 0, "layouts": {}, "slides": []})
+
+
+def test_plan_of_other_template_rejected(template_path, deck_data):
+    """Test that a plan compiled from another template is refused."""
+    plan = FillPlan.compile(Presentation(template_path), template="0" * 40)
+    with pytest.raises(ValueError):
+        process_presentation(template_path, deck_data, plan=plan)
@@ -0,0 +1,78 @@
+import json
+import pytest
+from pptx import Presentation
+
+from autopptx.core.runner import (
+    iter_input_data,
+    read_input_data,
+    main,
+    process_presentation,
+)
+
+
+@pytest.fixture
+def jsonl_input(tmp_path, deck_data):
+    """Write the deck data as JSON Lines, with a blank line in between."""
+    path = tmp_path / "deck.jsonl"
+    lines = [json.dumps(slide) for slide in deck_data]
+    lines.insert(1, "")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_iter_input_data_is_lazy(jsonl_input, deck_data):
+    """Test that slides are yielded one by one, skipping blank lines."""
+    stream = iter_input_data(jsonl_input)
+    assert next(stream) == deck_data[0]
+    assert list(stream) == deck_data[1:]
+
+
+def test_iter_input_data_rejects_non_objects(tmp_path):
+    """Test that a line holding something other than an object raises."""
+    path = tmp_path / "bad.jsonl"
+    path.write_text('{"title": "ok"}\n[1, 2]\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_input_data(str(path)))
+
+
+def test_read_input_data_dispatch(jsonl_input, tmp_path, deck_data):
+    """Test that .jsonl files are streamed and .json files loaded."""
+    json_path = tmp_path / "deck.json"
+    json_path.write_text(json.dumps(deck_data), encoding="utf-8")
+
+    assert isinstance(read_input_data(str(json_path)), list)
+    assert not isinstance(read_input_data(jsonl_input), list)
+
+
+def test_process_presentation_from_generator(template_path, jsonl_input, tmp_path):
+    """Test rendering a deck straight from a streamed JSONL input."""
+    output = str(tmp_path / "out.pptx")
+    process_presentation(template_path, iter_input_data(jsonl_input), output)
+
+    prs = Presentation(output)
+    assert prs.slides[0].shapes.title.text == "Cover"
+    assert prs.slides[3].shapes[1].table.cell(1, 1).text == "2"
+
+
+def test_process_presentation_short_input(template_path, tmp_path):
+    """Test that slides without input data are left untouched."""
+    output = str(tmp_path / "out.pptx")
+    process_presentation(template_path, iter([{"title": "Only one"}]), output)
+
+    prs = Presentation(output)
+    assert prs.slides[0].shapes.title.text == "Only one"
+    assert prs.slides[1].shapes.title.text == ""
+
+
+@pytest.mark.parametrize("option", [["--lazy-media"], ["--plan-cache", "plans"]])
+def test_main_rejects_incremental_options(option):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--incremental"] + option)
+    assert excinfo.value.code == 2
+
+
+@pytest.mark.parametrize("option", [["--metrics", "m.json"], ["--incremental"]])
+def test_main_rejects_batch_options(option):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--batch", "manifest.json"] + option)
+    assert excinfo.value.code == 2
@@ -0,0 +1,81 @@
+import io
+import os
+
+import pytest
+from pptx import Presentation
+
+from autopptx.aio import render_deck
+from autopptx.core.cache import TemplateCache
+from autopptx.core.runner import process_presentation
+from autopptx.core.streams import read_source
+from autopptx.Image.images import replace_images
+from autopptx.Type.find import find_placeholders
+
+
+@pytest.fixture
+def template_bytes(template_path):
+    with open(template_path, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def in_memory_deck(deck_data):
+    """Return the deck data with its image given as bytes."""
+    with open("data/cat1.png", "rb") as f:
+        deck_data[2]["image"] = [f.read()]
+    return deck_data
+
+
+def test_render_to_bytes(template_bytes, in_memory_deck, tmp_path, monkeypatch):
+    """Test an end-to-end render from bytes to bytes without filesystem writes."""
+    monkeypatch.chdir(tmp_path)
+    content = process_presentation(template_bytes, in_memory_deck)
+
+    assert isinstance(content, bytes)
+    assert os.listdir(tmp_path) == []
+    prs = Presentation(io.BytesIO(content))
+    assert prs.slides[0].shapes.title.text == "Cover"
+    assert find_placeholders(prs.slides[2], "image")[0].image.ext == "png"
+
+
+def test_render_stream_to_stream(template_bytes, deck_data):
+    """Test reading the template from a stream and writing to another."""
+    output = io.BytesIO()
+    result = process_presentation(io.BytesIO(template_bytes), deck_data, output)
+
+    assert result is None
+    assert len(Presentation(io.BytesIO(output.getvalue())).slides) == 4
+
+
+def test_template_cache_bytes(template_bytes, deck_data):
+    """Test that templates given as bytes are cached by content."""
+    cache = TemplateCache()
+    first = process_presentation(template_bytes, deck_data, template_cache=cache)
+    process_presentation(io.BytesIO(template_bytes), deck_data, template_cache=cache)
+
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+    assert template_bytes in cache
+    assert first[:2] == b"PK"
+
+
+def test_image_streams(template_path):
+    """Test inserting images given as a binary stream."""
+    slide = Presentation(template_path).slides[2]
+    with open("data/bunny1.png", "rb") as f:
+        replace_images(slide, f)
+    assert hasattr(find_placeholders(slide, "image")[0], "image")
+
+
+def test_aio_render_to_bytes(template_bytes, in_memory_deck):
+    """Test the asyncio front-end returning bytes."""
+    import asyncio
+
+    content = asyncio.run(render_deck(template_bytes, in_memory_deck))
+    assert len(Presentation(io.BytesIO(content)).slides) == 4
+
+
+def test_read_source_rejects_unknown_types():
+    """Test that unsupported sources raise TypeError."""
+    with pytest.raises(TypeError):
+        read_source(42)
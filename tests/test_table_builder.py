@@ -0,0 +1,78 @@
+import io
+import time
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from autopptx.Table.builder import build_table
+from autopptx.Table.table import insert_table, replace_table
+from autopptx.Type.find import find_placeholders
+
+
+@pytest.fixture
+def table_placeholder(template_path):
+    """Return the first (blank) table placeholder of the table slide."""
+    prs = Presentation(template_path)
+    return find_placeholders(prs.slides[3], "table")[0]
+
+
+def reload(shape):
+    stream = io.BytesIO()
+    shape.part.package.presentation_part.presentation.save(stream)
+    stream.seek(0)
+    return Presentation(stream)
+
+
+def test_insert_table_matches_python_pptx(template_path):
+    """Test that rows, heights and text match python-pptx's insert_table."""
+    data = [["A", "B", "C"], ["1", "2", "3"], ["x", "y", "z"]]
+    expected = find_placeholders(Presentation(template_path).slides[3], "table")[0]
+    expected = expected.insert_table(3, 3).table
+    for i, row in enumerate(data):
+        for j, value in enumerate(row):
+            expected.cell(i, j).text = value
+
+    placeholder = find_placeholders(Presentation(template_path).slides[3], "table")[0]
+    table = insert_table(placeholder, data).table
+
+    assert [r.height for r in table.rows] == [r.height for r in expected.rows]
+    assert [c.width for c in table.columns] == [c.width for c in expected.columns]
+    for i, row in enumerate(data):
+        assert [table.cell(i, j).text for j in range(3)] == row
+
+
+def test_cell_text_is_escaped(table_placeholder):
+    """Test that markup characters and line breaks survive a save."""
+    data = [["<b>&amp;</b>", "a & b"], ["line1\nline2", "tab\there"]]
+    shape = replace_table(table_placeholder, data)
+    replace_table(shape, data)
+
+    saved = reload(shape)
+    table = find_placeholders(saved.slides[3], "table")[0].table
+    assert table.cell(0, 0).text == "<b>&amp;</b>"
+    assert table.cell(0, 1).text == "a & b"
+    assert table.cell(1, 0).text == "line1\nline2"
+    assert len(table.cell(1, 0).text_frame.paragraphs) == 2
+    assert table.cell(1, 1).text == "tab\there"
+
+
+def test_build_table_pads_short_rows():
+    """Test that ragged rows are padded to the widest row."""
+    tbl = build_table([["A", "B", "C"], ["1"]], Inches(1), Inches(0.25))
+
+    assert len(tbl.tblGrid.gridCol_lst) == 3
+    assert [len(tr.tc_lst) for tr in tbl.tr_lst] == [3, 3]
+    assert all(tr.h == Inches(0.25) for tr in tbl.tr_lst)
+
+
+def test_large_table_is_linear(table_placeholder):
+    """Test that a 10k-row table is built in reasonable time."""
+    data = [[f"r{i}", str(i), "&"] for i in range(10000)]
+    start = time.perf_counter()
+    shape = replace_table(table_placeholder, data)
+    replace_table(shape, data)
+    elapsed = time.perf_counter() - start
+
+    assert len(shape.table.rows) == 10000
+    assert shape.table.cell(9999, 0).text == "r9999"
+    assert elapsed < 10
@@ -0,0 +1,86 @@
+import pytest
+from pptx import Presentation
+
+from autopptx.Table.table import insert_table, replace_table
+from autopptx.Table.tables import replace_tables
+from autopptx.Type.find import find_placeholders
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from autopptx.Table.frame import format_table  # noqa: E402
+
+
+@pytest.fixture
+def slide(template_path):
+    """Return the slide with two blank table placeholders."""
+    return Presentation(template_path).slides[3]
+
+
+def cell_texts(table):
+    return [[cell.text for cell in row.cells] for row in table.rows]
+
+
+def test_format_dataframe_columns():
+    """Test per-column formats, precision and missing values."""
+    df = pd.DataFrame(
+        {
+            "name": ["a", None],
+            "count": pd.Series([1, None], dtype="Int64"),
+            "ratio": [0.1234, np.nan],
+            "share": [50.0, 25.0],
+        }
+    )
+    table = format_table(df, formats={"share": "%.0f%%"}, precision=2, na_rep="-")
+
+    assert table.shape == (3, 4)
+    assert [list(row) for row in table] == [
+        ["name", "count", "ratio", "share"],
+        ["a", "1", "0.12", "50%"],
+        ["-", "-", "-", "25%"],
+    ]
+
+
+def test_format_array_with_header():
+    """Test formatting a 2D array with a header row and a callable format."""
+    table = format_table(
+        np.array([[1.5, 2.0], [3.25, np.nan]]),
+        header=["x", "y"],
+        formats={1: lambda v: f"<{v:g}>"},
+    )
+    assert [list(row) for row in table] == [["x", "y"], ["1.5", "<2>"], ["3.25", ""]]
+
+
+def test_format_dataframe_index():
+    """Test writing the index as the first column."""
+    df = pd.DataFrame({"v": [1, 2]}, index=pd.Index(["r1", "r2"], name="row"))
+    assert [list(row) for row in format_table(df, index=True)] == [
+        ["row", "v"],
+        ["r1", "1"],
+        ["r2", "2"],
+    ]
+
+
+def test_insert_and_replace_dataframe(slide):
+    """Test filling a blank placeholder, then rebuilding it from a DataFrame."""
+    placeholder = find_placeholders(slide, "table")[0]
+    shape = insert_table(placeholder, pd.DataFrame({"A": [1, 2], "B": ["x", "<y>"]}))
+    assert cell_texts(shape.table) == [["A", "B"], ["1", "x"], ["2", "<y>"]]
+
+    replace_table(shape, np.arange(6).reshape(2, 3))
+    assert cell_texts(shape.table) == [["0", "1", "2"], ["3", "4", "5"]]
+
+
+def test_replace_tables_mixed(slide):
+    """Test that lists, arrays and DataFrames can be mixed on one slide."""
+    replace_tables(slide, [[["A"], ["1"]], pd.DataFrame({"X": [1.0]})])
+
+    tables = find_placeholders(slide, "table")
+    assert cell_texts(tables[1].table) == [["X"], ["1.0"]]
+
+
+def test_empty_dataframe_rejected(slide):
+    """Test that an empty DataFrame is rejected like an empty list."""
+    placeholder = find_placeholders(slide, "table")[0]
+    with pytest.raises(ValueError):
+        insert_table(placeholder, pd.DataFrame())
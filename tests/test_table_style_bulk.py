@@ -0,0 +1,99 @@
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.util import Pt
+
+from autopptx.Table.style import (
+    ALIGN_MAP,
+    set_table_cell,
+    set_table_style,
+    transfer_table_style,
+)
+from autopptx.Table.tables import replace_tables
+from autopptx.Type.find import find_placeholders
+
+STYLE = dict(
+    font_name="Arial",
+    font_size=14,
+    bold=True,
+    italic=False,
+    font_color=(255, 255, 255),
+    align="right",
+    bg_color=(30, 144, 255),
+)
+
+
+@pytest.fixture
+def tables(template_path):
+    """Return the two filled tables of the table slide."""
+    slide = Presentation(template_path).slides[3]
+    data = [["A", "B", ""], ["1", "2\nline", "3"]]
+    replace_tables(slide, [data, [row[:] for row in data]])
+    return find_placeholders(slide, "table")
+
+
+def style_with_setters(cell, font_name, font_size, bold, italic, font_color, align, bg_color):
+    """Reference implementation: one python-pptx setter per property."""
+    for paragraph in cell.text_frame.paragraphs:
+        run = paragraph.runs[0] if paragraph.runs else paragraph.add_run()
+        font = run.font
+        font.name = font_name
+        font.size = Pt(font_size)
+        font.bold = bold
+        font.italic = italic
+        font.color.rgb = RGBColor(*font_color)
+        paragraph.alignment = ALIGN_MAP[align]
+    if bg_color:
+        cell.fill.solid()
+        cell.fill.fore_color.rgb = RGBColor(*bg_color)
+
+
+def xml(shape):
+    return etree.tostring(shape.table._tbl)
+
+
+def test_set_table_style_matches_setters(tables):
+    """Test that stamping produces the same XML as per-property setters."""
+    expected, actual = tables
+    for row in expected.table.rows:
+        for cell in row.cells:
+            style_with_setters(cell, **STYLE)
+
+    set_table_style(actual, **STYLE)
+    assert xml(actual) == xml(expected)
+
+    # Restyling merges into the existing run properties
+    set_table_style(actual, **dict(STYLE, font_color=(0, 0, 0), bg_color=(1, 2, 3)))
+    for row in expected.table.rows:
+        for cell in row.cells:
+            style_with_setters(cell, **dict(STYLE, font_color=(0, 0, 0), bg_color=(1, 2, 3)))
+    assert xml(actual) == xml(expected)
+
+
+def test_set_table_cell_keeps_run_attributes(tables):
+    """Test that existing run attributes such as lang survive styling."""
+    cell = tables[0].table.cell(0, 0)
+    cell.text_frame.paragraphs[0].runs[0]._r.get_or_add_rPr().set("lang", "de-DE")
+
+    set_table_cell(cell, **STYLE)
+    rPr = cell.text_frame.paragraphs[0].runs[0]._r.rPr
+    assert rPr.get("lang") == "de-DE"
+    assert cell.text_frame.paragraphs[0].runs[0].font.size == Pt(14)
+
+
+def test_transfer_table_style_full(tables):
+    """Test per-cell transfer through the shared prototypes."""
+    src, dst = tables
+    set_table_style(src, **STYLE)
+    set_table_cell(src.table.cell(1, 1), **dict(STYLE, bold=False))
+
+    transfer_table_style(src, dst)
+    assert dst.table.cell(0, 0).text_frame.paragraphs[0].runs[0].font.bold is True
+    assert dst.table.cell(1, 1).text_frame.paragraphs[0].runs[0].font.bold is False
+
+
+def test_invalid_align(tables):
+    """Test that an unknown alignment is rejected."""
+    with pytest.raises(ValueError):
+        set_table_style(tables[0], align="middle")
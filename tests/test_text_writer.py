@@ -0,0 +1,134 @@
+from copy import deepcopy
+
+import logging
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Pt
+
+from autopptx.Text.style import set_textbox_style
+from autopptx.Text.text import replace_bodytext
+from autopptx.Text.texts import replace_bodytexts
+from autopptx.Text.writer import write_paragraphs, write_text
+from autopptx.Type.find import find_placeholders
+
+
+@pytest.fixture
+def body(template_path):
+    """Return the first body placeholder, with a formatted first run."""
+    slide = Presentation(template_path).slides[1]
+    shape = find_placeholders(slide, "bodytext")[0]
+    paragraph = shape.text_frame.paragraphs[0]
+    paragraph.level = 1
+    run = paragraph.add_run()
+    run.text = "template"
+    run.font.size = Pt(20)
+    run.font.bold = True
+    return shape
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["plain", "two\nlines", "soft\vbreak", "\nleading", "bell\x07 & <tag>", ""],
+)
+def test_same_text_as_python_pptx(template_path, text):
+    """Test that the text read back matches python-pptx's paragraph setter."""
+    slide = Presentation(template_path).slides[1]
+    ours, reference = find_placeholders(slide, "bodytext")
+    write_text(ours, text)
+    reference.text_frame.clear()
+    reference.text_frame.paragraphs[0].text = text
+
+    assert ours.text_frame.text == reference.text_frame.text
+    assert len(ours.text_frame.paragraphs) == 1
+
+
+def test_formatting_kept_on_every_paragraph(body):
+    """Test that pPr and rPr of the first paragraph are copied to all paragraphs."""
+    assert write_text(body, (f"Paragraph {i}" for i in range(100))) == 100
+
+    paragraphs = body.text_frame.paragraphs
+    assert len(paragraphs) == 100
+    assert paragraphs[99].text == "Paragraph 99"
+    assert all(p.level == 1 for p in paragraphs)
+    font = paragraphs[50].runs[0].font
+    assert font.size == Pt(20) and font.bold
+
+
+def test_empty_iterable_leaves_one_paragraph(body):
+    assert write_paragraphs(body._element.txBody, iter(())) == 0
+    assert len(body.text_frame.paragraphs) == 1
+    assert body.text_frame.paragraphs[0].level == 1
+    assert body.text_frame.text == ""
+
+
+def test_replace_bodytext_logs_non_str_values(body, caplog):
+    """Test that debug logging copes with values that have no length."""
+    with caplog.at_level(logging.DEBUG, logger="autopptx"):
+        replace_bodytext(body, 42)
+    assert body.text_frame.text == "42"
+    assert "1 paragraph(s) from int" in caplog.text
+
+
+def test_replace_bodytexts_streams_generator(body):
+    """Test that a generator fills a single text box."""
+    slide = body.part.slide
+    replace_bodytexts(
+        slide, (str(i) for i in range(3)), distribute_to_multiple_boxes=False
+    )
+    assert [p.text for p in body.text_frame.paragraphs] == ["0", "1", "2"]
+
+
+@pytest.fixture
+def levels(body):
+    """Give the body placeholder a second, level-2 paragraph with its own font."""
+    paragraph = body.text_frame.add_paragraph()
+    paragraph.level = 2
+    run = paragraph.add_run()
+    run.text = "nested"
+    run.font.italic = True
+    return body
+
+
+def test_per_level_prototypes(levels):
+    """Test that each paragraph takes the formatting of its level."""
+    write_text(
+        levels,
+        [
+            {"text": "top", "level": 1},
+            {"text": "nested", "level": 2},
+            {"text": "new level", "level": 3},
+            "plain",
+        ],
+    )
+    top, nested, new, plain = levels.text_frame.paragraphs
+
+    assert top.runs[0].font.bold and not nested.runs[0].font.bold
+    assert nested.level == 2 and nested.runs[0].font.italic
+    # Levels without a prototype derive from the first paragraph
+    assert new.level == 3 and new.runs[0].font.size == Pt(20)
+    assert plain.level == 1 and plain.runs[0].font.bold
+
+
+def test_style_stamped_like_set_textbox_style(template_path, levels):
+    """Test that a style gives the same XML as filling then restyling."""
+    style = dict(font_name="Arial", font_size=24, bold=False, font_color=(255, 0, 0), align="center")
+    texts = ["one", "two\nlines", "three"]
+
+    reference = find_placeholders(levels.part.slide, "bodytext")[1]
+    reference._element.txBody.getparent().replace(
+        reference._element.txBody, deepcopy(levels._element.txBody)
+    )
+    write_text(reference, texts)
+    set_textbox_style(reference, **style)
+    write_text(levels, texts, style=style)
+
+    for ours, theirs in zip(levels.text_frame.paragraphs, reference.text_frame.paragraphs):
+        assert etree.tostring(ours._p.pPr) == etree.tostring(theirs._p.pPr)
+        assert etree.tostring(ours.runs[0]._r.rPr) == etree.tostring(theirs.runs[0]._r.rPr)
+
+
+def test_invalid_style_align(body):
+    with pytest.raises(ValueError):
+        write_text(body, "x", style={"align": "middle"})
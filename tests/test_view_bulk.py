@@ -0,0 +1,86 @@
+import io
+import os
+import json
+
+import pytest
+from pptx import Presentation
+
+from autopptx.core.runner import process_presentation
+from autopptx.View import bulk
+from autopptx.View.bulk import view_deck, view_many, view_presentation, write_ndjson
+from autopptx.View.view import classify_shape
+from autopptx.Type.type import is_bodytext, is_image, is_subtitle, is_table, is_text, is_title
+
+
+@pytest.fixture
+def deck(template_path, deck_data, tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    process_presentation(template_path, deck_data, path)
+    return path
+
+
+def _chain(shape):
+    """The classification view_slide used to do with is_* checks."""
+    if is_table(shape):
+        return "table"
+    if is_image(shape):
+        return "image"
+    if is_text(shape):
+        if is_title(shape):
+            return "title"
+        if is_subtitle(shape):
+            return "subtitle"
+        if is_bodytext(shape):
+            return "bodytext"
+        return "text"
+    return None
+
+
+def test_classify_matches_is_checks(deck, template_path):
+    for path in (deck, template_path):
+        for slide in Presentation(path).slides:
+            for shape in slide.shapes:
+                assert classify_shape(shape) == _chain(shape)
+
+
+def test_view_presentation(deck):
+    slides = list(view_presentation(deck))
+
+    assert [s["slide"] for s in slides] == [0, 1, 2, 3]
+    assert slides[0]["shapes"][0] == {"index": 0, "type": "title", "content": "Cover"}
+    image = next(s for s in slides[2]["shapes"] if s["type"] == "image")
+    assert image["content"]["ext"] == "png" and len(image["content"]["sha1"]) == 40
+    tables = [s["content"] for s in slides[3]["shapes"] if s["type"] == "table"]
+    assert tables == [[["A", "B"], ["1", "2"]], [["X", "Y", "Z"], ["10", "20", "30"]]]
+
+
+def test_empty_placeholders_have_no_content(template_path):
+    """Test that unfilled table/picture placeholders do not raise."""
+    shapes = [s for slide in view_presentation(template_path) for s in slide["shapes"]]
+    assert {s["type"] for s in shapes} >= {"image", "table"}
+    assert all(s["content"] is None for s in shapes if s["type"] in ("image", "table"))
+
+
+def test_view_many_ndjson(deck, tmp_path):
+    """Test streaming several decks through a pool into NDJSON."""
+    missing = str(tmp_path / "missing.pptx")
+    stream = io.StringIO()
+    count = write_ndjson(view_many([deck, deck, missing], workers=2), stream)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert count == len(records) == 3
+    assert sorted(r["error"] is None for r in records) == [False, True, True]
+    assert next(r for r in records if r["path"] == deck)["slides"] == view_deck(deck)["slides"]
+
+
+def _crash(path, image_dir, scan):
+    os._exit(1)
+
+
+def test_view_many_survives_dead_worker(deck, monkeypatch):
+    """Test that a worker dying reports its decks instead of aborting."""
+    monkeypatch.setattr(bulk, "view_deck", _crash)
+    records = list(view_many([deck, deck], workers=2))
+
+    assert [r["path"] for r in records] == [deck, deck]
+    assert all(r["slides"] is None and "BrokenProcessPool" in r["error"] for r in records)
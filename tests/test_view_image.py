@@ -0,0 +1,50 @@
+import os
+
+import pytest
+from pptx import Presentation
+
+from autopptx.core.runner import process_presentation
+from autopptx.View.view import ImageHandle, get_image, view_slide
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def picture_slides(template_path, deck_data, tmp_path):
+    """The picture slides of two decks showing the same picture."""
+    slides = []
+    for name in ("first.pptx", "second.pptx"):
+        path = str(tmp_path / name)
+        process_presentation(template_path, deck_data, path)
+        slides.append(Presentation(path).slides[2])
+    return slides
+
+
+def _image_item(slide, **kwargs):
+    return next(item for item in view_slide(slide, **kwargs) if item["type"] == "image")
+
+
+def test_view_slide_returns_lazy_handle(picture_slides, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    before = sorted(os.listdir(tmp_path))
+    handle = _image_item(picture_slides[0])["content"]
+
+    assert isinstance(handle, ImageHandle)
+    with open(os.path.join(ROOT, "data", "cat1.png"), "rb") as f:
+        blob = f.read()
+    assert handle.blob == blob and handle.size == len(blob)
+    assert handle.ext == "png" and handle.content_type == "image/png"
+    assert handle.to_dict() == {"sha1": handle.sha1, "ext": "png", "size": len(blob)}
+    assert sorted(os.listdir(tmp_path)) == before
+
+
+def test_saved_images_are_content_addressed(picture_slides, tmp_path):
+    image_dir = str(tmp_path / "images")
+    first = _image_item(picture_slides[0], image_dir=image_dir)["content"]
+    second = _image_item(picture_slides[1], image_dir=image_dir)["content"]
+
+    assert first == second
+    assert os.listdir(image_dir) == [os.path.basename(first)]
+    shape = next(s for s in picture_slides[0].shapes if hasattr(s, "image"))
+    assert get_image(shape, output_dir=image_dir) == first
+    assert os.path.basename(first) == f"{shape.image.sha1}.png"
@@ -0,0 +1,68 @@
+import io
+import zipfile
+
+import pytest
+from pptx import Presentation
+
+from autopptx.core.runner import process_presentation
+from autopptx.View.bulk import view_many, view_presentation
+from autopptx.View.scan import scan_placeholders, scan_presentation
+
+
+@pytest.fixture
+def deck(template_path, deck_data, tmp_path):
+    deck_data[0]["subtitle"] = "Two\nlines"
+    deck_data[1]["bodytext"] = ["Left\vbreak", "Right"]
+    path = str(tmp_path / "deck.pptx")
+    process_presentation(template_path, deck_data, path)
+    return path
+
+
+def test_scan_matches_view_presentation(deck, template_path):
+    for path in (deck, template_path):
+        scanned, viewed = list(scan_presentation(path)), list(view_presentation(path))
+        for scanned_slide, viewed_slide in zip(scanned, viewed):
+            for a, b in zip(scanned_slide["shapes"], viewed_slide["shapes"]):
+                if a["type"] == "image" and a["content"] is not None:
+                    assert a["content"]["ext"] == b["content"]["ext"]
+                    assert a["content"]["size"] == b["content"]["size"]
+                    a, b = dict(a, content=None), dict(b, content=None)
+                assert a == b
+        assert len(scanned) == len(viewed)
+
+
+def test_scan_never_reads_media(deck, monkeypatch):
+    opened = []
+    original = zipfile.ZipFile.open
+
+    def spy(self, name, *args, **kwargs):
+        opened.append(name if isinstance(name, str) else name.filename)
+        return original(self, name, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", spy)
+    slides = list(scan_presentation(deck))
+
+    image = next(s for s in slides[2]["shapes"] if s["type"] == "image")
+    assert image["content"]["part"].startswith("/ppt/media/")
+    assert not any(name.startswith("ppt/media/") for name in opened)
+
+
+def test_scan_sources_and_placeholders(deck):
+    with open(deck, "rb") as f:
+        blob = f.read()
+    assert list(scan_presentation(blob)) == list(scan_presentation(io.BytesIO(blob)))
+
+    placeholders = list(scan_placeholders(deck))
+    slide = Presentation(deck).slides[2]
+    assert [p["idx"] for p in placeholders[2]["placeholders"]] == [
+        ph.placeholder_format.idx for ph in slide.placeholders
+    ]
+    assert [p["type"] for p in placeholders[2]["placeholders"]] == ["title", "pic", "body"]
+
+
+def test_view_many_scan(deck):
+    record = next(view_many([deck], workers=1, scan=True))
+    assert record["error"] is None
+    assert record["slides"] == list(scan_presentation(deck))
+    with pytest.raises(ValueError):
+        view_many([deck], scan=True, image_dir="images")
@@ -0,0 +1,62 @@
+import io
+import zipfile
+
+import pytest
+from pptx import Presentation
+
+from autopptx.core.runner import process_presentation
+from autopptx.core.writer import save_presentation
+
+
+@pytest.fixture
+def rendered(template_path, deck_data):
+    """Return a rendered deck holding a PNG image."""
+    return Presentation(io.BytesIO(process_presentation(template_path, deck_data)))
+
+
+def _members(stream):
+    with zipfile.ZipFile(stream) as zipf:
+        return {info.filename: info for info in zipf.infolist()}, zipf.namelist()
+
+
+def test_store_media(rendered):
+    """Test that images are stored and XML parts are deflated."""
+    stream = io.BytesIO()
+    report = save_presentation(rendered, stream)
+    members, names = _members(stream)
+
+    media = [name for name in names if name.startswith("ppt/media/")]
+    stored = [name for name in names if members[name].compress_type == zipfile.ZIP_STORED]
+    assert media and set(media) <= set(stored)
+    assert report["stored"] == len(stored)
+    assert not any(name.endswith(".xml") for name in stored)
+    assert members["ppt/presentation.xml"].compress_type == zipfile.ZIP_DEFLATED
+    assert names[0] == "[Content_Types].xml"
+    assert report["bytes"] < report["uncompressed_bytes"]
+
+
+def test_same_parts_as_python_pptx(rendered):
+    """Test that the package holds the same parts as `Presentation.save`."""
+    ours, reference = io.BytesIO(), io.BytesIO()
+    save_presentation(rendered, ours)
+    rendered.save(reference)
+
+    with zipfile.ZipFile(ours) as a, zipfile.ZipFile(reference) as b:
+        assert a.namelist() == b.namelist()
+        assert all(a.read(name) == b.read(name) for name in a.namelist())
+    assert len(Presentation(ours).slides) == len(rendered.slides)
+
+
+def test_compresslevel(rendered):
+    """Test that level 0 stores every part and deflating media is optional."""
+    stream = io.BytesIO()
+    report = save_presentation(rendered, stream, compresslevel=0)
+    members, _ = _members(stream)
+    assert all(info.compress_type == zipfile.ZIP_STORED for info in members.values())
+    assert report["bytes"] == report["uncompressed_bytes"]
+
+    stream = io.BytesIO()
+    assert save_presentation(rendered, stream, store_media=False)["stored"] == 0
+
+    with pytest.raises(ValueError):
+        save_presentation(rendered, io.BytesIO(), compresslevel=10)